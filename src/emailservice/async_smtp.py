@@ -0,0 +1,267 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# SMTP delivery over asyncio streams, for the grpc.aio server.
+#
+# AsyncSmtpPool is smtp_backend.SmtpPool with coroutines: the same lazily
+# opened, recycled connections, PIPELINING when the relay offers it, and
+# the same message bodies. A send waiting on the relay is a suspended
+# coroutine rather than a blocked thread, so sends in flight are bounded
+# by the pool size, not by the server's threads. Failures raise the
+# smtplib exceptions SmtpPool raises. Only the standard library is used.
+
+import asyncio
+import base64
+import smtplib
+import socket
+import ssl
+
+from logger import getJSONLogger
+from smtp_backend import check_address, data_blocks, message_data, valid_address
+logger = getJSONLogger('emailservice-smtp-async')
+
+class _Connection(object):
+
+  def __init__(self, reader, writer, timeout):
+    self.reader = reader
+    self.writer = writer
+    self.timeout = timeout
+    self.extensions = set()
+    self.pipelining = False
+    self.sent = 0
+
+  @classmethod
+  async def open(cls, pool):
+    reader, writer = await asyncio.wait_for(
+      asyncio.open_connection(pool.host, pool.port), pool.timeout)
+    connection = cls(reader, writer, pool.timeout)
+    try:
+      code, reply = await connection.reply()
+      if code != 220:
+        raise smtplib.SMTPConnectError(code, reply)
+      await connection.ehlo(pool.local_hostname)
+      if pool.starttls:
+        code, reply = await connection.command('STARTTLS')
+        if code != 220:
+          raise smtplib.SMTPNotSupportedError('STARTTLS refused: {} {}'.format(code, reply))
+        await writer.start_tls(ssl.create_default_context(), server_hostname=pool.host)
+        await connection.ehlo(pool.local_hostname)
+      if pool.username:
+        # PLAIN is what relays offer over TLS; smtplib would also try
+        # CRAM-MD5 and LOGIN.
+        secret = base64.b64encode('\0{}\0{}'.format(pool.username, pool.password).encode())
+        code, reply = await connection.command('AUTH PLAIN ' + secret.decode())
+        if code != 235:
+          raise smtplib.SMTPAuthenticationError(code, reply)
+    except BaseException:
+      connection.abort()
+      raise
+    connection.pipelining = pool.pipelining and 'pipelining' in connection.extensions
+    return connection
+
+  async def reply(self):
+    lines = []
+    while True:
+      line = await asyncio.wait_for(self.reader.readline(), self.timeout)
+      if not line:
+        raise smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+      lines.append(line[4:].strip())
+      if line[3:4] != b'-':
+        break
+    try:
+      code = int(line[:3])
+    except ValueError:
+      raise smtplib.SMTPResponseException(-1, line)
+    return code, b'\n'.join(lines)
+
+  async def command(self, line):
+    self.writer.write(line.encode() + b'\r\n')
+    return await self.reply()
+
+  async def ehlo(self, hostname):
+    code, reply = await self.command('EHLO ' + hostname)
+    if code != 250:
+      raise smtplib.SMTPHeloError(code, reply)
+    self.extensions = {line.split()[0].lower().decode()
+                       for line in reply.split(b'\n')[1:] if line.strip()}
+
+  async def send(self, sender, recipient, data):
+    # `data` is the message as bytes, or as blocks from stream_message().
+    check_address(recipient)
+    if self.pipelining:
+      self.writer.write('MAIL FROM:<{}>\r\nRCPT TO:<{}>\r\nDATA\r\n'.format(sender, recipient).encode())
+      # Every pipelined command gets a reply, even after a failure.
+      mail = await self.reply()
+      rcpt = await self.reply()
+      start = await self.reply()
+      if start[0] == 354 and (mail[0] != 250 or rcpt[0] not in (250, 251)):
+        # Close the transaction we can no longer use.
+        self.writer.write(b'.\r\n')
+        await self.reply()
+    else:
+      mail = await self.command('MAIL FROM:<{}>'.format(sender))
+      rcpt = start = None
+      if mail[0] == 250:
+        rcpt = await self.command('RCPT TO:<{}>'.format(recipient))
+        if rcpt[0] in (250, 251):
+          start = await self.command('DATA')
+    if mail[0] != 250:
+      await self.command('RSET')
+      raise smtplib.SMTPSenderRefused(mail[0], mail[1], sender)
+    if rcpt[0] not in (250, 251):
+      await self.command('RSET')
+      raise smtplib.SMTPRecipientsRefused({recipient: rcpt})
+    if start[0] != 354:
+      await self.command('RSET')
+      raise smtplib.SMTPDataError(*start)
+    await self._write_data(data)
+    self.sent += 1
+
+  async def _write_data(self, data):
+    streamed = not isinstance(data, bytes)
+    for block in data_blocks(data):
+      self.writer.write(block)
+      await self.writer.drain()
+      if streamed:
+        # Rendering the next block holds the loop; let other sends run.
+        await asyncio.sleep(0)
+    code, reply = await self.reply()
+    if code != 250:
+      await self.command('RSET')
+      raise smtplib.SMTPDataError(code, reply)
+
+  async def close(self):
+    try:
+      await self.command('QUIT')
+      self.writer.close()
+      await self.writer.wait_closed()
+    except (smtplib.SMTPException, OSError):
+      self.abort()
+
+  def abort(self):
+    self.writer.transport.abort()
+
+class AsyncSmtpPool(object):
+  """Coroutine counterpart of smtp_backend.SmtpPool, with the same
+  arguments. Use it from one event loop."""
+
+  def __init__(self, host, port, sender, size=4, username=None, password=None,
+               starttls=False, timeout=10, max_messages=100, pipelining=True):
+    self.host = host
+    self.port = port
+    self.sender = sender
+    self.size = size
+    self.username = username
+    self.password = password
+    self.starttls = starttls
+    self.timeout = timeout
+    self.max_messages = max_messages
+    self.pipelining = pipelining
+    if not valid_address(sender):
+      raise ValueError('invalid SMTP sender address {!r}'.format(sender))
+    # smtplib looks this up for every connection; it may go to DNS.
+    self.local_hostname = socket.getfqdn()
+    self.sent = 0
+    self.connects = 0
+    self._idle = []
+    # One permit per connection that may exist, idle or in use.
+    self._permits = asyncio.Semaphore(size)
+
+  async def _acquire(self):
+    await self._permits.acquire()
+    if self._idle:
+      return self._idle.pop()
+    try:
+      connection = await _Connection.open(self)
+    except BaseException:
+      self._permits.release()
+      raise
+    self.connects += 1
+    return connection
+
+  async def _release(self, connection, broken=False):
+    try:
+      if broken:
+        connection.abort()
+      elif connection.sent >= self.max_messages:
+        await connection.close()
+      else:
+        self._idle.append(connection)
+    finally:
+      self._permits.release()
+
+  async def send(self, recipient, body):
+    error = (await self.send_many([(recipient, body)]))[0]
+    if error is not None:
+      raise error
+
+  async def send_many(self, messages):
+    """Sends (recipient, body) pairs over one connection, in order, and
+    returns one error or None per message, like SmtpPool.send_many()."""
+    try:
+      connection = await self._acquire()
+    except Exception as err:
+      logger.warning('could not connect to SMTP relay {}:{}: {}'.format(self.host, self.port, err))
+      return [err] * len(messages)
+    # A connection that sat idle may have been dropped by the relay.
+    may_be_stale = connection.sent > 0
+    results = []
+    try:
+      for recipient, body in messages:
+        try:
+          check_address(recipient)
+          await connection.send(self.sender, recipient, message_data(self.sender, recipient, body))
+        except smtplib.SMTPServerDisconnected:
+          if not may_be_stale:
+            raise
+          connection.abort()
+          connection = await _Connection.open(self)
+          self.connects += 1
+          # A stream may have been partly consumed; start it over.
+          await connection.send(self.sender, recipient, message_data(self.sender, recipient, body))
+        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused,
+                smtplib.SMTPDataError) as err:
+          # The transaction was reset; the connection is still usable.
+          results.append(err)
+          continue
+        finally:
+          may_be_stale = False
+        results.append(None)
+        self.sent += 1
+    except asyncio.CancelledError:
+      # The caller gave up, possibly mid-DATA.
+      await self._release(connection, broken=True)
+      raise
+    except Exception as err:
+      # The connection is in an unknown state, possibly mid-DATA.
+      await self._release(connection, broken=True)
+      logger.warning('SMTP connection to {}:{} failed: {}'.format(self.host, self.port, err))
+      return results + [err] * (len(messages) - len(results))
+    await self._release(connection)
+    return results
+
+  async def close(self):
+    idle, self._idle = self._idle, []
+    for connection in idle:
+      await connection.close()
+
+  def stats(self):
+    return {
+      'sent': self.sent,
+      'connects': self.connects,
+      'idle_connections': len(self._idle),
+      'size': self.size,
+    }
@@ -0,0 +1,126 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Throughput and latency of email_server.py served by its 10-thread pool
+# against grpc.aio (GRPC_ASYNC=1), by client concurrency, in dummy mode
+# and sending over SMTP to a sink with a simulated round trip.
+#
+#   python bench_aio.py --concurrency 10 50 200 --rtt-ms 20 --seconds 5
+#
+# The server and the SMTP sink run as subprocesses, the server as it is
+# deployed; the load comes from asyncio clients in this process.
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+import grpc
+
+from bench_client import sample_order, summarize
+from bench_stream import free_port
+from email_client import AsyncEmailClient
+
+MODES = {'threads': '0', 'asyncio': '1'}
+
+def start_server(mode, smtp_addr, args):
+  port = free_port()
+  env = dict(os.environ, PORT=str(port), DISABLE_PROFILER='1', GRPC_ASYNC=MODES[mode],
+             SMTP_SERVER_ADDR=smtp_addr, SMTP_POOL_SIZE=str(args.smtp_pool_size))
+  server = subprocess.Popen([sys.executable, 'email_server.py'], env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+  addr = 'localhost:{}'.format(port)
+  with grpc.insecure_channel(addr) as channel:
+    grpc.channel_ready_future(channel).result(timeout=30)
+  return server, addr
+
+def stop_server(server):
+  server.send_signal(2)
+  server.wait()
+
+def load(addr, order, concurrency, seconds):
+  async def run():
+    async with AsyncEmailClient(addr, timeout=60, retries=0) as client:
+      await client.send_order_confirmation('warmup@example.com', order)
+      latencies = []
+      errors = 0
+      deadline = time.perf_counter() + seconds
+
+      async def worker(i):
+        nonlocal errors
+        while time.perf_counter() < deadline:
+          start = time.perf_counter()
+          try:
+            await client.send_order_confirmation('user{}@example.com'.format(i), order)
+          except grpc.aio.AioRpcError:
+            errors += 1
+            continue
+          latencies.append(time.perf_counter() - start)
+
+      start = time.perf_counter()
+      await asyncio.gather(*[worker(i) for i in range(concurrency)])
+      result = summarize(latencies, time.perf_counter() - start)
+      result['errors'] = errors
+      return result
+  return asyncio.run(run())
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--concurrency', type=int, nargs='+', default=[10, 50, 200])
+  parser.add_argument('--seconds', type=float, default=5)
+  parser.add_argument('--backends', nargs='+', default=['dummy', 'smtp'])
+  parser.add_argument('--rtt-ms', type=float, default=20)
+  parser.add_argument('--smtp-pool-size', type=int, default=50)
+  parser.add_argument('--items', type=int, default=3)
+  args = parser.parse_args()
+
+  sink_port = free_port()
+  sink = subprocess.Popen([sys.executable, 'smtp_sink.py', '--port', str(sink_port),
+                           '--rtt-ms', str(args.rtt_ms)],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+  order = sample_order(args.items)
+  results = []
+  try:
+    time.sleep(1)
+    for backend in args.backends:
+      smtp_addr = 'localhost:{}'.format(sink_port) if backend == 'smtp' else ''
+      for mode in MODES:
+        server, addr = start_server(mode, smtp_addr, args)
+        try:
+          for concurrency in args.concurrency:
+            result = load(addr, order, concurrency, args.seconds)
+            result.update({'backend': backend, 'mode': mode, 'concurrency': concurrency})
+            results.append(result)
+        finally:
+          stop_server(server)
+  finally:
+    sink.terminate()
+    sink.wait()
+
+  json.dump({
+    'benchmark': 'aio',
+    'cpus': os.cpu_count(),
+    'rtt_ms': args.rtt_ms,
+    'smtp_pool_size': args.smtp_pool_size,
+    'results': results,
+  }, sys.stdout, indent=2)
+  print()
+
+if __name__ == '__main__':
+  main()
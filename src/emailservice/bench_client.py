@@ -0,0 +1,171 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Compares a new channel per call against the pooled EmailClient, the
+# asyncio client and batched SendOrderConfirmations calls.
+#
+#   python bench_client.py --requests 2000 --concurrency 8 --pool-size 2
+#
+# A DummyEmailService runs in this process, so the numbers are client and
+# connection overhead over localhost rather than mail delivery.
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import statistics
+import sys
+import threading
+import time
+from concurrent import futures
+
+import grpc
+
+import demo_pb2
+import demo_pb2_grpc
+from email_client import AsyncEmailClient, EmailClient
+from email_server import DummyEmailService
+
+def sample_order(items=3):
+  return demo_pb2.OrderResult(
+    order_id='bench-order',
+    shipping_tracking_id='bench-tracking',
+    shipping_cost=demo_pb2.Money(currency_code='USD', units=8, nanos=990000000),
+    shipping_address=demo_pb2.Address(
+      street_address='1600 Amphitheatre Parkway', city='Mountain View',
+      state='CA', country='USA', zip_code=94043),
+    items=[demo_pb2.OrderItem(
+      item=demo_pb2.CartItem(product_id='OLJCESPC7Z', quantity=i + 1),
+      cost=demo_pb2.Money(currency_code='USD', units=19, nanos=990000000))
+      for i in range(items)])
+
+def start_server(workers):
+  server = grpc.server(futures.ThreadPoolExecutor(max_workers=workers))
+  demo_pb2_grpc.add_EmailServiceServicer_to_server(DummyEmailService(), server)
+  port = server.add_insecure_port('localhost:0')
+  server.start()
+  return server, 'localhost:{}'.format(port)
+
+def per_worker(total, workers):
+  # Round up so small --requests values still send at least one call each.
+  return max(1, math.ceil(total / workers))
+
+def summarize(latencies, seconds):
+  if not latencies:
+    return {'requests': 0, 'throughput_rps': 0.0, 'mean_us': 0.0, 'p50_us': 0.0, 'p99_us': 0.0}
+  latencies.sort()
+  return {
+    'requests': len(latencies),
+    'throughput_rps': len(latencies) / seconds,
+    'mean_us': statistics.mean(latencies) * 1e6,
+    'p50_us': latencies[len(latencies) // 2] * 1e6,
+    'p99_us': latencies[int(len(latencies) * 0.99)] * 1e6,
+  }
+
+def run_threads(send, requests, concurrency):
+  latencies = []
+  lock = threading.Lock()
+  per_thread = per_worker(requests, concurrency)
+
+  def worker():
+    local = []
+    for _ in range(per_thread):
+      start = time.perf_counter()
+      send()
+      local.append(time.perf_counter() - start)
+    with lock:
+      latencies.extend(local)
+
+  threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+  start = time.perf_counter()
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  return summarize(latencies, time.perf_counter() - start)
+
+def bench_per_call(addr, order, args):
+  # What the old send_confirmation_email did, except that it also never
+  # closed the channel.
+  def send():
+    with grpc.insecure_channel(addr) as channel:
+      demo_pb2_grpc.EmailServiceStub(channel).SendOrderConfirmation(
+        demo_pb2.SendOrderConfirmationRequest(email='bench@example.com', order=order))
+  return run_threads(send, args.requests, args.concurrency)
+
+def bench_pooled(addr, order, args):
+  with EmailClient(addr, pool_size=args.pool_size) as client:
+    client.send_order_confirmation('warmup@example.com', order)
+    return run_threads(lambda: client.send_order_confirmation('bench@example.com', order),
+                       args.requests, args.concurrency)
+
+def bench_batched(addr, order, args):
+  # One SendOrderConfirmations call carries --batch-size emails.
+  items = [('bench@example.com', order)] * args.batch_size
+  with EmailClient(addr, pool_size=args.pool_size) as client:
+    client.send_order_confirmations(items[:1])
+    result = run_threads(lambda: client.send_order_confirmations(items, chunk_size=args.batch_size),
+                         per_worker(args.requests, args.batch_size), args.concurrency)
+  result['emails_per_second'] = result['throughput_rps'] * args.batch_size
+  return result
+
+def bench_async(addr, order, args):
+  async def run():
+    async with AsyncEmailClient(addr, pool_size=args.pool_size) as client:
+      await client.send_order_confirmation('warmup@example.com', order)
+      latencies = []
+
+      async def worker():
+        for _ in range(per_worker(args.requests, args.concurrency)):
+          start = time.perf_counter()
+          await client.send_order_confirmation('bench@example.com', order)
+          latencies.append(time.perf_counter() - start)
+
+      start = time.perf_counter()
+      await asyncio.gather(*[worker() for _ in range(args.concurrency)])
+      return summarize(latencies, time.perf_counter() - start)
+  return asyncio.run(run())
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--requests', type=int, default=2000)
+  parser.add_argument('--concurrency', type=int, default=8)
+  parser.add_argument('--pool-size', type=int, default=2)
+  parser.add_argument('--items', type=int, default=3)
+  parser.add_argument('--batch-size', type=int, default=100)
+  parser.add_argument('--server-workers', type=int, default=10)
+  args = parser.parse_args()
+
+  logging.getLogger('emailservice-server').setLevel(logging.WARNING)
+  server, addr = start_server(args.server_workers)
+  order = sample_order(args.items)
+  results = {}
+  for name, bench in (('per_call_channel', bench_per_call), ('pooled', bench_pooled),
+                      ('async', bench_async), ('batched', bench_batched)):
+    results[name] = bench(addr, order, args)
+  server.stop(0)
+
+  json.dump({
+    'benchmark': 'email_client',
+    'concurrency': args.concurrency,
+    'pool_size': args.pool_size,
+    'results': results,
+  }, sys.stdout, indent=2)
+  print()
+
+if __name__ == '__main__':
+  main()
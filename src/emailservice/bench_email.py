@@ -0,0 +1,184 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# End-to-end throughput of the email service by order size: synthetic
+# orders go straight into SendOrderConfirmation, with no gRPC in between,
+# on the dummy backend and on the SMTP backend sending to a local sink.
+#
+#   python bench_email.py --items 1 10 100 1000 5000 --seconds 2 --concurrency 1 4
+#
+# For every size it reports renders per second of the renderer alone, and
+# per backend and concurrency sends per second, latency percentiles and
+# the peak memory allocated while handling one message (tracemalloc, in a
+# separate pass so tracing doesn't slow the timed one). The dummy backend
+# only logs, so its numbers are the handler without rendering. The sink
+# runs in a subprocess so what it receives isn't counted. The renderer is the one
+# email_server.py picks, so EMAIL_MULTIPART=1 benchmarks multipart emails.
+
+import argparse
+import json
+import logging
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+
+import demo_pb2
+import email_server
+from bench_render import per_render, random_order
+from bench_stream import free_port
+from email_server import DummyEmailService, SmtpEmailService
+from smtp_backend import SmtpPool
+
+SENDER = 'no-reply@example.com'
+
+class BenchContext(object):
+  # The parts of grpc.ServicerContext the email services use.
+
+  def __init__(self):
+    self.code = None
+
+  def set_code(self, code):
+    self.code = code
+
+  def set_details(self, details):
+    pass
+
+  def abort(self, code, details):
+    raise RuntimeError('{}: {}'.format(code, details))
+
+def send(service, email, order):
+  context = BenchContext()
+  service.SendOrderConfirmation(
+    demo_pb2.SendOrderConfirmationRequest(email=email, order=order), context)
+  return context.code is None
+
+def percentiles(latencies):
+  latencies.sort()
+  return {
+    'p50_ms': statistics.median(latencies) * 1e3,
+    'p90_ms': latencies[int(len(latencies) * 0.9)] * 1e3,
+    'p99_ms': latencies[int(len(latencies) * 0.99)] * 1e3,
+    'max_ms': latencies[-1] * 1e3,
+  }
+
+def run(service, order, concurrency, seconds):
+  latencies = []
+  errors = []
+  lock = threading.Lock()
+  deadline = time.perf_counter() + seconds
+
+  def sender(i):
+    local, failed = [], 0
+    email = 'user{}@example.com'.format(i)
+    while time.perf_counter() < deadline:
+      start = time.perf_counter()
+      if send(service, email, order):
+        local.append(time.perf_counter() - start)
+      else:
+        failed += 1
+    with lock:
+      latencies.extend(local)
+      errors.append(failed)
+
+  threads = [threading.Thread(target=sender, args=(i,)) for i in range(concurrency)]
+  start = time.perf_counter()
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  elapsed = time.perf_counter() - start
+  result = {
+    'sends': len(latencies),
+    'sends_per_second': len(latencies) / elapsed,
+    'errors': sum(errors),
+  }
+  if latencies:
+    result.update(percentiles(latencies))
+  return result
+
+def peak_bytes(service, order, repeat=5):
+  # Median over a few sends, each measured from what is allocated before it.
+  peaks = []
+  tracemalloc.start()
+  for _ in range(repeat):
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    send(service, 'memory@example.com', order)
+    peaks.append(tracemalloc.get_traced_memory()[1] - base)
+  tracemalloc.stop()
+  return statistics.median(peaks)
+
+def backends(names, sink_port, args):
+  for name in names:
+    if name == 'dummy':
+      yield name, DummyEmailService(), None
+    else:
+      pool = SmtpPool('localhost', sink_port, SENDER, size=max(args.concurrency))
+      yield name, SmtpEmailService(pool, stream_threshold=args.stream_threshold), pool
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--items', type=int, nargs='+', default=[1, 10, 100, 1000, 5000])
+  parser.add_argument('--seconds', type=float, default=2)
+  parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4])
+  parser.add_argument('--backends', nargs='+', default=['dummy', 'smtp'], choices=['dummy', 'smtp'])
+  parser.add_argument('--stream-threshold', type=int, default=1000)
+  args = parser.parse_args()
+
+  # The dummy backend logs every email; keep the output to the results.
+  logging.getLogger('emailservice-server').setLevel(logging.WARNING)
+  orders = {items: random_order(items, seed=items) for items in args.items}
+
+  renders = []
+  for items, order in orders.items():
+    seconds = per_render(lambda: email_server.renderer.render(order), args.seconds / 2)
+    renders.append({'items': items, 'renders_per_second': 1 / seconds})
+
+  sink_port = free_port()
+  sink = subprocess.Popen([sys.executable, 'smtp_sink.py', '--port', str(sink_port)],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+  results = []
+  try:
+    time.sleep(1)
+    for name, service, pool in backends(args.backends, sink_port, args):
+      for items, order in orders.items():
+        # Connections, row and money caches are warm before measuring.
+        send(service, 'warmup@example.com', order)
+        peak = peak_bytes(service, order)
+        for concurrency in args.concurrency:
+          result = {'backend': name, 'items': items, 'concurrency': concurrency,
+                    'peak_bytes_per_message': peak}
+          result.update(run(service, order, concurrency, args.seconds))
+          results.append(result)
+      if pool is not None:
+        pool.close()
+  finally:
+    sink.terminate()
+    sink.wait()
+
+  json.dump({
+    'benchmark': 'email',
+    'renderer': type(email_server.renderer).__name__,
+    'renders': renders,
+    'results': results,
+  }, sys.stdout, indent=2)
+  print()
+
+if __name__ == '__main__':
+  main()
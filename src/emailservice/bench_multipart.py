@@ -0,0 +1,109 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Size and build time of the confirmation email as it goes over SMTP:
+#
+#   html_only           today's HTML-only message
+#   multipart_naive     CSS inlined into each rendered email, and the
+#                       multipart message built with the email package
+#   multipart           MultipartRenderer's precomputed templates and
+#                       smtp_backend's precomputed MIME framing
+#
+#   python bench_multipart.py --items 1 10 100 1000
+#
+# Fails if the precomputed message doesn't parse back into the same parts.
+
+import argparse
+import email
+import email.policy
+import json
+import sys
+import time
+from email.message import EmailMessage
+
+from bench_render import per_render, random_order
+from renderer import ConfirmationRenderer, MultipartRenderer, flatten_order, inline_styles
+from smtp_backend import SUBJECT, build_message, multipart_message
+
+SENDER = 'no-reply@example.com'
+RECIPIENT = 'customer@example.com'
+
+def naive_multipart(renderer, multipart, order):
+  html = inline_styles(renderer.render(order))
+  text = multipart.text_page.render(flatten_order(order))
+  message = EmailMessage(policy=email.policy.SMTP)
+  message['From'] = SENDER
+  message['To'] = RECIPIENT
+  message['Subject'] = SUBJECT
+  message.set_content(text)
+  message.add_alternative(html, subtype='html')
+  return message.as_bytes()
+
+def precomputed_multipart(multipart, order):
+  rendered = multipart.render(order)
+  return b''.join(multipart_message(SENDER, RECIPIENT, rendered.html, rendered.text))
+
+def check(multipart, order):
+  rendered = multipart.render(order)
+  message = email.message_from_bytes(precomputed_multipart(multipart, order), policy=email.policy.SMTP)
+  text, html = [part.get_content().replace('\r\n', '\n') for part in message.iter_parts()]
+  # Each part ends with a line break after transport.
+  if text != rendered.text.rstrip('\n') + '\n' or html != rendered.html.rstrip('\n') + '\n':
+    sys.exit('multipart message does not parse back into the rendered parts')
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--items', type=int, nargs='+', default=[1, 10, 100, 1000])
+  parser.add_argument('--min-seconds', type=float, default=1.0)
+  args = parser.parse_args()
+
+  renderer = ConfirmationRenderer('templates')
+  start = time.perf_counter()
+  multipart = MultipartRenderer('templates')
+  startup = time.perf_counter() - start
+
+  results = []
+  for items in args.items:
+    order = random_order(items)
+    check(multipart, order)
+    html_only = lambda: build_message(SENDER, RECIPIENT, renderer.render(order)).as_bytes()
+    naive = lambda: naive_multipart(renderer, multipart, order)
+    precomputed = lambda: precomputed_multipart(multipart, order)
+    results.append({
+      'items': items,
+      'html_bytes': len(renderer.render(order).encode()),
+      'inlined_html_bytes': len(multipart.render(order).html.encode()),
+      'message_bytes': {
+        'html_only': len(html_only()),
+        'multipart_naive': len(naive()),
+        'multipart': len(precomputed()),
+      },
+      'build_us': {
+        'html_only': per_render(html_only, args.min_seconds) * 1e6,
+        'multipart_naive': per_render(naive, args.min_seconds) * 1e6,
+        'multipart': per_render(precomputed, args.min_seconds) * 1e6,
+      },
+    })
+
+  json.dump({
+    'benchmark': 'multipart',
+    'startup_ms': startup * 1e3,
+    'results': results,
+  }, sys.stdout, indent=2)
+  print()
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,143 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Outbox append throughput with an fsync per message against group commit,
+# plus a crash test.
+#
+#   python bench_outbox.py --messages 2000 --writers 1 8 32
+#   python bench_outbox.py --crash-test
+#
+# Run it on the kind of disk the service will use: on tmpfs fsync is free
+# and both modes look the same. The crash test SIGKILLs a writer process
+# mid-stream and checks that every append it saw acknowledged is still in
+# the outbox afterwards.
+
+import argparse
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from bench_client import sample_order
+from outbox import SYNC_MODES, Outbox
+
+def run_appends(path, sync, messages, writers):
+  outbox = Outbox(path, sync=sync)
+  order = sample_order()
+  latencies = []
+  lock = threading.Lock()
+
+  def writer():
+    local = []
+    for _ in range(messages // writers):
+      start = time.perf_counter()
+      outbox.append('bench@example.com', order)
+      local.append(time.perf_counter() - start)
+    with lock:
+      latencies.extend(local)
+
+  threads = [threading.Thread(target=writer) for _ in range(writers)]
+  start = time.perf_counter()
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  seconds = time.perf_counter() - start
+  stats = outbox.stats()
+  outbox.close()
+
+  latencies.sort()
+  return {
+    'sync': sync,
+    'writers': writers,
+    'messages': len(latencies),
+    'appends_per_second': len(latencies) / seconds,
+    'commits': stats['commits'],
+    'mean_batch': stats['mean_batch'],
+    'p50_us': statistics.median(latencies) * 1e6,
+    'p99_us': latencies[int(len(latencies) * 0.99)] * 1e6,
+  }
+
+def crash_child(path):
+  outbox = Outbox(path)
+  order = sample_order()
+  lock = threading.Lock()
+
+  def writer():
+    while True:
+      outbox_id = outbox.append('crash@example.com', order)
+      with lock:
+        sys.stdout.write('{}\n'.format(outbox_id))
+        sys.stdout.flush()
+
+  for _ in range(8):
+    threading.Thread(target=writer, daemon=True).start()
+  time.sleep(3600)
+
+def crash_test(directory, seconds):
+  path = os.path.join(directory, 'crash.db')
+  proc = subprocess.Popen([sys.executable, __file__, '--crash-child', path],
+                          stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+  time.sleep(seconds)
+  proc.send_signal(signal.SIGKILL)
+  out, _ = proc.communicate()
+  # The last line can be cut off by the kill.
+  acked = {int(line) for line in out.decode().splitlines() if line.strip().isdigit()}
+
+  start = time.perf_counter()
+  outbox = Outbox(path)
+  recovered = {outbox_id for outbox_id, _, _ in outbox.pending()}
+  reopen_seconds = time.perf_counter() - start
+  outbox.close()
+  return {
+    'acknowledged': len(acked),
+    'recovered': len(recovered),
+    'lost': len(acked - recovered),
+    'recovery_seconds': reopen_seconds,
+  }
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--messages', type=int, default=2000)
+  parser.add_argument('--writers', type=int, nargs='+', default=[1, 8, 32])
+  parser.add_argument('--dir', default=None, help='where to put the database (default: a temp dir)')
+  parser.add_argument('--crash-test', action='store_true')
+  parser.add_argument('--crash-seconds', type=float, default=2)
+  parser.add_argument('--crash-child', help=argparse.SUPPRESS)
+  args = parser.parse_args()
+  if args.crash_child:
+    return crash_child(args.crash_child)
+
+  with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+    if args.crash_test:
+      result = {'benchmark': 'outbox_crash', 'results': crash_test(directory, args.crash_seconds)}
+    else:
+      results = []
+      for writers in args.writers:
+        for sync in SYNC_MODES:
+          path = os.path.join(directory, '{}-{}.db'.format(sync, writers))
+          results.append(run_appends(path, sync, args.messages, writers))
+      result = {'benchmark': 'outbox', 'results': results}
+  json.dump(result, sys.stdout, indent=2)
+  print()
+
+if __name__ == '__main__':
+  main()
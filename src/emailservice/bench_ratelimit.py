@@ -0,0 +1,122 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Queueing delay per recipient domain under a burst that is mostly one
+# big provider, with per-domain rate limits enforced two ways:
+#
+#   fifo_blocking  one FIFO; a worker that dequeues a throttled domain
+#                  sleeps until its bucket has a token
+#   scheduler      rate_limit.DomainScheduler, round robin over domains
+#                  that have tokens
+#
+#   python bench_ratelimit.py --emails 2000 --rate 100 --workers 4
+#
+# Delivery itself is a short sleep, so the numbers are about scheduling.
+
+import argparse
+import collections
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+
+from bench_client import sample_order
+from rate_limit import DomainScheduler, TokenBucket, recipient_domain
+from send_queue import SendQueue
+
+DOMAINS = [('gmail.com', 0.7), ('yahoo.com', 0.2)] + \
+  [('shop{}.example'.format(i), 0.01) for i in range(10)]
+
+def recipients(count, seed):
+  rng = random.Random(seed)
+  names, weights = zip(*DOMAINS)
+  return ['user{}@{}'.format(i, rng.choices(names, weights)[0]) for i in range(count)]
+
+def blocking_limiter(rate, burst):
+  buckets = collections.defaultdict(lambda: TokenBucket(rate, burst))
+  lock = threading.Lock()
+
+  def wait(email):
+    bucket = buckets[recipient_domain(email)]
+    while True:
+      with lock:
+        delay = bucket.wait_time(time.monotonic())
+        if delay == 0:
+          bucket.take()
+          return
+      time.sleep(delay)
+  return wait
+
+def run(name, emails, args):
+  order = sample_order()
+  delays = collections.defaultdict(list)
+  done = threading.Event()
+  submitted = {}
+  lock = threading.Lock()
+  limiter = blocking_limiter(args.rate, args.burst) if name == 'fifo_blocking' else None
+
+  def deliver(email, order):
+    if limiter is not None:
+      limiter(email)
+    time.sleep(args.send_ms / 1000.0)
+    with lock:
+      delays[recipient_domain(email)].append(time.monotonic() - submitted[email])
+      if sum(len(d) for d in delays.values()) == len(emails):
+        done.set()
+
+  scheduler = None
+  if name == 'scheduler':
+    scheduler = DomainScheduler(len(emails), args.rate, burst=args.burst)
+  send_queue = SendQueue(deliver, workers=args.workers, max_depth=len(emails), scheduler=scheduler)
+  send_queue.start()
+  start = time.monotonic()
+  for email in emails:
+    submitted[email] = time.monotonic()
+    send_queue.submit(email, order)
+  done.wait()
+  seconds = time.monotonic() - start
+  send_queue.stop()
+
+  small = [d for domain, ds in delays.items() if domain.endswith('.example') for d in ds]
+  return {
+    'mode': name,
+    'seconds': seconds,
+    'gmail.com_p50_ms': statistics.median(delays['gmail.com']) * 1000,
+    'yahoo.com_p50_ms': statistics.median(delays['yahoo.com']) * 1000,
+    'small_domains_p50_ms': statistics.median(small) * 1000,
+    'small_domains_max_ms': max(small) * 1000,
+  }
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--emails', type=int, default=2000)
+  parser.add_argument('--rate', type=float, default=100, help='emails per second per domain')
+  parser.add_argument('--burst', type=float, default=10)
+  parser.add_argument('--workers', type=int, default=4)
+  parser.add_argument('--send-ms', type=float, default=1)
+  parser.add_argument('--seed', type=int, default=1)
+  args = parser.parse_args()
+
+  emails = recipients(args.emails, args.seed)
+  results = [run(name, emails, args) for name in ('fifo_blocking', 'scheduler')]
+  json.dump({'benchmark': 'ratelimit', 'rate': args.rate, 'workers': args.workers,
+             'results': results}, sys.stdout, indent=2)
+  print()
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,110 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Render time of the confirmation email against the number of order items,
+# for confirmation.html on the protobuf and the flattened fast path.
+#
+#   python bench_render.py --items 1 10 100 1000
+#
+# Both paths must produce the same HTML; the run fails if they differ. Also
+# reports how long loading the template takes with and without a bytecode
+# cache.
+
+import argparse
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import demo_pb2
+from renderer import (FAST_TEMPLATE, REFERENCE_TEMPLATE, ConfirmationRenderer,
+                      format_money, new_environment)
+
+PRODUCT_IDS = ['OLJCESPC7Z', '66VCHSJNUP', '1YMWWN1N4O', 'L9ECAV7KIM', '2ZYFJ3GM2N',
+               '0PUK6V6EV0', 'LS4PSXUNUM', '9SIQT8TOJO', '6E92ZMYYFZ']
+
+def random_order(items, seed=0):
+  rng = random.Random(seed)
+  return demo_pb2.OrderResult(
+    order_id='a3f1c0de-{:04d}'.format(items),
+    shipping_tracking_id='TR-{}'.format(rng.randrange(10**9)),
+    shipping_cost=demo_pb2.Money(currency_code='USD', units=8, nanos=990000000),
+    shipping_address=demo_pb2.Address(
+      street_address='1600 Amphitheatre Parkway', city='Mountain View',
+      state='CA', country='USA', zip_code=94043),
+    items=[demo_pb2.OrderItem(
+      item=demo_pb2.CartItem(product_id=rng.choice(PRODUCT_IDS), quantity=rng.randint(1, 5)),
+      cost=demo_pb2.Money(currency_code='USD', units=rng.randint(1, 200),
+                          nanos=rng.choice([0, 490000000, 990000000])))
+      for _ in range(items)])
+
+def per_render(fn, min_seconds):
+  fn()
+  runs, start = 0, time.perf_counter()
+  while True:
+    fn()
+    runs += 1
+    elapsed = time.perf_counter() - start
+    if elapsed >= min_seconds:
+      return elapsed / runs
+
+def load_seconds(cache_dir):
+  start = time.perf_counter()
+  new_environment('templates', cache_dir).get_template(FAST_TEMPLATE)
+  return time.perf_counter() - start
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--items', type=int, nargs='+', default=[1, 10, 100, 1000])
+  parser.add_argument('--min-seconds', type=float, default=1.0)
+  args = parser.parse_args()
+
+  reference = new_environment('templates').get_template(REFERENCE_TEMPLATE)
+  fast = ConfirmationRenderer('templates')
+  results = []
+  for items in args.items:
+    order = random_order(items)
+    if reference.render(order=order) != fast.render(order):
+      sys.exit('fast path output differs from {} at {} items'.format(REFERENCE_TEMPLATE, items))
+    reference_s = per_render(lambda: reference.render(order=order), args.min_seconds)
+    fast_s = per_render(lambda: fast.render(order), args.min_seconds)
+    results.append({
+      'items': items,
+      'reference_us': reference_s * 1e6,
+      'fast_us': fast_s * 1e6,
+      'speedup': reference_s / fast_s,
+    })
+
+  cache_dir = tempfile.mkdtemp()
+  try:
+    cold = load_seconds(None)
+    load_seconds(cache_dir)  # fills the cache
+    cached = load_seconds(cache_dir)
+  finally:
+    shutil.rmtree(cache_dir)
+
+  json.dump({
+    'benchmark': 'render',
+    'results': results,
+    'money_cache': format_money.cache_info()._asdict(),
+    'template_load_ms': {'compile': cold * 1e3, 'bytecode_cache': cached * 1e3},
+  }, sys.stdout, indent=2)
+  print()
+
+if __name__ == '__main__':
+  main()
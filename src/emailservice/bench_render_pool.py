@@ -0,0 +1,129 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Throughput and small-order latency of an email server that renders a mix
+# of small and large orders, with every render on the handler threads
+# against large orders handed to a ProcessPoolRenderer.
+#
+#   python bench_render_pool.py --seconds 10 --large-share 0.05 --processes 2
+#
+# The gain comes from rendering on other cores; on a single core the
+# workers only time-slice with the server.
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from concurrent import futures
+
+import grpc
+
+import demo_pb2
+import demo_pb2_grpc
+from bench_render import random_order
+from email_client import EmailClient
+from email_server import BaseEmailService
+from renderer import ConfirmationRenderer, ProcessPoolRenderer
+
+class RenderingEmailService(BaseEmailService):
+  def __init__(self, renderer):
+    self.renderer = renderer
+
+  def deliverConfirmation(self, request, context):
+    self.renderer.render(request.order)
+    return demo_pb2.Empty()
+
+def start_server(renderer, workers):
+  server = grpc.server(futures.ThreadPoolExecutor(max_workers=workers))
+  demo_pb2_grpc.add_EmailServiceServicer_to_server(RenderingEmailService(renderer), server)
+  port = server.add_insecure_port('localhost:0')
+  server.start()
+  return server, 'localhost:{}'.format(port)
+
+def run(renderer, args):
+  server, addr = start_server(renderer, args.server_workers)
+  small, large = random_order(args.small_items, 1), random_order(args.large_items, 2)
+  latencies = {'small': [], 'large': []}
+  lock = threading.Lock()
+  deadline = time.perf_counter() + args.seconds
+
+  def client(seed):
+    rng = random.Random(seed)
+    local = {'small': [], 'large': []}
+    with EmailClient(addr, timeout=60) as email_client:
+      while time.perf_counter() < deadline:
+        kind = 'large' if rng.random() < args.large_share else 'small'
+        start = time.perf_counter()
+        email_client.send_order_confirmation('bench@example.com', large if kind == 'large' else small)
+        local[kind].append(time.perf_counter() - start)
+    with lock:
+      for kind in local:
+        latencies[kind].extend(local[kind])
+
+  threads = [threading.Thread(target=client, args=(i,)) for i in range(args.concurrency)]
+  start = time.perf_counter()
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  seconds = time.perf_counter() - start
+  server.stop(0)
+
+  result = {'orders_per_second': sum(len(l) for l in latencies.values()) / seconds}
+  for kind, values in latencies.items():
+    values.sort()
+    if values:
+      result[kind] = {
+        'orders': len(values),
+        'p50_ms': statistics.median(values) * 1e3,
+        'p99_ms': values[int(len(values) * 0.99)] * 1e3,
+      }
+  return result
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--seconds', type=float, default=10)
+  parser.add_argument('--concurrency', type=int, default=8)
+  parser.add_argument('--server-workers', type=int, default=10)
+  parser.add_argument('--small-items', type=int, default=3)
+  parser.add_argument('--large-items', type=int, default=5000)
+  parser.add_argument('--large-share', type=float, default=0.05)
+  parser.add_argument('--processes', type=int, default=2)
+  parser.add_argument('--threshold', type=int, default=200)
+  args = parser.parse_args()
+
+  local = ConfirmationRenderer('templates')
+  results = {'threads': run(local, args)}
+  pooled = ProcessPoolRenderer(local, processes=args.processes, threshold=args.threshold)
+  results['processes'] = run(pooled, args)
+  results['processes']['renderer'] = pooled.stats()
+  pooled.close()
+
+  json.dump({
+    'benchmark': 'render_pool',
+    'cpus': os.cpu_count(),
+    'large_items': args.large_items,
+    'large_share': args.large_share,
+    'results': results,
+  }, sys.stdout, indent=2)
+  print()
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,108 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# SMTP delivery throughput: a new smtplib connection per message against
+# the pooled backend, with and without pipelining and batching.
+#
+#   python bench_smtp.py --messages 500 --senders 8 --rtt-ms 5
+#
+# Runs against the in-process smtp_sink; --rtt-ms delays every reply to
+# stand in for the network distance to a real relay, which is where the
+# per-connection handshake and the per-command round trips cost the most.
+
+import argparse
+import json
+import smtplib
+import sys
+import threading
+import time
+
+from smtp_backend import SmtpPool, build_message
+from smtp_sink import SmtpSink
+
+SENDER = 'no-reply@example.com'
+HTML = '<html><body>' + '<p>Thanks for your order.</p>' * 50 + '</body></html>'
+
+def per_message(sink):
+  def send(recipients):
+    for recipient in recipients:
+      with smtplib.SMTP(sink.host, sink.port) as smtp:
+        smtp.send_message(build_message(SENDER, recipient, HTML))
+  return send
+
+def pooled(pool, batch_size):
+  def send(recipients):
+    for i in range(0, len(recipients), batch_size):
+      errors = pool.send_many([(recipient, HTML) for recipient in recipients[i:i + batch_size]])
+      if any(errors):
+        raise next(err for err in errors if err is not None)
+  return send
+
+def run(name, send, messages, senders, sink):
+  received = sink.received
+  connections = sink.connections
+  per_sender = messages // senders
+  threads = [threading.Thread(
+    target=send, args=(['user{}-{}@example.com'.format(s, i) for i in range(per_sender)],))
+    for s in range(senders)]
+  start = time.perf_counter()
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  seconds = time.perf_counter() - start
+  return {
+    'client': name,
+    'messages': sink.received - received,
+    'connections': sink.connections - connections,
+    'seconds': seconds,
+    'messages_per_second': (sink.received - received) / seconds,
+  }
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--messages', type=int, default=500)
+  parser.add_argument('--senders', type=int, default=8)
+  parser.add_argument('--pool-size', type=int, default=8)
+  parser.add_argument('--batch-size', type=int, default=10)
+  parser.add_argument('--rtt-ms', type=float, default=5)
+  args = parser.parse_args()
+
+  sink = SmtpSink(rtt=args.rtt_ms / 1000.0).start()
+  results = [run('per_message', per_message(sink), args.messages, args.senders, sink)]
+  for name, pipelining, batch_size in (('pooled', False, 1),
+                                       ('pooled_pipelined', True, 1),
+                                       ('pooled_pipelined_batched', True, args.batch_size)):
+    # A fresh pool per mode, so each one opens its own connections and
+    # 'connections' counts them.
+    pool = SmtpPool(sink.host, sink.port, SENDER, size=args.pool_size,
+                    max_messages=args.messages, pipelining=pipelining)
+    results.append(run(name, pooled(pool, batch_size), args.messages, args.senders, sink))
+    pool.close()
+  sink.stop()
+
+  json.dump({
+    'benchmark': 'smtp',
+    'rtt_ms': args.rtt_ms,
+    'senders': args.senders,
+    'pool_size': args.pool_size,
+    'batch_size': args.batch_size,
+    'results': results,
+  }, sys.stdout, indent=2)
+  print()
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,87 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures time from process start to the first SERVING health check.
+#
+#   python bench_startup.py --runs 5 --env DISABLE_PROFILER=1
+#   python bench_startup.py --env ENABLE_TRACING=1
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import grpc
+from grpc_health.v1 import health_pb2
+from grpc_health.v1 import health_pb2_grpc
+
+
+def free_port():
+  with socket.socket() as s:
+    s.bind(('localhost', 0))
+    return s.getsockname()[1]
+
+def time_to_serving(env, timeout):
+  port = free_port()
+  env = dict(env, PORT=str(port))
+  start = time.perf_counter()
+  proc = subprocess.Popen([sys.executable, 'email_server.py'], env=env,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+  try:
+    while time.perf_counter() - start < timeout:
+      # A fresh channel per attempt avoids waiting out gRPC's reconnect
+      # backoff while the server is still starting.
+      with grpc.insecure_channel('localhost:{}'.format(port)) as channel:
+        try:
+          status = health_pb2_grpc.HealthStub(channel).Check(
+            health_pb2.HealthCheckRequest(), timeout=1).status
+        except grpc.RpcError:
+          status = None
+      if status == health_pb2.HealthCheckResponse.SERVING:
+        return time.perf_counter() - start
+      time.sleep(0.005)
+    raise RuntimeError('server did not become SERVING within {}s'.format(timeout))
+  finally:
+    proc.terminate()
+    proc.wait()
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--runs', type=int, default=5)
+  parser.add_argument('--timeout', type=float, default=60)
+  parser.add_argument('--env', action='append', default=[],
+                      help='KEY=VALUE passed to the server; may be repeated')
+  args = parser.parse_args()
+
+  env = dict(os.environ)
+  env.update(kv.split('=', 1) for kv in args.env)
+  serving = [time_to_serving(env, args.timeout) for _ in range(args.runs)]
+
+  json.dump({
+    'benchmark': 'startup',
+    'service': 'emailservice',
+    'env': args.env,
+    'runs': args.runs,
+    'serving_seconds': {'median': statistics.median(serving), 'max': max(serving)},
+  }, sys.stdout, indent=2)
+  print()
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,117 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Peak memory of sending one confirmation email over SMTP, rendered whole
+# against streamed from template.generate into DATA, by order size.
+#
+#   python bench_stream.py --items 1000 10000 50000
+#
+# Peaks are Python allocations from tracemalloc while sending, beyond the
+# order itself. The SMTP sink runs in a subprocess so what it receives
+# isn't counted. First checks that a streamed email decodes to exactly the
+# rendered HTML, with and without pipelining.
+
+import argparse
+import email
+import email.policy
+import json
+import socket
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from bench_render import random_order
+from renderer import ConfirmationRenderer
+from smtp_backend import SmtpPool
+from smtp_sink import SmtpSink
+
+SENDER = 'no-reply@example.com'
+
+def check_streamed_output(renderer):
+  order = random_order(300)
+  sink = SmtpSink(keep=2).start()
+  try:
+    for pipelining in (True, False):
+      pool = SmtpPool(sink.host, sink.port, SENDER, size=1, pipelining=pipelining)
+      pool.send('check@example.com', lambda: renderer.generate(order))
+      pool.close()
+  finally:
+    sink.stop()
+  for _, _, data in sink.messages:
+    message = email.message_from_bytes(data, policy=email.policy.SMTP)
+    # Line endings are CRLF after transport, and the body ends with a line
+    # break, as with build_message().
+    if message.get_content().replace('\r\n', '\n') != renderer.render(order) + '\n':
+      sys.exit('streamed email differs from the rendered one')
+
+def free_port():
+  with socket.socket() as s:
+    s.bind(('localhost', 0))
+    return s.getsockname()[1]
+
+def measure(send):
+  tracemalloc.start()
+  tracemalloc.reset_peak()
+  base = tracemalloc.get_traced_memory()[0]
+  start = time.perf_counter()
+  send()
+  seconds = time.perf_counter() - start
+  peak = tracemalloc.get_traced_memory()[1] - base
+  tracemalloc.stop()
+  return peak, seconds
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--items', type=int, nargs='+', default=[1000, 10000, 50000])
+  args = parser.parse_args()
+
+  renderer = ConfirmationRenderer('templates')
+  check_streamed_output(renderer)
+
+  port = free_port()
+  sink = subprocess.Popen([sys.executable, 'smtp_sink.py', '--port', str(port)],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+  try:
+    time.sleep(1)
+    pool = SmtpPool('localhost', port, SENDER, size=1)
+    results = []
+    for items in args.items:
+      order = random_order(items)
+      # Warm the row cache and the connection outside the measurement.
+      pool.send('warmup@example.com', renderer.render(order))
+      whole_peak, whole_s = measure(
+        lambda: pool.send('bench@example.com', renderer.render(order)))
+      stream_peak, stream_s = measure(
+        lambda: pool.send('bench@example.com', lambda: renderer.generate(order)))
+      results.append({
+        'items': items,
+        'html_bytes': len(renderer.render(order)),
+        'whole_peak_bytes': whole_peak,
+        'streamed_peak_bytes': stream_peak,
+        'whole_ms': whole_s * 1e3,
+        'streamed_ms': stream_s * 1e3,
+      })
+    pool.close()
+  finally:
+    sink.terminate()
+    sink.wait()
+
+  json.dump({'benchmark': 'stream', 'results': results}, sys.stdout, indent=2)
+  print()
+
+if __name__ == '__main__':
+  main()
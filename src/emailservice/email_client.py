@@ -14,6 +14,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import itertools
+import random
+import threading
+import time
+
 import grpc
 
 import demo_pb2
@@ -22,14 +28,128 @@ import demo_pb2_grpc
 from logger import getJSONLogger
 logger = getJSONLogger('emailservice-client')
 
+DEFAULT_ADDRESS = '[::]:8080'
+# Calls that certainly did not send an email: the send queue was full.
+RETRYABLE_CODES = (grpc.StatusCode.RESOURCE_EXHAUSTED,)
+# UNAVAILABLE can come after the server sent the email, for instance when
+# the connection drops before the response; ABORTED means another request
+# for the order is still sending. Both are only safe to retry when the
+# server's idempotency cache turns the retry into a no-op.
+IDEMPOTENT_RETRYABLE_CODES = RETRYABLE_CODES + (
+  grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.ABORTED)
+
+def _channel_options(pool_size):
+  # Channels to the same target share one connection unless each gets its
+  # own subchannel pool.
+  return [('grpc.use_local_subchannel_pool', 1)] if pool_size > 1 else []
+
+def _backoff(attempt, base):
+  return base * (2 ** attempt) * random.uniform(0.5, 1.5)
+
+class EmailClient(object):
+  """Reusable EmailService client over a small pool of long-lived channels.
+
+  Calls are spread round-robin over `pool_size` channels, carry a deadline
+  of `timeout` seconds, and are retried with jittered exponential backoff
+  on RESOURCE_EXHAUSTED. Pass idempotent=True only if the server runs with
+  IDEMPOTENCY_TTL_SECONDS and orders carry an order_id; UNAVAILABLE and
+  ABORTED are then retried too. Safe to share between threads.
+  """
+
+  def __init__(self, address=DEFAULT_ADDRESS, pool_size=1, timeout=5.0,
+               retries=3, backoff=0.1, idempotent=False):
+    self.timeout = timeout
+    self.retries = retries
+    self.backoff = backoff
+    self.retryable = IDEMPOTENT_RETRYABLE_CODES if idempotent else RETRYABLE_CODES
+    self._channels = [grpc.insecure_channel(address, options=_channel_options(pool_size))
+                      for _ in range(pool_size)]
+    self._stubs = [demo_pb2_grpc.EmailServiceStub(channel) for channel in self._channels]
+    self._next = itertools.count()
+
+  def send_order_confirmation(self, email, order, timeout=None):
+    request = demo_pb2.SendOrderConfirmationRequest(email=email, order=order)
+    return self._call('SendOrderConfirmation', request, timeout)
+
+  def send_order_confirmations(self, items, chunk_size=100, timeout=None):
+    """Sends (email, order) pairs with SendOrderConfirmations, `chunk_size`
+    per call, and returns one SendOrderConfirmationResult per pair."""
+    results = []
+    for start in range(0, len(items), chunk_size):
+      request = demo_pb2.SendOrderConfirmationsRequest(requests=[
+        demo_pb2.SendOrderConfirmationRequest(email=email, order=order)
+        for email, order in items[start:start + chunk_size]])
+      results.extend(self._call('SendOrderConfirmations', request, timeout).results)
+    return results
+
+  def _call(self, method, request, timeout):
+    for attempt in itertools.count():
+      stub = self._stubs[next(self._next) % len(self._stubs)]
+      try:
+        return getattr(stub, method)(request, timeout=timeout or self.timeout)
+      except grpc.RpcError as err:
+        if attempt >= self.retries or err.code() not in self.retryable:
+          raise
+        time.sleep(_backoff(attempt, self.backoff))
+
+  def close(self):
+    for channel in self._channels:
+      channel.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc):
+    self.close()
+
+class AsyncEmailClient(object):
+  """asyncio variant of EmailClient built on grpc.aio."""
+
+  def __init__(self, address=DEFAULT_ADDRESS, pool_size=1, timeout=5.0,
+               retries=3, backoff=0.1, idempotent=False):
+    self.timeout = timeout
+    self.retries = retries
+    self.backoff = backoff
+    self.retryable = IDEMPOTENT_RETRYABLE_CODES if idempotent else RETRYABLE_CODES
+    self._channels = [grpc.aio.insecure_channel(address, options=_channel_options(pool_size))
+                      for _ in range(pool_size)]
+    self._stubs = [demo_pb2_grpc.EmailServiceStub(channel) for channel in self._channels]
+    self._next = itertools.count()
+
+  async def send_order_confirmation(self, email, order, timeout=None):
+    request = demo_pb2.SendOrderConfirmationRequest(email=email, order=order)
+    for attempt in itertools.count():
+      stub = self._stubs[next(self._next) % len(self._stubs)]
+      try:
+        return await stub.SendOrderConfirmation(request, timeout=timeout or self.timeout)
+      except grpc.aio.AioRpcError as err:
+        if attempt >= self.retries or err.code() not in self.retryable:
+          raise
+        await asyncio.sleep(_backoff(attempt, self.backoff))
+
+  async def close(self):
+    for channel in self._channels:
+      await channel.close()
+
+  async def __aenter__(self):
+    return self
+
+  async def __aexit__(self, *exc):
+    await self.close()
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+def default_client():
+  global _default_client
+  with _default_client_lock:
+    if _default_client is None:
+      _default_client = EmailClient()
+    return _default_client
+
 def send_confirmation_email(email, order):
-  channel = grpc.insecure_channel('[::]:8080')
-  stub = demo_pb2_grpc.EmailServiceStub(channel)
   try:
-    response = stub.SendOrderConfirmation(demo_pb2.SendOrderConfirmationRequest(
-      email = email,
-      order = order
-    ))
+    default_client().send_order_confirmation(email, order)
     logger.info('Request sent.')
   except grpc.RpcError as err:
     logger.error(err.details())
@@ -16,39 +16,193 @@
 
 from concurrent import futures
 import argparse
+import asyncio
 import os
+import signal
+import smtplib
 import sys
+import threading
 import time
 import grpc
 import traceback
-from jinja2 import Environment, FileSystemLoader, select_autoescape, TemplateError
+from jinja2 import TemplateError
 from google.api_core.exceptions import GoogleAPICallError
-from google.auth.exceptions import DefaultCredentialsError
 
 import demo_pb2
 import demo_pb2_grpc
 from grpc_health.v1 import health_pb2
 from grpc_health.v1 import health_pb2_grpc
 
-from opentelemetry import trace
-from opentelemetry.instrumentation.grpc import GrpcInstrumentorServer
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-
-import googlecloudprofiler
-
+from async_smtp import AsyncSmtpPool
+from debug_server import DebugServer, memory_handler, profiler_handler
+from idempotency import IdempotencyCache, IN_FLIGHT, SENT
 from logger import getJSONLogger
+from memory_tracer import MemoryTracer
+from outbox import Outbox
+from rate_limit import DomainScheduler, parse_overrides
+from renderer import ConfirmationRenderer, MultipartRenderer, ProcessPoolRenderer
+from sampling_profiler import SamplingProfiler
+from send_queue import SendQueue
+from smtp_backend import SmtpPool, parse_address, permanent_error, valid_address
 logger = getJSONLogger('emailservice-server')
 
 # Loads confirmation email template from file
-env = Environment(
-    loader=FileSystemLoader('templates'),
-    autoescape=select_autoescape(['html', 'xml'])
-)
-template = env.get_template('confirmation.html')
+if os.environ.get('EMAIL_MULTIPART') == "1":
+  # HTML with inlined CSS plus a plain-text part.
+  renderer = MultipartRenderer('templates', cache_dir=os.environ.get('TEMPLATE_CACHE_DIR'))
+else:
+  renderer = ConfirmationRenderer('templates', cache_dir=os.environ.get('TEMPLATE_CACHE_DIR'))
+
+INVALID_EMAIL = 'email must be a single valid address'
+IN_FLIGHT_DETAILS = 'a confirmation for this order is already being sent, retry later'
+
+def batchResult(code, message=''):
+  return demo_pb2.SendOrderConfirmationResult(code=code.value[0], message=message)
+
+def batchError(err):
+  if isinstance(err, TemplateError):
+    return batchResult(grpc.StatusCode.INTERNAL, 'An error occurred when preparing the confirmation mail.')
+  return batchResult(grpc.StatusCode.INTERNAL, 'An error occurred when sending the email.')
 
 class BaseEmailService(demo_pb2_grpc.EmailServiceServicer):
+  # Set to a SendQueue to acknowledge requests before the email is sent,
+  # and to an Outbox to keep queued emails across restarts.
+  send_queue = None
+  outbox = None
+  # Set to an executor to deliver the chunks of a batch request on several
+  # threads. They overlap SMTP round trips; rendering holds the GIL, so it
+  # is not spread over cores.
+  batch_executor = None
+  batch_chunk_size = 50
+  # Set to an IdempotencyCache to skip emails already sent for an order.
+  idempotency = None
+
+  def SendOrderConfirmation(self, request, context):
+    if not valid_address(request.email):
+      context.abort(grpc.StatusCode.INVALID_ARGUMENT, INVALID_EMAIL)
+    claim = self.claim(request.email, request.order)
+    if claim == SENT:
+      logger.info('skipping duplicate confirmation for order {}'.format(request.order.order_id))
+      return demo_pb2.Empty()
+    if claim == IN_FLIGHT:
+      context.abort(grpc.StatusCode.ABORTED, IN_FLIGHT_DETAILS)
+    try:
+      response = self.deliverConfirmation(request, context)
+    except Exception:
+      # Including context.abort(); let a retry send it.
+      self.releaseClaim(request.email, request.order)
+      raise
+    self.confirmClaim(request.email, request.order)
+    return response
+
+  def claim(self, email, order):
+    if self.idempotency is None:
+      return None
+    return self.idempotency.claim(order.order_id, email)
+
+  def confirmClaim(self, email, order):
+    # A no-op if delivery failed and released the claim.
+    if self.idempotency is not None:
+      self.idempotency.confirm(order.order_id, email)
+
+  def releaseClaim(self, email, order):
+    if self.idempotency is not None:
+      self.idempotency.release(order.order_id, email)
+
+  def deliver_batch(self, items):
+    # Services that can send several emails at once override this.
+    errors = []
+    for email, order in items:
+      try:
+        self.deliver(email, order)
+        errors.append(None)
+      except Exception as err:
+        errors.append(err)
+    return errors
+
+  def SendOrderConfirmations(self, request, context):
+    requests = request.requests
+    results, valid = self.claimBatch(requests)
+    if self.send_queue is not None:
+      self.enqueueBatch(requests, valid, results)
+    else:
+      self.deliverBatch(requests, valid, results)
+    return demo_pb2.SendOrderConfirmationsResponse(results=results)
+
+  def claimBatch(self, requests):
+    # Every item gets its own result; one bad email doesn't fail the batch.
+    results = [None] * len(requests)
+    valid = []
+    for i, item in enumerate(requests):
+      if not valid_address(item.email):
+        results[i] = batchResult(grpc.StatusCode.INVALID_ARGUMENT, INVALID_EMAIL)
+        continue
+      claim = self.claim(item.email, item.order)
+      if claim == SENT:
+        results[i] = batchResult(grpc.StatusCode.OK, 'duplicate, already sent')
+      elif claim == IN_FLIGHT:
+        results[i] = batchResult(grpc.StatusCode.ABORTED, IN_FLIGHT_DETAILS)
+      else:
+        valid.append(i)
+    return results, valid
+
+  def enqueueBatch(self, requests, valid, results):
+    # Only store what the queue has room for, and store it in one outbox
+    # transaction.
+    room = self.send_queue.room()
+    accepted, rejected = valid[:room], valid[room:]
+    keys = [None] * len(accepted)
+    if self.outbox is not None and accepted:
+      keys = self.outbox.append_many([(requests[i].email, requests[i].order) for i in accepted])
+    for i, key in zip(accepted, keys):
+      if self.send_queue.submit(requests[i].email, requests[i].order, key):
+        self.confirmClaim(requests[i].email, requests[i].order)
+        results[i] = batchResult(grpc.StatusCode.OK)
+      else:
+        if key is not None:
+          self.outbox.complete(key)
+        rejected.append(i)
+    for i in rejected:
+      self.releaseClaim(requests[i].email, requests[i].order)
+      results[i] = batchResult(grpc.StatusCode.RESOURCE_EXHAUSTED, 'send queue is full, retry later')
+
+  def deliverBatch(self, requests, valid, results):
+    chunks = self.batchChunks(valid)
+    def deliverChunk(chunk):
+      return self.deliver_batch([(requests[i].email, requests[i].order) for i in chunk])
+    if self.batch_executor is not None and len(chunks) > 1:
+      chunk_errors = self.batch_executor.map(deliverChunk, chunks)
+    else:
+      chunk_errors = map(deliverChunk, chunks)
+    self.recordBatch(requests, chunks, chunk_errors, results)
+
+  def batchChunks(self, valid):
+    return [valid[start:start + self.batch_chunk_size]
+            for start in range(0, len(valid), self.batch_chunk_size)]
+
+  def recordBatch(self, requests, chunks, chunk_errors, results):
+    for chunk, errors in zip(chunks, chunk_errors):
+      for i, err in zip(chunk, errors):
+        if err is None:
+          self.confirmClaim(requests[i].email, requests[i].order)
+          results[i] = batchResult(grpc.StatusCode.OK)
+        else:
+          logger.error('could not deliver confirmation to {}: {}'.format(requests[i].email, err))
+          self.releaseClaim(requests[i].email, requests[i].order)
+          results[i] = batchError(err)
+
+  def enqueue(self, request, context):
+    if self.send_queue.full():
+      context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, 'send queue is full, retry later')
+    key = None
+    if self.outbox is not None:
+      key = self.outbox.append(request.email, request.order)
+    if not self.send_queue.submit(request.email, request.order, key):
+      if key is not None:
+        self.outbox.complete(key)
+      context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, 'send queue is full, retry later')
+    return demo_pb2.Empty()
+
   def Check(self, request, context):
     return health_pb2.HealthCheckResponse(
       status=health_pb2.HealthCheckResponse.SERVING)
@@ -82,16 +236,23 @@ class EmailService(BaseEmailService):
     )
     logger.info("Message sent: {}".format(response.rfc822_message_id))
 
-  def SendOrderConfirmation(self, request, context):
+  def deliver(self, email, order):
+    # Runs on a send queue worker; errors are logged by the queue.
+    EmailService.send_email(self.client, email, renderer.render(order))
+
+  def deliverConfirmation(self, request, context):
+    if self.send_queue is not None:
+      return self.enqueue(request, context)
     email = request.email
     order = request.order
 
     try:
-      confirmation = template.render(order = order)
+      confirmation = renderer.render(order)
     except TemplateError as err:
       context.set_details("An error occurred when preparing the confirmation mail.")
       logger.error(err.message)
       context.set_code(grpc.StatusCode.INTERNAL)
+      self.releaseClaim(request.email, request.order)
       return demo_pb2.Empty()
 
     try:
@@ -100,27 +261,245 @@ class EmailService(BaseEmailService):
       context.set_details("An error occurred when sending the email.")
       print(err.message)
       context.set_code(grpc.StatusCode.INTERNAL)
+      self.releaseClaim(request.email, request.order)
       return demo_pb2.Empty()
 
     return demo_pb2.Empty()
 
 class DummyEmailService(BaseEmailService):
-  def SendOrderConfirmation(self, request, context):
-    logger.info('A request to send order confirmation email to {} has been received.'.format(request.email))
+  def deliver(self, email, order):
+    logger.info('A request to send order confirmation email to {} has been received.'.format(email))
+
+  def deliverConfirmation(self, request, context):
+    if self.send_queue is not None:
+      return self.enqueue(request, context)
+    self.deliver(request.email, request.order)
+    return demo_pb2.Empty()
+
+class SmtpEmailService(BaseEmailService):
+  def __init__(self, pool, stream_threshold=1000):
+    super().__init__()
+    self.pool = pool
+    self.stream_threshold = stream_threshold
+
+  def body(self, order):
+    # Stream very large orders into DATA instead of rendering them whole.
+    if len(order.items) > self.stream_threshold:
+      return lambda: renderer.generate(order)
+    return renderer.render(order)
+
+  def deliver(self, email, order):
+    self.pool.send(email, self.body(order))
+
+  def deliver_batch(self, items):
+    # One pooled connection carries the whole batch.
+    errors = [None] * len(items)
+    messages, positions = [], []
+    for i, (email, order) in enumerate(items):
+      try:
+        messages.append((email, self.body(order)))
+        positions.append(i)
+      except TemplateError as err:
+        errors[i] = err
+    for i, err in zip(positions, self.pool.send_many(messages)):
+      errors[i] = err
+    return errors
+
+  def deliverConfirmation(self, request, context):
+    if self.send_queue is not None:
+      return self.enqueue(request, context)
+    try:
+      self.pool.send(request.email, self.body(request.order))
+    except TemplateError as err:
+      context.set_details("An error occurred when preparing the confirmation mail.")
+      logger.error(err.message)
+      context.set_code(grpc.StatusCode.INTERNAL)
+      self.releaseClaim(request.email, request.order)
+      return demo_pb2.Empty()
+    except (smtplib.SMTPException, OSError) as err:
+      context.set_details("An error occurred when sending the email.")
+      logger.error(str(err))
+      context.set_code(grpc.StatusCode.INTERNAL)
+      self.releaseClaim(request.email, request.order)
+      return demo_pb2.Empty()
+
+    return demo_pb2.Empty()
+
+class AsyncEmailService(BaseEmailService):
+  # Handlers for the grpc.aio server (GRPC_ASYNC=1). A request waiting on
+  # delivery is a suspended coroutine, not one of a fixed number of threads.
+
+  # The server's event loop; send queue workers deliver on it.
+  loop = None
+
+  async def SendOrderConfirmation(self, request, context):
+    if not valid_address(request.email):
+      await context.abort(grpc.StatusCode.INVALID_ARGUMENT, INVALID_EMAIL)
+    claim = self.claim(request.email, request.order)
+    if claim == SENT:
+      logger.info('skipping duplicate confirmation for order {}'.format(request.order.order_id))
+      return demo_pb2.Empty()
+    if claim == IN_FLIGHT:
+      await context.abort(grpc.StatusCode.ABORTED, IN_FLIGHT_DETAILS)
+    try:
+      response = await self.deliverConfirmation(request, context)
+    except (Exception, asyncio.CancelledError):
+      # Including context.abort() and a caller that gave up.
+      self.releaseClaim(request.email, request.order)
+      raise
+    self.confirmClaim(request.email, request.order)
+    return response
+
+  async def deliverConfirmation(self, request, context):
+    if self.send_queue is not None:
+      return await self.enqueue(request, context)
+    try:
+      await self.deliver_async(request.email, request.order)
+    except TemplateError as err:
+      context.set_details("An error occurred when preparing the confirmation mail.")
+      logger.error(err.message)
+      context.set_code(grpc.StatusCode.INTERNAL)
+      self.releaseClaim(request.email, request.order)
+      return demo_pb2.Empty()
+    except (smtplib.SMTPException, OSError) as err:
+      context.set_details("An error occurred when sending the email.")
+      logger.error(str(err))
+      context.set_code(grpc.StatusCode.INTERNAL)
+      self.releaseClaim(request.email, request.order)
+      return demo_pb2.Empty()
+
+    return demo_pb2.Empty()
+
+  async def enqueue(self, request, context):
+    if self.send_queue.full():
+      await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, 'send queue is full, retry later')
+    key = None
+    if self.outbox is not None:
+      # The outbox waits for its commit; don't hold the loop meanwhile.
+      key = await asyncio.to_thread(self.outbox.append, request.email, request.order)
+    if not self.send_queue.submit(request.email, request.order, key):
+      if key is not None:
+        self.outbox.complete(key)
+      await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, 'send queue is full, retry later')
     return demo_pb2.Empty()
 
+  async def SendOrderConfirmations(self, request, context):
+    requests = request.requests
+    results, valid = self.claimBatch(requests)
+    if self.send_queue is not None:
+      await asyncio.to_thread(self.enqueueBatch, requests, valid, results)
+    else:
+      # Chunks are delivered concurrently on the loop; no batch_executor.
+      chunks = self.batchChunks(valid)
+      chunk_errors = await asyncio.gather(*[
+        self.deliver_batch_async([(requests[i].email, requests[i].order) for i in chunk])
+        for chunk in chunks])
+      self.recordBatch(requests, chunks, chunk_errors, results)
+    return demo_pb2.SendOrderConfirmationsResponse(results=results)
+
+  async def deliver_batch_async(self, items):
+    errors = []
+    for email, order in items:
+      try:
+        await self.deliver_async(email, order)
+        errors.append(None)
+      except Exception as err:
+        errors.append(err)
+    return errors
+
+  def deliver(self, email, order):
+    # Send queue workers are threads; delivery itself runs on the loop.
+    asyncio.run_coroutine_threadsafe(self.deliver_async(email, order), self.loop).result()
+
+  def deliver_batch(self, items):
+    return asyncio.run_coroutine_threadsafe(self.deliver_batch_async(items), self.loop).result()
+
+  async def Check(self, request, context):
+    return health_pb2.HealthCheckResponse(
+      status=health_pb2.HealthCheckResponse.SERVING)
+
+  async def Watch(self, request, context):
+    return health_pb2.HealthCheckResponse(
+      status=health_pb2.HealthCheckResponse.UNIMPLEMENTED)
+
+class AsyncDummyEmailService(AsyncEmailService):
+  def deliver(self, email, order):
+    logger.info('A request to send order confirmation email to {} has been received.'.format(email))
+
+  async def deliver_async(self, email, order):
+    self.deliver(email, order)
+
+class AsyncSmtpEmailService(AsyncEmailService):
+  def __init__(self, pool, stream_threshold=1000, offload_threshold=200):
+    super().__init__()
+    self.pool = pool
+    self.stream_threshold = stream_threshold
+    self.offload_threshold = offload_threshold
+
+  async def body(self, order):
+    # Rendering holds the loop, so only small orders render on it.
+    items = len(order.items)
+    if items > self.stream_threshold and not isinstance(renderer, ProcessPoolRenderer):
+      # Rows are rendered block by block as they are written.
+      return lambda: renderer.generate(order)
+    if items > self.offload_threshold:
+      # On a thread, which is also where a ProcessPoolRenderer waits.
+      return await asyncio.to_thread(renderer.render, order)
+    return renderer.render(order)
+
+  async def deliver_async(self, email, order):
+    await self.pool.send(email, await self.body(order))
+
+  async def deliver_batch_async(self, items):
+    # One pooled connection carries the whole batch.
+    errors = [None] * len(items)
+    messages, positions = [], []
+    for i, (email, order) in enumerate(items):
+      try:
+        messages.append((email, await self.body(order)))
+        positions.append(i)
+      except TemplateError as err:
+        errors[i] = err
+    for i, err in zip(positions, await self.pool.send_many(messages)):
+      errors[i] = err
+    return errors
+
+def newSmtpPool(pool_class=SmtpPool):
+  host, port = parse_address(os.environ['SMTP_SERVER_ADDR'])
+  return pool_class(
+    host, port,
+    sender=os.environ.get('SMTP_SENDER', 'no-reply@example.com'),
+    size=int(os.environ.get('SMTP_POOL_SIZE', '4')),
+    username=os.environ.get('SMTP_USERNAME'),
+    password=os.environ.get('SMTP_PASSWORD'),
+    starttls=os.environ.get('SMTP_STARTTLS') == "1")
+
 class HealthCheck():
   def Check(self, request, context):
     return health_pb2.HealthCheckResponse(
       status=health_pb2.HealthCheckResponse.SERVING)
 
-def start(dummy_mode):
+def start(dummy_mode, debug=None):
+  # One event loop serves every request, and sends await the relay
+  # instead of each holding one of the server's threads.
+  if os.environ.get('GRPC_ASYNC') == "1":
+    try:
+      asyncio.run(startAsync(dummy_mode, debug))
+    except KeyboardInterrupt:
+      pass
+    return
+
   server = grpc.server(futures.ThreadPoolExecutor(max_workers=10),)
   service = None
+  startRenderPool(debug)
   if dummy_mode:
     service = DummyEmailService()
   else:
-    raise Exception('non-dummy mode not implemented yet')
+    service = SmtpEmailService(
+      newSmtpPool(), stream_threshold=int(os.environ.get('SMTP_STREAM_THRESHOLD', '1000')))
+    if debug is not None:
+      debug.route('/debug/smtp', lambda params: service.pool.stats())
+  configureService(service, debug)
 
   demo_pb2_grpc.add_EmailServiceServicer_to_server(service, server)
   health_pb2_grpc.add_HealthServicer_to_server(service, server)
@@ -129,13 +508,158 @@ def start(dummy_mode):
   logger.info("listening on port: "+port)
   server.add_insecure_port('[::]:'+port)
   server.start()
+  # Kubernetes stops pods with SIGTERM; drain the same way as on Ctrl-C.
+  stopping = threading.Event()
+  signal.signal(signal.SIGTERM, lambda signum, frame: stopping.set())
   try:
-    while True:
-      time.sleep(3600)
+    stopping.wait()
   except KeyboardInterrupt:
-    server.stop(0)
+    pass
+  logger.info('shutting down')
+  server.stop(shutdownGrace()).wait()
+  stopService(service)
+  if isinstance(service, SmtpEmailService):
+    service.pool.close()
+
+async def startAsync(dummy_mode, debug=None):
+  # Without a thread pool nothing else bounds concurrent requests.
+  server = grpc.aio.server(
+    maximum_concurrent_rpcs=int(os.environ.get('GRPC_MAX_CONCURRENT_RPCS', '0')) or None)
+  startRenderPool(debug)
+  if dummy_mode:
+    service = AsyncDummyEmailService()
+  else:
+    service = AsyncSmtpEmailService(
+      newSmtpPool(AsyncSmtpPool),
+      stream_threshold=int(os.environ.get('SMTP_STREAM_THRESHOLD', '1000')),
+      offload_threshold=int(os.environ.get('RENDER_PROCESS_THRESHOLD', '200')))
+    if debug is not None:
+      debug.route('/debug/smtp', lambda params: service.pool.stats())
+  service.loop = asyncio.get_running_loop()
+  configureService(service, debug)
+
+  demo_pb2_grpc.add_EmailServiceServicer_to_server(service, server)
+  health_pb2_grpc.add_HealthServicer_to_server(service, server)
+
+  port = os.environ.get('PORT', "8080")
+  logger.info("listening on port: "+port+", serving with asyncio")
+  server.add_insecure_port('[::]:'+port)
+  await server.start()
+  # Kubernetes stops pods with SIGTERM; drain the same way as on Ctrl-C.
+  stopping = asyncio.Event()
+  service.loop.add_signal_handler(signal.SIGTERM, stopping.set)
+  try:
+    await stopping.wait()
+  finally:
+    logger.info('shutting down')
+    await server.stop(shutdownGrace())
+    # Send queue workers finish on the loop, so wait for them off it.
+    await asyncio.to_thread(stopService, service)
+    if isinstance(service, AsyncSmtpEmailService):
+      await service.pool.close()
+
+def shutdownGrace():
+  # How long requests in flight get to finish once the server stops.
+  return float(os.environ.get('SHUTDOWN_GRACE_SECONDS', '10'))
+
+def startRenderPool(debug):
+  global renderer
+  # Large orders hold the GIL for the whole render; hand them to processes.
+  render_processes = int(os.environ.get('RENDER_PROCESSES', '0'))
+  if render_processes > 0:
+    renderer = ProcessPoolRenderer(
+      renderer, processes=render_processes,
+      threshold=int(os.environ.get('RENDER_PROCESS_THRESHOLD', '200')))
+    if debug is not None:
+      debug.route('/debug/render', lambda params: renderer.stats())
+
+def configureService(service, debug):
+  # Retried checkouts resend the same order; remember what was sent.
+  idempotency_ttl = float(os.environ.get('IDEMPOTENCY_TTL_SECONDS', '0'))
+  if idempotency_ttl > 0:
+    service.idempotency = IdempotencyCache(
+      ttl=idempotency_ttl,
+      max_entries=int(os.environ.get('IDEMPOTENCY_MAX_ENTRIES', '100000')),
+      path=os.environ.get('IDEMPOTENCY_PATH') or None)
+    if debug is not None:
+      debug.route('/debug/idempotency', lambda params: service.idempotency.stats())
+
+  # Acknowledge-then-send: with workers configured, emails are sent off the
+  # request path.
+  send_workers = int(os.environ.get('SEND_QUEUE_WORKERS', '0'))
+  if send_workers > 0:
+    on_delivered = on_error = None
+    outbox_path = os.environ.get('OUTBOX_PATH', '')
+    if outbox_path:
+      service.outbox = Outbox(outbox_path, sync=os.environ.get('OUTBOX_SYNC', 'batch'),
+                              max_attempts=int(os.environ.get('OUTBOX_MAX_ATTEMPTS', '5')))
+      on_delivered = service.outbox.complete
+      # A 5xx from the relay will come back on every replay.
+      on_error = lambda key, err: service.outbox.fail(key, permanent_error(err))
+    max_depth = int(os.environ.get('SEND_QUEUE_DEPTH', '1000'))
+    # Mailbox providers throttle bursts; pace sends per recipient domain.
+    scheduler = None
+    # 0 turns it off; DomainScheduler rejects negative rates.
+    domain_rate = float(os.environ.get('RATE_LIMIT_PER_DOMAIN', '0'))
+    if domain_rate != 0:
+      scheduler = DomainScheduler(
+        max_depth, domain_rate,
+        burst=float(os.environ.get('RATE_LIMIT_BURST', '0')) or None,
+        overrides=parse_overrides(os.environ.get('RATE_LIMIT_OVERRIDES', '')))
+    service.send_queue = SendQueue(
+      service.deliver, workers=send_workers,
+      max_depth=max_depth,
+      on_delivered=on_delivered,
+      deliver_batch=service.deliver_batch,
+      batch_size=int(os.environ.get('SEND_BATCH_SIZE', '10')),
+      on_failed=service.releaseClaim,
+      scheduler=scheduler,
+      on_error=on_error)
+    service.send_queue.start()
+    logger.info('sending through a queue with {} workers'.format(send_workers))
+    if service.outbox is not None:
+      startInBackground(lambda: replayOutbox(service), 'outbox-replay')
+    if debug is not None:
+      debug.route('/debug/sendqueue', lambda params: service.send_queue.stats())
+      if service.outbox is not None:
+        debug.route('/debug/outbox', lambda params: service.outbox.stats())
+
+  batch_workers = int(os.environ.get('BATCH_WORKERS', '4'))
+  if batch_workers > 1 and not isinstance(service, AsyncEmailService):
+    service.batch_executor = futures.ThreadPoolExecutor(
+      max_workers=batch_workers, thread_name_prefix='batch-sender')
+  service.batch_chunk_size = int(os.environ.get('BATCH_CHUNK_SIZE', '50'))
+
+def stopService(service):
+  if service.send_queue is not None:
+    service.send_queue.stop()
+  if service.outbox is not None:
+    service.outbox.close()
+  if service.idempotency is not None:
+    service.idempotency.close()
+  if isinstance(renderer, ProcessPoolRenderer):
+    renderer.close()
+
+def replayOutbox(service):
+  # Emails acknowledged before the last shutdown or crash but never sent.
+  pending = service.outbox.pending()
+  if pending:
+    logger.info('replaying {} undelivered emails from the outbox'.format(len(pending)))
+  for outbox_id, email, order in pending:
+    service.send_queue.submit(email, order, outbox_id, block=True)
+
+def startInBackground(target, name):
+  # Observability setup may retry or block on the network; keep it off the
+  # path to listening on the port.
+  thread = threading.Thread(target=target, name=name)
+  thread.daemon = True
+  thread.start()
+  return thread
 
 def initStackdriverProfiling():
+  # Loading the agent is slow, so only do it when the profiler is enabled.
+  import googlecloudprofiler
+
   project_id = None
   try:
     project_id = os.environ["GCP_PROJECT_ID"]
@@ -160,9 +684,51 @@ def initStackdriverProfiling():
         logger.warning("Could not initialize Stackdriver Profiler after retrying, giving up")
   return
 
+def instrumentGrpc():
+  # Interceptors cost something on every RPC, so they are only installed
+  # when tracing is enabled. This has to happen before the server is
+  # created.
+  from opentelemetry.instrumentation.grpc import GrpcAioInstrumentorServer, GrpcInstrumentorServer
+
+  if os.environ.get('GRPC_ASYNC') == "1":
+    GrpcAioInstrumentorServer().instrument()
+  else:
+    GrpcInstrumentorServer().instrument()
+
+def initTracing():
+  try:
+    # The SDK and exporter are only loaded when tracing is enabled.
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+    otel_endpoint = os.getenv("COLLECTOR_SERVICE_ADDR", "localhost:4317")
+    # Head sampling: only this fraction of new traces is recorded and
+    # exported; incoming sampled traces are always continued.
+    sampling_ratio = float(os.getenv("TRACE_SAMPLING_RATIO", "1.0"))
+    trace.set_tracer_provider(TracerProvider(
+      sampler=ParentBased(TraceIdRatioBased(sampling_ratio))))
+    trace.get_tracer_provider().add_span_processor(
+      BatchSpanProcessor(
+          OTLPSpanExporter(
+          endpoint = otel_endpoint,
+          insecure = True
+        )
+      )
+    )
+    logger.info("Tracing enabled.")
+  except Exception as e:
+    logger.warn(f"Exception on Cloud Trace setup: {traceback.format_exc()}, tracing disabled.")
+
 
 if __name__ == '__main__':
-  logger.info('starting the email service in dummy mode.')
+  smtp_addr = os.environ.get('SMTP_SERVER_ADDR', '')
+  if smtp_addr:
+    logger.info('starting the email service, delivering through SMTP at ' + smtp_addr)
+  else:
+    logger.info('starting the email service in dummy mode.')
 
   # Profiler
   try:
@@ -170,29 +736,43 @@ if __name__ == '__main__':
       raise KeyError()
     else:
       logger.info("Profiler enabled.")
-      initStackdriverProfiling()
+      startInBackground(initStackdriverProfiling, "profiler-init")
   except KeyError:
       logger.info("Profiler disabled.")
 
   # Tracing
   try:
     if os.environ["ENABLE_TRACING"] == "1":
-      otel_endpoint = os.getenv("COLLECTOR_SERVICE_ADDR", "localhost:4317")
-      trace.set_tracer_provider(TracerProvider())
-      trace.get_tracer_provider().add_span_processor(
-        BatchSpanProcessor(
-            OTLPSpanExporter(
-            endpoint = otel_endpoint,
-            insecure = True
-          )
-        )
-      )
-    grpc_server_instrumentor = GrpcInstrumentorServer()
-    grpc_server_instrumentor.instrument()
+      instrumentGrpc()
+      startInBackground(initTracing, "tracing-init")
 
-  except (KeyError, DefaultCredentialsError):
+  except KeyError:
       logger.info("Tracing disabled.")
   except Exception as e:
       logger.warn(f"Exception on Cloud Trace setup: {traceback.format_exc()}, tracing disabled.") 
-  
-  start(dummy_mode = True)
+
+  # Local sampling profiler and tracemalloc, controlled from the debug side
+  # port.
+  debug = None
+  debug_port = os.environ.get('DEBUG_PORT', '')
+  if debug_port:
+    profiler = SamplingProfiler(
+      'emailservice',
+      os.environ.get('PROFILER_OUTPUT_DIR', '/tmp/profiles'),
+      rate_hz=float(os.environ.get('PROFILER_SAMPLE_HZ', '100')),
+      flush_seconds=float(os.environ.get('PROFILER_FLUSH_SECONDS', '60')),
+      logger=logger)
+    debug = DebugServer(int(debug_port), logger,
+                        host=os.environ.get('DEBUG_BIND_ADDRESS', '127.0.0.1'))
+    debug.route('/debug/profiler', profiler_handler(profiler))
+    debug.route('/debug/memory', memory_handler(MemoryTracer(logger=logger)))
+    debug.start()
+    if os.environ.get('ENABLE_LOCAL_PROFILER') == "1":
+      # The output directory must be writable; with a read-only root
+      # filesystem point PROFILER_OUTPUT_DIR at a mounted volume.
+      try:
+        profiler.start()
+      except OSError as err:
+        logger.warning("local profiler not started: {}".format(err))
+
+  start(dummy_mode = not smtp_addr, debug = debug)
@@ -0,0 +1,215 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Bounded, TTL-based memory of confirmation emails already sent, keyed by
+# order id and recipient, so retried checkouts don't send them again.
+#
+# claim() is check-and-set under one lock: of several concurrent requests
+# for the same order only the first gets SEND, the others IN_FLIGHT until
+# the first either confirm()s that the email went out, after which they
+# get SENT, or release()s the claim so a retry can go through. Keys are
+# 16-byte hashes, and the oldest sent entries are evicted past `max_entries`.
+#
+# With a path, confirmed keys are also written to SQLite by a background
+# thread and loaded again on startup. That write is best effort: losing
+# the last few only risks a duplicate email.
+
+import collections
+import hashlib
+import queue
+import sqlite3
+import sys
+import threading
+import time
+
+from logger import getJSONLogger
+logger = getJSONLogger('emailservice-idempotency')
+
+# How often the writer drops expired keys from the database.
+_PURGE_SECONDS = 60
+
+# What claim() returns.
+SEND = 'send'
+SENT = 'sent'
+IN_FLIGHT = 'in_flight'
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS sent (
+  key BLOB PRIMARY KEY,
+  expires REAL NOT NULL
+)'''
+
+def _key(order_id, email):
+  return hashlib.blake2b('{}\0{}'.format(order_id, email.lower()).encode('utf-8'),
+                         digest_size=16).digest()
+
+class IdempotencyCache(object):
+
+  def __init__(self, ttl=86400, max_entries=100000, path=None):
+    self.ttl = ttl
+    self.max_entries = max_entries
+    self.path = path
+    self.hits = 0
+    self.misses = 0
+    self.in_flight_hits = 0
+    self.evicted = 0
+    # key -> expiry time of emails sent, oldest first. All entries share
+    # one TTL, so insertion order is also expiry order.
+    self._entries = collections.OrderedDict()
+    # Keys claimed but neither confirmed nor released yet.
+    self._sending = set()
+    self._lock = threading.Lock()
+    self._writes = None
+    if path:
+      self._load()
+      self._writes = queue.Queue()
+      self._thread = threading.Thread(target=self._run, name='idempotency-writer')
+      self._thread.daemon = True
+      self._thread.start()
+
+  def claim(self, order_id, email):
+    """SEND if this email should be sent, SENT if it already was, and
+    IN_FLIGHT if another request is still sending it."""
+    if not order_id:
+      return SEND
+    key = _key(order_id, email)
+    with self._lock:
+      self._expire(time.time())
+      if key in self._entries:
+        self.hits += 1
+        return SENT
+      if key in self._sending:
+        self.in_flight_hits += 1
+        return IN_FLIGHT
+      self.misses += 1
+      self._sending.add(key)
+    return SEND
+
+  def confirm(self, order_id, email):
+    """Records that a claimed email was sent, or accepted for sending. A
+    claim already released stays released."""
+    if not order_id:
+      return
+    key = _key(order_id, email)
+    expires = time.time() + self.ttl
+    with self._lock:
+      if key not in self._sending:
+        return
+      self._sending.remove(key)
+      self._entries[key] = expires
+      while len(self._entries) > self.max_entries:
+        self._entries.popitem(last=False)
+        self.evicted += 1
+    if self._writes is not None:
+      self._writes.put((key, expires))
+
+  def release(self, order_id, email):
+    """Forgets a claim whose email could not be sent."""
+    if not order_id:
+      return
+    key = _key(order_id, email)
+    with self._lock:
+      self._sending.discard(key)
+      self._entries.pop(key, None)
+    if self._writes is not None:
+      self._writes.put((key, None))
+
+  def close(self):
+    if self._writes is not None:
+      self._writes.put(None)
+      self._thread.join()
+
+  def _expire(self, now):
+    while self._entries:
+      key, expires = next(iter(self._entries.items()))
+      if expires > now:
+        return
+      del self._entries[key]
+
+  def memory_bytes(self):
+    # The dict and set themselves plus one key and one float per entry.
+    with self._lock:
+      entries = len(self._entries) + len(self._sending)
+      size = sys.getsizeof(self._entries) + sys.getsizeof(self._sending)
+    return size + entries * (sys.getsizeof(b'\0' * 16) + sys.getsizeof(0.0))
+
+  def stats(self):
+    with self._lock:
+      lookups = self.hits + self.misses
+      counters = {
+        'entries': len(self._entries),
+        'max_entries': self.max_entries,
+        'hits': self.hits,
+        'misses': self.misses,
+        'in_flight': len(self._sending),
+        'in_flight_hits': self.in_flight_hits,
+        'hit_rate': self.hits / lookups if lookups else 0.0,
+        'evicted': self.evicted,
+      }
+    counters['memory_bytes'] = self.memory_bytes()
+    return counters
+
+  def _connect(self):
+    conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute(_SCHEMA)
+    return conn
+
+  def _load(self):
+    conn = self._connect()
+    try:
+      now = time.time()
+      conn.execute('DELETE FROM sent WHERE expires <= ?', (now,))
+      rows = conn.execute('SELECT key, expires FROM sent ORDER BY expires DESC LIMIT ?',
+                          (self.max_entries,)).fetchall()
+    finally:
+      conn.close()
+    for key, expires in reversed(rows):
+      self._entries[key] = expires
+    logger.info('loaded {} idempotency keys from {}'.format(len(rows), self.path))
+
+  def _run(self):
+    conn = self._connect()
+    purged = time.monotonic()
+    while True:
+      ops = [self._writes.get()]
+      while ops[-1] is not None:
+        try:
+          ops.append(self._writes.get_nowait())
+        except queue.Empty:
+          break
+      stopping = ops[-1] is None
+      if stopping:
+        ops.pop()
+      try:
+        conn.execute('BEGIN')
+        for key, expires in ops:
+          if expires is None:
+            conn.execute('DELETE FROM sent WHERE key = ?', (key,))
+          else:
+            conn.execute('INSERT OR REPLACE INTO sent (key, expires) VALUES (?, ?)', (key, expires))
+        if time.monotonic() - purged > _PURGE_SECONDS:
+          conn.execute('DELETE FROM sent WHERE expires <= ?', (time.time(),))
+          purged = time.monotonic()
+        conn.execute('COMMIT')
+      except sqlite3.Error as err:
+        logger.warning('could not persist idempotency keys: {}'.format(err))
+        if conn.in_transaction:
+          conn.execute('ROLLBACK')
+      if stopping:
+        conn.close()
+        return
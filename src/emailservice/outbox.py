@@ -0,0 +1,204 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Durable outbox for queued confirmation emails, in SQLite WAL mode.
+#
+# append() returns once the email is on disk, so an acknowledged request
+# survives a crash or restart; pending() lists what was never delivered so
+# it can be replayed on startup. Delivery is at least once: an email sent
+# just before a crash can be sent again. fail() counts failed attempts; a
+# row is given up on, kept but no longer replayed, after `max_attempts` or
+# at once when the failure is permanent.
+#
+# One writer thread owns the connection. Appends from all handler threads
+# that arrive while a commit is in flight go into the next transaction
+# together (group commit), so a burst costs one fsync instead of one per
+# email. sync='message' commits every append on its own for comparison.
+
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+
+import demo_pb2
+
+from logger import getJSONLogger
+logger = getJSONLogger('emailservice-outbox')
+
+SYNC_MODES = ('batch', 'message')
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS outbox (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  created REAL NOT NULL,
+  email TEXT NOT NULL,
+  order_result BLOB NOT NULL,
+  attempts INTEGER NOT NULL DEFAULT 0,
+  failed INTEGER NOT NULL DEFAULT 0
+)'''
+
+# Columns added since the first schema, for outboxes created before them.
+_ADDED_COLUMNS = (
+  ('attempts', 'INTEGER NOT NULL DEFAULT 0'),
+  ('failed', 'INTEGER NOT NULL DEFAULT 0'),
+)
+
+def _connect(path):
+  conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+  conn.execute('PRAGMA journal_mode=WAL')
+  # FULL fsyncs the WAL on every commit; NORMAL could lose the last
+  # commits on power loss, which defeats the point.
+  conn.execute('PRAGMA synchronous=FULL')
+  return conn
+
+class Outbox(object):
+
+  def __init__(self, path, sync='batch', batch_max=512, batch_wait=0.0, max_attempts=5):
+    if sync not in SYNC_MODES:
+      raise ValueError('unknown outbox sync mode {!r}, expected one of {}'.format(sync, SYNC_MODES))
+    self.path = path
+    self.batch_max = 1 if sync == 'message' else batch_max
+    self.batch_wait = batch_wait
+    self.max_attempts = max_attempts
+    self.appended = 0
+    self.completed = 0
+    self.failed = 0
+    self.commits = 0
+    self.committed_ops = 0
+    self._ops = queue.Queue()
+    self._conn = _connect(path)
+    self._conn.execute(_SCHEMA)
+    columns = {row[1] for row in self._conn.execute('PRAGMA table_info(outbox)')}
+    for name, definition in _ADDED_COLUMNS:
+      if name not in columns:
+        self._conn.execute('ALTER TABLE outbox ADD COLUMN {} {}'.format(name, definition))
+    self._thread = threading.Thread(target=self._run, name='outbox-writer')
+    self._thread.daemon = True
+    self._thread.start()
+
+  def append(self, email, order):
+    """Stores one email durably and returns its outbox id."""
+    future = Future()
+    self._ops.put(('append', (time.time(), email, order.SerializeToString()), future))
+    return future.result()
+
+  def append_many(self, items):
+    """Stores (email, order) pairs, committed together, and returns their ids."""
+    now = time.time()
+    pending = []
+    for email, order in items:
+      future = Future()
+      self._ops.put(('append', (now, email, order.SerializeToString()), future))
+      pending.append(future)
+    return [future.result() for future in pending]
+
+  def complete(self, outbox_id):
+    """Forgets a delivered email. Not waited for: losing it only means a resend."""
+    self._ops.put(('complete', outbox_id, None))
+
+  def fail(self, outbox_id, permanent=False):
+    """Counts a failed delivery. Not waited for, like complete()."""
+    self._ops.put(('fail', (outbox_id, permanent), None))
+
+  def pending(self):
+    """Undelivered emails not given up on, as (id, email, OrderResult),
+    oldest first."""
+    conn = sqlite3.connect(self.path)
+    try:
+      rows = conn.execute(
+        'SELECT id, email, order_result FROM outbox WHERE NOT failed ORDER BY id').fetchall()
+    finally:
+      conn.close()
+    return [(row_id, email, demo_pb2.OrderResult.FromString(data)) for row_id, email, data in rows]
+
+  def close(self):
+    self._ops.put(None)
+    self._thread.join()
+    self._conn.close()
+
+  def stats(self):
+    return {
+      'appended': self.appended,
+      'completed': self.completed,
+      'failed': self.failed,
+      'commits': self.commits,
+      # Appends and completions written per transaction.
+      'mean_batch': self.committed_ops / self.commits if self.commits else 0.0,
+    }
+
+  def _next_batch(self, first):
+    batch = [first]
+    deadline = time.monotonic() + self.batch_wait
+    while len(batch) < self.batch_max:
+      try:
+        # Take whatever queued up during the last commit; only wait if a
+        # batch window is configured.
+        op = self._ops.get(timeout=max(0, deadline - time.monotonic())) if self.batch_wait \
+          else self._ops.get_nowait()
+      except queue.Empty:
+        break
+      if op is None:
+        self._ops.put(None)
+        break
+      batch.append(op)
+    return batch
+
+  def _run(self):
+    while True:
+      op = self._ops.get()
+      if op is None:
+        return
+      batch = self._next_batch(op)
+      ids = []
+      given_up = []
+      try:
+        self._conn.execute('BEGIN')
+        for kind, arg, _ in batch:
+          if kind == 'append':
+            ids.append(self._conn.execute(
+              'INSERT INTO outbox (created, email, order_result) VALUES (?, ?, ?)', arg).lastrowid)
+            continue
+          ids.append(None)
+          if kind == 'complete':
+            self._conn.execute('DELETE FROM outbox WHERE id = ?', (arg,))
+            continue
+          row_id, permanent = arg
+          self._conn.execute('UPDATE outbox SET attempts = attempts + 1 WHERE id = ?', (row_id,))
+          if self._conn.execute(
+              'UPDATE outbox SET failed = 1 WHERE id = ? AND NOT failed AND (? OR attempts >= ?)',
+              (row_id, permanent, self.max_attempts)).rowcount:
+            given_up.append(row_id)
+        self._conn.execute('COMMIT')
+      except sqlite3.Error as err:
+        logger.error('outbox commit failed: {}'.format(err))
+        if self._conn.in_transaction:
+          self._conn.execute('ROLLBACK')
+        for _, _, future in batch:
+          if future is not None:
+            future.set_exception(err)
+        continue
+      self.commits += 1
+      self.committed_ops += len(batch)
+      for (kind, _, future), row_id in zip(batch, ids):
+        if kind == 'append':
+          self.appended += 1
+          future.set_result(row_id)
+        elif kind == 'complete':
+          self.completed += 1
+      for row_id in given_up:
+        self.failed += 1
+        logger.warning('giving up on outbox email {}; it will not be replayed'.format(row_id))
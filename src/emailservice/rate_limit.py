@@ -0,0 +1,215 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Per-recipient-domain rate limiting for the send queue.
+#
+# Large mailbox providers defer mail from senders that exceed their rate,
+# so every recipient domain gets a token bucket. DomainScheduler replaces
+# the send queue's FIFO: queued emails wait in one FIFO per domain, and
+# get() hands out the head of the next domain, round robin, that has a
+# token. A throttled domain keeps its emails queued while the others go
+# ahead, and one busy domain can't starve the rest.
+
+import collections
+import queue
+import threading
+import time
+
+# Dispatches kept per domain for the throughput estimate.
+_RATE_WINDOW = 100
+# Past this many domains, idle ones are dropped.
+_MAX_DOMAINS = 10000
+
+def check_limit(rate, burst, name='default'):
+  # A rate of 0 would divide by zero in the scheduler, and a burst below
+  # one never holds a whole token, so the domain would wait forever.
+  if not rate > 0:
+    raise ValueError('rate limit for {} must be above 0, got {}'.format(name, rate))
+  if burst is not None and not burst >= 1:
+    raise ValueError('rate limit burst for {} must be at least 1, got {}'.format(name, burst))
+
+def parse_overrides(spec):
+  """Parses "gmail.com=50:100,example.org=5" into {domain: (rate, burst)}."""
+  overrides = {}
+  for entry in filter(None, (part.strip() for part in spec.split(','))):
+    domain, _, limit = entry.partition('=')
+    rate, _, burst = limit.partition(':')
+    domain = domain.strip().lower()
+    rate, burst = float(rate), float(burst) if burst else None
+    check_limit(rate, burst, domain)
+    overrides[domain] = (rate, burst)
+  return overrides
+
+def recipient_domain(email):
+  return email.rpartition('@')[2].lower()
+
+class TokenBucket(object):
+
+  def __init__(self, rate, burst):
+    self.rate = rate
+    self.burst = burst
+    self.tokens = burst
+    self.updated = time.monotonic()
+
+  def wait_time(self, now):
+    """Seconds until a token is available, 0 if one is available now."""
+    self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+    self.updated = now
+    return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+  def take(self):
+    self.tokens -= 1
+
+class _Domain(object):
+
+  def __init__(self, bucket):
+    self.bucket = bucket
+    self.items = collections.deque()
+    self.dispatched = 0
+    # Times this domain had to hold back emails for lack of tokens.
+    self.throttled = 0
+    self.blocked = False
+    self.dispatched_at = collections.deque(maxlen=_RATE_WINDOW)
+
+class DomainScheduler(object):
+  """Drop-in for the queue.Queue inside SendQueue.
+
+  Items are SendQueue's (enqueued, email, order, key) tuples. An item with
+  no email is the workers' stop sentinel and is only handed out once
+  nothing else is queued.
+  """
+
+  def __init__(self, maxsize, rate, burst=None, overrides=None):
+    check_limit(rate, burst)
+    for name, (domain_rate, domain_burst) in (overrides or {}).items():
+      check_limit(domain_rate, domain_burst, name)
+    self.maxsize = maxsize
+    self.rate = rate
+    self.burst = burst or max(1.0, rate)
+    self.overrides = overrides or {}
+    self._domains = {}
+    # Domains with queued items, in round-robin order.
+    self._ready = collections.deque()
+    self._sentinels = collections.deque()
+    self._size = 0
+    self._lock = threading.Lock()
+    self._not_empty = threading.Condition(self._lock)
+    self._not_full = threading.Condition(self._lock)
+
+  def _domain(self, name):
+    domain = self._domains.get(name)
+    if domain is None:
+      if len(self._domains) >= _MAX_DOMAINS:
+        self._forget_idle()
+      rate, burst = self.overrides.get(name, (self.rate, self.burst))
+      domain = _Domain(TokenBucket(rate, burst or max(1.0, rate)))
+      self._domains[name] = domain
+    return domain
+
+  def _forget_idle(self):
+    # An idle domain's bucket refills to full anyway; only its counters go.
+    for name in [name for name, domain in self._domains.items() if not domain.items]:
+      del self._domains[name]
+
+  def put(self, item, block=True, timeout=None):
+    with self._not_full:
+      if item[1] is None:
+        self._sentinels.append(item)
+        self._not_empty.notify()
+        return
+      if self._size >= self.maxsize:
+        if not block or not self._not_full.wait_for(
+            lambda: self._size < self.maxsize, timeout):
+          raise queue.Full
+      name = recipient_domain(item[1])
+      domain = self._domain(name)
+      if not domain.items:
+        self._ready.append(name)
+      domain.items.append(item)
+      self._size += 1
+      self._not_empty.notify()
+
+  def get(self, block=True):
+    with self._not_empty:
+      while True:
+        item, wait = self._take()
+        if item is not None:
+          self._not_full.notify()
+          return item
+        if not block:
+          raise queue.Empty
+        # Sleep until a bucket refills or something new arrives.
+        self._not_empty.wait(wait)
+
+  def get_nowait(self):
+    return self.get(block=False)
+
+  def _take(self):
+    now = time.monotonic()
+    wait = None
+    for _ in range(len(self._ready)):
+      name = self._ready[0]
+      self._ready.rotate(-1)
+      domain = self._domains[name]
+      domain_wait = domain.bucket.wait_time(now)
+      if domain_wait > 0:
+        if not domain.blocked:
+          domain.blocked = True
+          domain.throttled += 1
+        wait = domain_wait if wait is None else min(wait, domain_wait)
+        continue
+      domain.bucket.take()
+      domain.blocked = False
+      item = domain.items.popleft()
+      if not domain.items:
+        self._ready.remove(name)
+      domain.dispatched += 1
+      domain.dispatched_at.append(now)
+      self._size -= 1
+      return item, None
+    if not self._ready and self._sentinels:
+      return self._sentinels.popleft(), None
+    return None, wait
+
+  def qsize(self):
+    with self._lock:
+      return self._size
+
+  def full(self):
+    return self.qsize() >= self.maxsize
+
+  def oldest(self):
+    """Enqueue time of the longest-waiting email, or None."""
+    with self._lock:
+      heads = [self._domains[name].items[0][0] for name in self._ready]
+    return min(heads) if heads else None
+
+  def domain_stats(self, limit=20):
+    """The `limit` busiest domains by emails dispatched."""
+    now = time.monotonic()
+    with self._lock:
+      domains = sorted(self._domains.items(), key=lambda kv: kv[1].dispatched, reverse=True)
+      stats = {}
+      for name, domain in domains[:limit]:
+        span = now - domain.dispatched_at[0] if domain.dispatched_at else 0
+        stats[name] = {
+          'queued': len(domain.items),
+          'dispatched': domain.dispatched,
+          'throttled': domain.throttled,
+          'rate_limit': domain.bucket.rate,
+          'throughput_per_second': len(domain.dispatched_at) / span if span > 0 else 0.0,
+        }
+    return stats
@@ -0,0 +1,262 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Fast rendering of the order confirmation email.
+#
+# confirmation.html reads protobuf attributes and calls the `format` filter
+# for every item. Here the order is flattened once into plain tuples with
+# Money already formatted, and rendered through confirmation_fast.html.
+# Item rows come from the template's item_row macro and are cached, since
+# carts keep repeating the same product, quantity and price; an order then
+# costs one pass over the page and its cached rows. The output is
+# identical to confirmation.html's. Compiled templates can be kept in a
+# bytecode cache directory so restarts skip compilation.
+#
+# MultipartRenderer also produces a plain-text part, from confirmation.txt,
+# and an HTML part for mail clients: the <style> rules are inlined and the
+# font stylesheet and comments dropped once, when the template is loaded,
+# not per email.
+#
+# ProcessPoolRenderer sends orders above an item threshold to worker
+# processes as serialized protobuf bytes, so one large order doesn't hold
+# the GIL while every other handler thread waits.
+
+import collections
+import functools
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+import demo_pb2
+from smtp_backend import Multipart
+
+from logger import getJSONLogger
+logger = getJSONLogger('emailservice-renderer')
+
+FAST_TEMPLATE = 'confirmation_fast.html'
+REFERENCE_TEMPLATE = 'confirmation.html'
+TEXT_TEMPLATE = 'confirmation.txt'
+
+_STYLE_BLOCK = re.compile(r'<style[^>]*>(.*?)</style>', re.S | re.I)
+_STYLESHEET_LINK = re.compile(r'<link[^>]*rel="stylesheet"[^>]*>', re.I)
+_HTML_COMMENT = re.compile(r'<!--.*?-->', re.S)
+_CSS_RULE = re.compile(r'([^{}]+)\{([^{}]*)\}')
+_TAG_SELECTOR = re.compile(r'[a-z][a-z0-9]*')
+
+FlatOrder = collections.namedtuple('FlatOrder', [
+  'order_id', 'shipping_tracking_id', 'shipping_cost', 'shipping_cost_plain',
+  'street_address_1', 'street_address_2', 'city', 'country', 'zip_code',
+  'items',  # tuple of (product_id, quantity, cost)
+])
+
+@functools.lru_cache(maxsize=4096)
+def format_money(units, nanos, currency_code, separator='.'):
+  return '{}{}{:02d} {}'.format(units, separator, nanos // 10000000, currency_code)
+
+def flatten_item(item):
+  return (item.item.product_id, item.item.quantity,
+          format_money(item.cost.units, item.cost.nanos, item.cost.currency_code))
+
+def flatten_order(order, with_items=True):
+  cost = order.shipping_cost
+  address = order.shipping_address
+  return FlatOrder(
+    order_id=order.order_id,
+    shipping_tracking_id=order.shipping_tracking_id,
+    # confirmation.html prints the shipping cost as "8. 99 USD".
+    shipping_cost=format_money(cost.units, cost.nanos, cost.currency_code, '. '),
+    # For the plain-text part, which has no old output to match.
+    shipping_cost_plain=format_money(cost.units, cost.nanos, cost.currency_code),
+    # The template asks for street_address_1 and _2, which Address does not
+    # have, so they have always rendered empty.
+    street_address_1='',
+    street_address_2='',
+    city=address.city,
+    country=address.country,
+    zip_code=address.zip_code,
+    items=tuple(flatten_item(item) for item in order.items) if with_items else ())
+
+def inline_styles(html):
+  """Moves the rules of <style> blocks into style attributes, and drops
+  stylesheet links, comments and indentation, which mail clients ignore
+  or strip. Only tag selectors are supported."""
+  rules = []
+  for block in _STYLE_BLOCK.findall(html):
+    for selectors, declarations in _CSS_RULE.findall(block):
+      declarations = ' '.join(d.strip() + ';' for d in declarations.split(';') if d.strip())
+      for selector in selectors.split(','):
+        selector = selector.strip().lower()
+        if not _TAG_SELECTOR.fullmatch(selector):
+          raise ValueError('cannot inline CSS selector {!r}'.format(selector))
+        rules.append((selector, declarations))
+  for pattern in (_STYLE_BLOCK, _STYLESHEET_LINK, _HTML_COMMENT):
+    html = pattern.sub('', html)
+
+  for tag, declarations in rules:
+    def add_style(match, declarations=declarations):
+      attributes = match.group(2) or ''
+      if 'style="' in attributes:
+        # The element's own style still wins over the rule.
+        attributes = attributes.replace('style="', 'style="{} '.format(declarations), 1)
+      else:
+        attributes += ' style="{}"'.format(declarations)
+      return '<{}{}>'.format(match.group(1), attributes)
+    html = re.sub(r'<({})(\s[^>]*)?>'.format(tag), add_style, html, flags=re.I)
+  return '\n'.join(line.strip() for line in html.splitlines() if line.strip())
+
+def new_environment(template_dir='templates', cache_dir=None):
+  return Environment(
+    loader=FileSystemLoader(template_dir),
+    autoescape=select_autoescape(['html', 'xml']),
+    bytecode_cache=FileSystemBytecodeCache(cache_dir) if cache_dir else None,
+    # Templates ship with the image; don't stat them on every render.
+    auto_reload=False)
+
+class _Page(object):
+  # A template with an item_row macro, and that macro's cached rows.
+
+  def __init__(self, template, row_cache_size):
+    self.template = template
+    # Evaluating the module needs some order; the macro doesn't use it.
+    module = template.make_module({'order': flatten_order(demo_pb2.OrderResult())})
+    self.item_row = functools.lru_cache(maxsize=row_cache_size)(module.item_row)
+
+  def render(self, flat):
+    item_row = self.item_row
+    return self.template.render(order=flat, item_rows=[item_row(*item) for item in flat.items])
+
+  def generate(self, order):
+    item_row = self.item_row
+    return self.template.generate(
+      order=flatten_order(order, with_items=False),
+      item_rows=(item_row(*flatten_item(item)) for item in order.items))
+
+class ConfirmationRenderer(object):
+
+  def __init__(self, template_dir='templates', cache_dir=None, row_cache_size=4096):
+    # Enough to build the same renderer again, in a worker process.
+    self.options = {'template_dir': template_dir, 'cache_dir': cache_dir,
+                    'row_cache_size': row_cache_size}
+    self.env = new_environment(template_dir, cache_dir)
+    self.page = _Page(self.env.get_template(FAST_TEMPLATE), row_cache_size)
+
+  def render(self, order):
+    return self.page.render(flatten_order(order))
+
+  def generate(self, order):
+    """Yields the rendered email in chunks. Item rows are rendered as they
+    are written, so the whole email is never held in memory."""
+    return self.page.generate(order)
+
+class MultipartRenderer(ConfirmationRenderer):
+  """Renders a Multipart of mail-ready HTML and plain text."""
+
+  def __init__(self, template_dir='templates', cache_dir=None, row_cache_size=4096):
+    super().__init__(template_dir, cache_dir, row_cache_size)
+    source, _, _ = self.env.loader.get_source(self.env, FAST_TEMPLATE)
+    self.html_page = _Page(self.env.from_string(inline_styles(source)), row_cache_size)
+    self.text_page = _Page(self.env.get_template(TEXT_TEMPLATE), row_cache_size)
+
+  def render(self, order):
+    flat = flatten_order(order)
+    return Multipart(html=self.html_page.render(flat), text=self.text_page.render(flat))
+
+  def generate(self, order):
+    return Multipart(html=self.html_page.generate(order), text=self.text_page.generate(order))
+
+# The renderer of a worker process, set up once by _init_worker.
+_worker_renderer = None
+
+def _init_worker(renderer_class, options):
+  global _worker_renderer
+  _worker_renderer = renderer_class(**options)
+
+def _render_serialized(data):
+  return _worker_renderer.render(demo_pb2.OrderResult.FromString(data))
+
+class ProcessPoolRenderer(object):
+  """ConfirmationRenderer that renders large orders in worker processes.
+
+  Orders with more than `threshold` items are rendered by one of
+  `processes` workers; smaller ones stay on the calling thread, where the
+  handoff would cost more than the render. Workers build their renderer
+  with the same class and options as `renderer`.
+  """
+
+  def __init__(self, renderer, processes=2, threshold=200):
+    self.local = renderer
+    self.threshold = threshold
+    self.processes = processes
+    self.rendered_local = 0
+    self.rendered_remote = 0
+    self.fallbacks = 0
+    self._initargs = (type(renderer), renderer.options)
+    self._lock = threading.Lock()
+    self._pool = self._new_pool()
+
+  def _new_pool(self):
+    # Forking a process that runs gRPC threads is unsafe; start workers
+    # from a clean interpreter instead.
+    pool = ProcessPoolExecutor(
+      max_workers=self.processes, mp_context=multiprocessing.get_context('spawn'),
+      initializer=_init_worker, initargs=self._initargs)
+    # Start the workers now rather than on the first large order.
+    warmup = demo_pb2.OrderResult().SerializeToString()
+    for future in [pool.submit(_render_serialized, warmup) for _ in range(self.processes)]:
+      future.result()
+    return pool
+
+  def render(self, order):
+    if len(order.items) <= self.threshold:
+      with self._lock:
+        self.rendered_local += 1
+      return self.local.render(order)
+    pool = self._pool
+    try:
+      html = pool.submit(_render_serialized, order.SerializeToString()).result()
+    except BrokenProcessPool as err:
+      logger.error('render worker died, restarting the pool: {}'.format(err))
+      with self._lock:
+        self.fallbacks += 1
+        if self._pool is pool:
+          self._pool = self._new_pool()
+      return self.local.render(order)
+    with self._lock:
+      self.rendered_remote += 1
+    return html
+
+  def generate(self, order):
+    if len(order.items) <= self.threshold:
+      return self.local.generate(order)
+    rendered = self.render(order)
+    return rendered if isinstance(rendered, Multipart) else iter([rendered])
+
+  def close(self):
+    self._pool.shutdown()
+
+  def stats(self):
+    with self._lock:
+      return {
+        'processes': self.processes,
+        'threshold': self.threshold,
+        'rendered_local': self.rendered_local,
+        'rendered_remote': self.rendered_remote,
+        'fallbacks': self.fallbacks,
+      }
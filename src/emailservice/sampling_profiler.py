@@ -0,0 +1,146 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Low-overhead sampling profiler that needs no cloud credentials.
+#
+# A background thread walks sys._current_frames() at a fixed rate and counts
+# the stacks it sees. Every flush interval the counts are written to
+# <output_dir>/<service>-<timestamp>-<n>.collapsed in the collapsed-stack format
+# ("frame;frame;frame count") read by flamegraph.pl, speedscope and pprof's
+# importers. It is a wall-clock profile, but threads parked in
+# threading/queue/selectors primitives or idle in the gRPC and executor
+# pools are skipped so busy code is not drowned out by waiting.
+
+import collections
+import os
+import sys
+import threading
+import time
+
+_IDLE_FILES = ('threading.py', 'queue.py', 'selectors.py')
+# Leaf frames that block inside C: an idle executor worker and gRPC's poller.
+_IDLE_FRAMES = {('thread.py', '_worker'), ('_server.py', '_serve')}
+
+def _frame_name(code):
+  return '{}:{}:{}'.format(os.path.basename(code.co_filename), code.co_name,
+                           code.co_firstlineno)
+
+class SamplingProfiler(object):
+
+  def __init__(self, service, output_dir, rate_hz=100, flush_seconds=60, logger=None):
+    self.service = service
+    self.output_dir = output_dir
+    self.rate_hz = rate_hz
+    self.flush_seconds = flush_seconds
+    self.logger = logger
+    self.samples = 0
+    self.files_written = 0
+    self._flushes = 0
+    self._counts = collections.Counter()
+    self._lock = threading.Lock()
+    self._stopped = threading.Event()
+    self._thread = None
+
+  @property
+  def running(self):
+    return self._thread is not None and self._thread.is_alive()
+
+  def start(self):
+    if self.running:
+      return False
+    os.makedirs(self.output_dir, exist_ok=True)
+    self._stopped.clear()
+    self._thread = threading.Thread(target=self._run, name='sampling-profiler')
+    self._thread.daemon = True
+    self._thread.start()
+    if self.logger:
+      self.logger.info('sampling profiler started at {} Hz, writing to {}'.format(
+        self.rate_hz, self.output_dir))
+    return True
+
+  def stop(self):
+    if not self.running:
+      return False
+    self._stopped.set()
+    self._thread.join()
+    self.flush()
+    if self.logger:
+      self.logger.info('sampling profiler stopped')
+    return True
+
+  def sample(self):
+    own = threading.get_ident()
+    names = {t.ident: t.name for t in threading.enumerate()}
+    stacks = []
+    for ident, frame in sys._current_frames().items():
+      if ident == own:
+        continue
+      leaf = os.path.basename(frame.f_code.co_filename)
+      if leaf in _IDLE_FILES or (leaf, frame.f_code.co_name) in _IDLE_FRAMES:
+        continue
+      stack = []
+      while frame is not None:
+        stack.append(_frame_name(frame.f_code))
+        frame = frame.f_back
+      stack.append(names.get(ident, 'thread-{}'.format(ident)))
+      stacks.append(';'.join(reversed(stack)))
+    with self._lock:
+      self._counts.update(stacks)
+      self.samples += 1
+
+  def flush(self):
+    """Writes the stacks collected so far and starts a new profile."""
+    with self._lock:
+      counts, self._counts = self._counts, collections.Counter()
+      if not counts:
+        return None
+      self._flushes += 1
+      sequence = self._flushes
+    # Flushes can come faster than once a second; the sequence number
+    # keeps them from overwriting each other.
+    now = time.time()
+    path = os.path.join(self.output_dir, '{}-{}.{:03d}-{}.collapsed'.format(
+      self.service, time.strftime('%Y%m%dT%H%M%S', time.localtime(now)),
+      int(now * 1000) % 1000, sequence))
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+      for stack, count in counts.most_common():
+        f.write('{} {}\n'.format(stack, count))
+    os.replace(tmp_path, path)
+    self.files_written += 1
+    return path
+
+  def status(self):
+    return {
+      'running': self.running,
+      'rate_hz': self.rate_hz,
+      'samples': self.samples,
+      'files_written': self.files_written,
+      'output_dir': self.output_dir,
+    }
+
+  def _run(self):
+    next_flush = time.monotonic() + self.flush_seconds
+    # rate_hz is read every tick, so changing it applies while running.
+    while not self._stopped.wait(1.0 / self.rate_hz):
+      self.sample()
+      if time.monotonic() >= next_flush:
+        try:
+          self.flush()
+        except OSError as err:
+          if self.logger:
+            self.logger.warning('could not write profile: {}'.format(err))
+        next_flush = time.monotonic() + self.flush_seconds
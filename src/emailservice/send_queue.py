@@ -0,0 +1,186 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Bounded queue and worker pool for acknowledge-then-send delivery.
+#
+# The gRPC handler only validates and submits; a fixed number of workers
+# render and send. When the queue is full submit() returns False and the
+# handler answers RESOURCE_EXHAUSTED, so callers back off instead of the
+# backlog growing without limit. Emails that fail to send are logged and
+# counted, not retried; with an outbox they stay there for the next replay
+# until the outbox gives up on them.
+
+import collections
+import queue
+import threading
+import time
+
+from logger import getJSONLogger
+logger = getJSONLogger('emailservice-queue')
+
+# Completions kept for the throughput estimate.
+_RATE_WINDOW = 1000
+
+class SendQueue(object):
+
+  def __init__(self, deliver, workers=4, max_depth=1000, on_delivered=None,
+               deliver_batch=None, batch_size=1, on_failed=None, scheduler=None,
+               on_error=None):
+    self._deliver = deliver
+    self._on_delivered = on_delivered
+    # on_failed(email, order) is called for emails that could not be sent.
+    self._on_failed = on_failed
+    # on_error(key, err) gets the key and error of those emails.
+    self._on_error = on_error
+    # deliver_batch([(email, order), ...]) returns one error or None per
+    # email; workers hand it whatever is queued, up to batch_size.
+    self._deliver_batch = deliver_batch
+    self._batch_size = batch_size if deliver_batch is not None else 1
+    self._workers = workers
+    # A rate_limit.DomainScheduler can stand in for the FIFO.
+    self._queue = scheduler if scheduler is not None else queue.Queue(maxsize=max_depth)
+    self._threads = []
+    self._lock = threading.Lock()
+    self._completed_at = collections.deque(maxlen=_RATE_WINDOW)
+    self.max_depth = max_depth
+    self.enqueued = 0
+    self.delivered = 0
+    self.failed = 0
+    self.rejected = 0
+
+  def submit(self, email, order, key=None, block=False):
+    """Queues an email; `key` is passed to on_delivered once it is sent."""
+    try:
+      self._queue.put((time.monotonic(), email, order, key), block=block)
+    except queue.Full:
+      with self._lock:
+        self.rejected += 1
+      return False
+    with self._lock:
+      self.enqueued += 1
+    return True
+
+  def full(self):
+    return self._queue.full()
+
+  def room(self):
+    """How many more emails fit right now; others may take it first."""
+    return max(0, self.max_depth - self._queue.qsize())
+
+  def start(self):
+    for i in range(self._workers):
+      thread = threading.Thread(target=self._run, name='send-worker-{}'.format(i))
+      thread.daemon = True
+      thread.start()
+      self._threads.append(thread)
+
+  def stop(self, timeout=10):
+    """Lets the workers finish what is queued, waiting up to `timeout` seconds."""
+    deadline = time.monotonic() + timeout
+    try:
+      for _ in self._threads:
+        self._queue.put((None, None, None, None), timeout=max(0.001, deadline - time.monotonic()))
+    except queue.Full:
+      logger.warning('send queue did not drain within {}s'.format(timeout))
+    for thread in self._threads:
+      thread.join(max(0, deadline - time.monotonic()))
+    self._threads = []
+
+  def _next_batch(self):
+    batch = [self._queue.get()]
+    while batch[-1][0] is not None and len(batch) < self._batch_size:
+      try:
+        batch.append(self._queue.get_nowait())
+      except queue.Empty:
+        break
+    return batch
+
+  def _run(self):
+    while True:
+      batch = self._next_batch()
+      stopping = batch[-1][0] is None
+      if stopping:
+        batch.pop()
+      if batch:
+        self._deliver_all(batch)
+      if stopping:
+        return
+
+  def _deliver_all(self, batch):
+    if self._deliver_batch is not None:
+      try:
+        errors = self._deliver_batch([(email, order) for _, email, order, _ in batch])
+      except Exception as err:
+        errors = [err] * len(batch)
+    else:
+      errors = []
+      for _, email, order, _ in batch:
+        try:
+          self._deliver(email, order)
+          errors.append(None)
+        except Exception as err:
+          errors.append(err)
+    for (_, email, order, key), err in zip(batch, errors):
+      if err is not None:
+        logger.error('could not deliver confirmation to {}: {}'.format(email, err))
+        if self._on_failed is not None:
+          self._on_failed(email, order)
+        if self._on_error is not None:
+          self._on_error(key, err)
+      elif self._on_delivered is not None:
+        self._on_delivered(key)
+      with self._lock:
+        if err is None:
+          self.delivered += 1
+          self._completed_at.append(time.monotonic())
+        else:
+          self.failed += 1
+
+  def oldest_age(self):
+    """Seconds the oldest queued email has been waiting."""
+    if hasattr(self._queue, 'oldest'):
+      head = self._queue.oldest()
+    else:
+      with self._queue.mutex:
+        head = self._queue.queue[0][0] if self._queue.queue else None
+    return time.monotonic() - head if head is not None else 0.0
+
+  def throughput(self):
+    """Deliveries per second over the last few completions."""
+    with self._lock:
+      if len(self._completed_at) < 2:
+        return 0.0
+      span = time.monotonic() - self._completed_at[0]
+      return len(self._completed_at) / span if span > 0 else 0.0
+
+  def stats(self):
+    with self._lock:
+      counters = {
+        'enqueued': self.enqueued,
+        'delivered': self.delivered,
+        'failed': self.failed,
+        'rejected': self.rejected,
+      }
+    counters.update({
+      'depth': self._queue.qsize(),
+      'max_depth': self.max_depth,
+      'workers': self._workers,
+      'oldest_age_seconds': self.oldest_age(),
+      'throughput_per_second': self.throughput(),
+    })
+    if hasattr(self._queue, 'domain_stats'):
+      counters['domains'] = self._queue.domain_stats()
+    return counters
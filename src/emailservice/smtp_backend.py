@@ -0,0 +1,386 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# SMTP delivery over a pool of persistent connections.
+#
+# Connections are opened lazily up to `size`, kept open between messages
+# and recycled after `max_messages` or on any error. smtplib sends MAIL,
+# RCPT and DATA one round trip at a time; when the relay advertises
+# PIPELINING (RFC 2920) they go out in a single write instead, so a message
+# costs two round trips rather than four. send_many() delivers a batch of
+# messages over one connection without reacquiring it per message.
+#
+# A message body is either the HTML string or a function returning an
+# iterator of HTML chunks, such as ConfirmationRenderer.generate. Chunks
+# are quoted-printable encoded and written into DATA as they come, so a
+# very large email never exists in memory as a whole. A Multipart body
+# becomes a multipart/alternative message with a plain-text and an HTML
+# part; each part is a string or an iterator of chunks.
+
+import binascii
+import collections
+import email.policy
+import email.utils
+import functools
+import queue
+import re
+import smtplib
+import threading
+from email.message import EmailMessage
+
+from logger import getJSONLogger
+logger = getJSONLogger('emailservice-smtp')
+
+SUBJECT = 'Your Confirmation Email'
+
+_LEADING_DOT = re.compile(br'(?m)^\.')
+_PLAIN_ADDRESS = re.compile(r'[!-~]{1,200}')
+# Printable ASCII without spaces, "<" or ">": nothing that could end an
+# SMTP command or its path.
+_ADDRESS_CHARS = re.compile(r'[!-;=?-~]{3,254}')
+
+# Rendered HTML buffered before it is encoded and written to the socket.
+STREAM_BLOCK = 64 * 1024
+
+Multipart = collections.namedtuple('Multipart', ['html', 'text'])
+
+# "=_" can't occur in quoted-printable text, so a fixed boundary is safe
+# and the MIME framing is the same for every message.
+_BOUNDARY = '=_confirmation_alternative'
+_PART_HEADERS = 'Content-Type: text/{}; charset="utf-8"\r\nContent-Transfer-Encoding: quoted-printable\r\n\r\n'
+_HTML_HEADERS = ('MIME-Version: 1.0\r\n' + _PART_HEADERS.format('html')).encode()
+_MULTIPART_HEADERS = ('MIME-Version: 1.0\r\n'
+                      'Content-Type: multipart/alternative; boundary="{}"\r\n\r\n'.format(_BOUNDARY)).encode()
+_TEXT_PART = '--{}\r\n{}'.format(_BOUNDARY, _PART_HEADERS.format('plain')).encode()
+_HTML_PART = '\r\n--{}\r\n{}'.format(_BOUNDARY, _PART_HEADERS.format('html')).encode()
+_CLOSE_PARTS = '\r\n--{}--\r\n'.format(_BOUNDARY).encode()
+
+def build_message(sender, recipient, html):
+  message = EmailMessage(policy=email.policy.SMTP)
+  message['From'] = sender
+  message['To'] = recipient
+  message['Subject'] = SUBJECT
+  message.set_content(html, subtype='html')
+  return message
+
+def _encode_lines(text):
+  # Whole lines only: quoted-printable encodes a line break differently
+  # from a soft one.
+  data = binascii.b2a_qp(text.encode('utf-8'), istext=True).replace(b'\n', b'\r\n')
+  return _LEADING_DOT.sub(b'..', data)
+
+@functools.lru_cache(maxsize=16)
+def _sender_headers(sender):
+  headers = EmailMessage(policy=email.policy.SMTP)
+  headers['From'] = sender
+  headers['Subject'] = SUBJECT
+  return headers.as_bytes()[:-2]
+
+def _address_headers(sender, recipient):
+  # Going through the email package costs more than rendering a small
+  # order, so only addresses that need encoding or folding do.
+  if _PLAIN_ADDRESS.fullmatch(recipient):
+    return _sender_headers(sender) + b'To: ' + recipient.encode() + b'\r\n'
+  headers = EmailMessage(policy=email.policy.SMTP)
+  headers['To'] = recipient
+  return _sender_headers(sender) + headers.as_bytes()[:-2]
+
+def stream_message(sender, recipient, chunks):
+  """Yields the message as dot-stuffed blocks of CRLF-terminated lines,
+  ready to be written into DATA, encoding HTML chunks as they arrive."""
+  yield _address_headers(sender, recipient) + _HTML_HEADERS
+  yield from _encode_part(chunks)
+
+def multipart_message(sender, recipient, html, text):
+  """Like stream_message(), as multipart/alternative with a text part."""
+  yield _address_headers(sender, recipient) + _MULTIPART_HEADERS
+  yield _TEXT_PART
+  yield from _encode_part(text)
+  yield _HTML_PART
+  yield from _encode_part(html)
+  yield _CLOSE_PARTS
+
+def _encode_part(chunks):
+  if isinstance(chunks, str):
+    chunks = (chunks,)
+  pending, size = [], 0
+  for chunk in chunks:
+    pending.append(chunk)
+    size += len(chunk)
+    if size >= STREAM_BLOCK:
+      text = ''.join(pending)
+      end = text.rfind('\n') + 1
+      if end:
+        yield _encode_lines(text[:end])
+        text = text[end:]
+      pending, size = [text], len(text)
+  text = ''.join(pending)
+  if text:
+    yield _encode_lines(text if text.endswith('\n') else text + '\n')
+
+def message_data(sender, recipient, body):
+  """The message for a body, as bytes or as blocks from stream_message()."""
+  if isinstance(body, str):
+    return build_message(sender, recipient, body).as_bytes()
+  if callable(body):
+    body = body()
+  if isinstance(body, Multipart):
+    return multipart_message(sender, recipient, body.html, body.text)
+  return stream_message(sender, recipient, body)
+
+def data_blocks(data):
+  """Message data as the dot-stuffed blocks written after DATA, the last
+  one ending with the terminating dot."""
+  # Small writes after the first wait for the relay's delayed ACK (Nagle's
+  # algorithm), so blocks are joined up to STREAM_BLOCK and the dot goes
+  # out with the last one.
+  if isinstance(data, bytes):
+    if not data.endswith(b'\r\n'):
+      data += b'\r\n'
+    yield _LEADING_DOT.sub(b'..', data) + b'.\r\n'
+    return
+  pending, size = [], 0
+  for block in data:
+    pending.append(block)
+    size += len(block)
+    if size >= STREAM_BLOCK:
+      yield b''.join(pending)
+      pending, size = [], 0
+  pending.append(b'.\r\n')
+  yield b''.join(pending)
+
+def valid_address(address):
+  """True if `address` is a single bare addr-spec, safe to put in an SMTP
+  command and a To header."""
+  if not _ADDRESS_CHARS.fullmatch(address):
+    return False
+  name, spec = email.utils.parseaddr(address)
+  return not name and spec == address and '@' in spec
+
+def check_address(address):
+  # Checked before any command is written: the address goes into MAIL
+  # and RCPT verbatim.
+  if not valid_address(address):
+    raise smtplib.SMTPRecipientsRefused({address: (501, b'5.1.3 Invalid address')})
+
+def permanent_error(err):
+  """True if the relay refused for good (5xx): sending again won't help."""
+  if isinstance(err, smtplib.SMTPRecipientsRefused):
+    return bool(err.recipients) and all(
+      code >= 500 for code, _ in err.recipients.values())
+  return isinstance(err, smtplib.SMTPResponseException) and err.smtp_code >= 500
+
+def parse_address(address):
+  """Splits 'host:port' or '[ipv6]:port' into (host, port)."""
+  host, _, port = address.rpartition(':')
+  if host.startswith('[') and host.endswith(']'):
+    host = host[1:-1]
+  elif ':' in host:
+    # A bare IPv6 address, or one whose port is missing.
+    host = ''
+  if not host or not port.isdigit():
+    raise ValueError('SMTP address {!r} must be host:port or [ipv6]:port'.format(address))
+  return host, int(port)
+
+class _Connection(object):
+
+  def __init__(self, pool):
+    self.smtp = smtplib.SMTP(pool.host, pool.port, timeout=pool.timeout)
+    self.smtp.ehlo()
+    if pool.starttls:
+      self.smtp.starttls()
+      self.smtp.ehlo()
+    if pool.username:
+      self.smtp.login(pool.username, pool.password)
+    self.pipelining = pool.pipelining and self.smtp.has_extn('pipelining')
+    self.sent = 0
+
+  def send(self, sender, recipient, data):
+    # `data` is the message as bytes, or as blocks from stream_message().
+    check_address(recipient)
+    if self.pipelining:
+      self._send_pipelined(sender, recipient, data)
+    elif isinstance(data, bytes):
+      self.smtp.sendmail(sender, [recipient], data)
+    else:
+      self._send_streamed(sender, recipient, data)
+    self.sent += 1
+
+  def _send_streamed(self, sender, recipient, blocks):
+    smtp = self.smtp
+    code, reply = smtp.mail(sender)
+    if code != 250:
+      smtp.rset()
+      raise smtplib.SMTPSenderRefused(code, reply, sender)
+    code, reply = smtp.rcpt(recipient)
+    if code not in (250, 251):
+      smtp.rset()
+      raise smtplib.SMTPRecipientsRefused({recipient: (code, reply)})
+    code, reply = smtp.docmd('DATA')
+    if code != 354:
+      smtp.rset()
+      raise smtplib.SMTPDataError(code, reply)
+    self._write_data(blocks)
+
+  def _write_data(self, data):
+    smtp = self.smtp
+    for block in data_blocks(data):
+      smtp.send(block)
+    code, reply = smtp.getreply()
+    if code != 250:
+      smtp.rset()
+      raise smtplib.SMTPDataError(code, reply)
+
+  def _send_pipelined(self, sender, recipient, data):
+    smtp = self.smtp
+    smtp.send('MAIL FROM:<{}>\r\nRCPT TO:<{}>\r\nDATA\r\n'.format(sender, recipient))
+    # Every pipelined command gets a reply, even after a failure.
+    mail = smtp.getreply()
+    rcpt = smtp.getreply()
+    data_code, data_reply = smtp.getreply()
+    if data_code == 354 and (mail[0] != 250 or rcpt[0] not in (250, 251)):
+      # Close the transaction we can no longer use.
+      smtp.send(b'.\r\n')
+      smtp.getreply()
+    if mail[0] != 250:
+      smtp.rset()
+      raise smtplib.SMTPSenderRefused(mail[0], mail[1], sender)
+    if rcpt[0] not in (250, 251):
+      smtp.rset()
+      raise smtplib.SMTPRecipientsRefused({recipient: rcpt})
+    if data_code != 354:
+      smtp.rset()
+      raise smtplib.SMTPDataError(data_code, data_reply)
+    self._write_data(data)
+
+  def close(self):
+    try:
+      self.smtp.quit()
+    except (smtplib.SMTPException, OSError):
+      self.smtp.close()
+
+class SmtpPool(object):
+
+  def __init__(self, host, port, sender, size=4, username=None, password=None,
+               starttls=False, timeout=10, max_messages=100, pipelining=True):
+    self.host = host
+    self.port = port
+    self.sender = sender
+    self.size = size
+    self.username = username
+    self.password = password
+    self.starttls = starttls
+    self.timeout = timeout
+    self.max_messages = max_messages
+    self.pipelining = pipelining
+    if not valid_address(sender):
+      raise ValueError('invalid SMTP sender address {!r}'.format(sender))
+    self.sent = 0
+    self.connects = 0
+    self._idle = queue.LifoQueue()
+    # One permit per connection that may exist, idle or in use.
+    self._permits = threading.BoundedSemaphore(size)
+    self._lock = threading.Lock()
+
+  def _acquire(self):
+    self._permits.acquire()
+    try:
+      return self._idle.get_nowait()
+    except queue.Empty:
+      pass
+    try:
+      connection = _Connection(self)
+    except Exception:
+      self._permits.release()
+      raise
+    with self._lock:
+      self.connects += 1
+    return connection
+
+  def _release(self, connection, broken=False):
+    if broken or connection.sent >= self.max_messages:
+      connection.close()
+    else:
+      self._idle.put(connection)
+    self._permits.release()
+
+  def send(self, recipient, body):
+    error = self.send_many([(recipient, body)])[0]
+    if error is not None:
+      raise error
+
+  def send_many(self, messages):
+    """Sends (recipient, body) pairs over one connection, in order.
+
+    Returns one entry per message: None when it was accepted, otherwise
+    the exception. A refused message doesn't stop the batch; a broken
+    connection, or a streamed body that fails halfway through DATA, fails
+    the rest of it.
+    """
+    try:
+      connection = self._acquire()
+    except Exception as err:
+      logger.warning('could not connect to SMTP relay {}:{}: {}'.format(self.host, self.port, err))
+      return [err] * len(messages)
+    # A connection that sat idle may have been dropped by the relay.
+    may_be_stale = connection.sent > 0
+    results = []
+    try:
+      for recipient, body in messages:
+        try:
+          check_address(recipient)
+          connection.send(self.sender, recipient, message_data(self.sender, recipient, body))
+        except smtplib.SMTPServerDisconnected:
+          if not may_be_stale:
+            raise
+          connection.close()
+          connection = _Connection(self)
+          with self._lock:
+            self.connects += 1
+          # A stream may have been partly consumed; start it over.
+          connection.send(self.sender, recipient, message_data(self.sender, recipient, body))
+        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused,
+                smtplib.SMTPDataError) as err:
+          # The transaction was reset; the connection is still usable.
+          results.append(err)
+          continue
+        finally:
+          may_be_stale = False
+        results.append(None)
+        with self._lock:
+          self.sent += 1
+    except Exception as err:
+      # The connection is in an unknown state, possibly mid-DATA.
+      self._release(connection, broken=True)
+      logger.warning('SMTP connection to {}:{} failed: {}'.format(self.host, self.port, err))
+      return results + [err] * (len(messages) - len(results))
+    self._release(connection)
+    return results
+
+  def close(self):
+    while True:
+      try:
+        self._idle.get_nowait().close()
+      except queue.Empty:
+        return
+
+  def stats(self):
+    return {
+      'sent': self.sent,
+      'connects': self.connects,
+      'idle_connections': self._idle.qsize(),
+      'size': self.size,
+    }
@@ -0,0 +1,199 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Minimal in-process SMTP server that accepts and counts mail, for tests
+# and benchmarks of the SMTP backend without a real mail relay.
+#
+#   python smtp_sink.py --port 2525 --rtt-ms 20
+#
+# It speaks enough ESMTP for smtplib and advertises PIPELINING. To model a
+# remote relay it can hold every batch of replies for --rtt-ms, once per
+# read from the socket, so pipelined commands pay one round trip and
+# unpipelined ones pay one each. Only the standard library is used.
+
+import argparse
+import asyncio
+import threading
+
+from logger import getJSONLogger
+logger = getJSONLogger('emailservice-smtp-sink')
+
+class SmtpSink(object):
+
+  def __init__(self, host='localhost', port=0, rtt=0.0, keep=0):
+    self.host = host
+    self.port = port
+    self.rtt = rtt
+    self.keep = keep
+    self.messages = []
+    self.received = 0
+    self.connections = 0
+    self._loop = None
+    self._server = None
+    self._thread = None
+
+  @property
+  def address(self):
+    return '{}:{}'.format(self.host, self.port)
+
+  def start(self):
+    started = threading.Event()
+    self._thread = threading.Thread(target=self._serve, args=(started,), name='smtp-sink')
+    self._thread.daemon = True
+    self._thread.start()
+    started.wait()
+    return self
+
+  def stop(self):
+    asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+    self._loop.call_soon_threadsafe(self._loop.stop)
+    self._thread.join()
+    self._loop.close()
+
+  async def _shutdown(self):
+    self._server.close()
+    sessions = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    for task in sessions:
+      task.cancel()
+    await asyncio.gather(*sessions, return_exceptions=True)
+
+  def _serve(self, started):
+    self._loop = asyncio.new_event_loop()
+    self._server = self._loop.run_until_complete(
+      asyncio.start_server(self._handle, self.host, self.port))
+    self.port = self._server.sockets[0].getsockname()[1]
+    started.set()
+    self._loop.run_forever()
+
+  async def _handle(self, reader, writer):
+    self.connections += 1
+    session = _Session(self)
+    writer.write(b'220 smtp-sink ESMTP ready\r\n')
+    buffer = bytearray()
+    # Where to resume looking for the end of DATA, so a large message
+    # isn't rescanned on every read.
+    scanned = 0
+    try:
+      while not session.closed:
+        chunk = await reader.read(65536)
+        if not chunk:
+          break
+        buffer += chunk
+        replies = []
+        while not session.closed:
+          if session.in_data:
+            if buffer.startswith(b'.\r\n'):
+              end = 0
+            else:
+              end = buffer.find(b'\r\n.\r\n', max(0, scanned - 4))
+              scanned = len(buffer)
+              if end < 0:
+                break
+              end += 2
+            replies.append(session.end_data(bytes(buffer[:end])))
+            del buffer[:end + 3]
+            scanned = 0
+          else:
+            end = buffer.find(b'\r\n')
+            if end < 0:
+              break
+            replies.append(session.command(bytes(buffer[:end])))
+            del buffer[:end + 2]
+            # DATA's 354 must reach the client before it sends the body.
+            if session.in_data and not buffer:
+              break
+        if replies:
+          if self.rtt:
+            await asyncio.sleep(self.rtt)
+          writer.write(b''.join(replies))
+          await writer.drain()
+    except (ConnectionError, asyncio.CancelledError):
+      # Cancelled by stop(); end the session quietly.
+      pass
+    finally:
+      writer.close()
+
+  def _store(self, sender, recipients, data):
+    self.received += 1
+    if self.keep and len(self.messages) < self.keep:
+      self.messages.append((sender, recipients, data))
+
+class _Session(object):
+
+  def __init__(self, sink):
+    self.sink = sink
+    self.closed = False
+    self.in_data = False
+    self._reset()
+
+  def _reset(self):
+    self.sender = None
+    self.recipients = []
+
+  def command(self, line):
+    verb, _, arg = line.decode('utf-8', 'replace').partition(' ')
+    verb = verb.upper()
+    if verb == 'EHLO':
+      return b'250-smtp-sink\r\n250-PIPELINING\r\n250-8BITMIME\r\n250 SIZE 52428800\r\n'
+    if verb == 'HELO':
+      return b'250 smtp-sink\r\n'
+    if verb == 'MAIL':
+      self._reset()
+      self.sender = arg
+      return b'250 OK\r\n'
+    if verb == 'RCPT':
+      if self.sender is None:
+        return b'503 need MAIL first\r\n'
+      self.recipients.append(arg)
+      return b'250 OK\r\n'
+    if verb == 'DATA':
+      if not self.recipients:
+        return b'554 no valid recipients\r\n'
+      self.in_data = True
+      return b'354 end data with <CR><LF>.<CR><LF>\r\n'
+    if verb == 'RSET':
+      self._reset()
+      return b'250 OK\r\n'
+    if verb == 'NOOP':
+      return b'250 OK\r\n'
+    if verb == 'QUIT':
+      self.closed = True
+      return b'221 bye\r\n'
+    return b'502 command not implemented\r\n'
+
+  def end_data(self, data):
+    self.in_data = False
+    self.sink._store(self.sender, self.recipients,
+                     (b'\r\n' + data).replace(b'\r\n..', b'\r\n.')[2:])
+    self._reset()
+    return b'250 OK queued\r\n'
+
+def main():
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument('--host', default='localhost')
+  parser.add_argument('--port', type=int, default=2525)
+  parser.add_argument('--rtt-ms', type=float, default=0)
+  args = parser.parse_args()
+  sink = SmtpSink(args.host, args.port, rtt=args.rtt_ms / 1000.0).start()
+  logger.info('SMTP sink listening on {}'.format(sink.address))
+  try:
+    threading.Event().wait()
+  except KeyboardInterrupt:
+    logger.info('received {} messages'.format(sink.received))
+    sink.stop()
+
+if __name__ == '__main__':
+  main()
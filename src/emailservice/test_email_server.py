@@ -0,0 +1,136 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import smtplib
+from concurrent import futures
+
+import grpc
+import pytest
+from jinja2 import TemplateError
+
+import demo_pb2
+from email_server import (AsyncEmailService, BaseEmailService, SmtpEmailService,
+                          INVALID_EMAIL, IN_FLIGHT_DETAILS)
+from idempotency import IdempotencyCache
+from send_queue import SendQueue
+from smtp_backend import SmtpPool
+from smtp_sink import SmtpSink
+
+# Recipients that make FakeEmailService fail, and how.
+ERRORS = {
+  'template@example.com': TemplateError('bad template'),
+  'relay@example.com': smtplib.SMTPRecipientsRefused({'relay@example.com': (550, b'no such user')}),
+}
+
+class FakeEmailService(BaseEmailService):
+  def __init__(self):
+    self.sent = []
+
+  def deliver(self, email, order):
+    if email in ERRORS:
+      raise ERRORS[email]
+    self.sent.append(email)
+
+class FakeAsyncEmailService(AsyncEmailService):
+  def __init__(self):
+    self.sent = []
+
+  async def deliver_async(self, email, order):
+    await asyncio.sleep(0)
+    if email in ERRORS:
+      raise ERRORS[email]
+    self.sent.append(email)
+
+def batch(*emails):
+  return demo_pb2.SendOrderConfirmationsRequest(requests=[
+    demo_pb2.SendOrderConfirmationRequest(email=email, order=demo_pb2.OrderResult(order_id='order-{}'.format(i)))
+    for i, email in enumerate(emails)])
+
+STATUS_CODES = {code.value[0]: code for code in grpc.StatusCode}
+
+def codes(response):
+  return [(STATUS_CODES[r.code], r.message) for r in response.results]
+
+MIXED = ('a@example.com', 'not an address', 'template@example.com',
+         'relay@example.com', 'b@example.com')
+EXPECTED = [
+  (grpc.StatusCode.OK, ''),
+  (grpc.StatusCode.INVALID_ARGUMENT, INVALID_EMAIL),
+  (grpc.StatusCode.INTERNAL, 'An error occurred when preparing the confirmation mail.'),
+  (grpc.StatusCode.INTERNAL, 'An error occurred when sending the email.'),
+  (grpc.StatusCode.OK, ''),
+]
+
+@pytest.mark.parametrize('chunk_size, executor', [(50, False), (2, False), (2, True)])
+def test_batch_maps_errors_per_item(chunk_size, executor):
+  service = FakeEmailService()
+  service.batch_chunk_size = chunk_size
+  if executor:
+    service.batch_executor = futures.ThreadPoolExecutor(max_workers=3)
+  response = service.SendOrderConfirmations(batch(*MIXED), None)
+  if executor:
+    service.batch_executor.shutdown()
+  assert codes(response) == EXPECTED
+  assert sorted(service.sent) == ['a@example.com', 'b@example.com']
+
+def test_async_batch_maps_errors_per_item():
+  service = FakeAsyncEmailService()
+  service.batch_chunk_size = 2
+  response = asyncio.run(service.SendOrderConfirmations(batch(*MIXED), None))
+  assert codes(response) == EXPECTED
+
+def test_batch_duplicates_and_in_flight():
+  service = FakeEmailService()
+  service.idempotency = IdempotencyCache(ttl=60)
+  first = service.SendOrderConfirmations(batch('a@example.com', 'relay@example.com'), None)
+  assert [code for code, _ in codes(first)] == [grpc.StatusCode.OK, grpc.StatusCode.INTERNAL]
+
+  # order-1 is being sent by another request right now.
+  service.idempotency.claim('order-1', 'b@example.com')
+  again = service.SendOrderConfirmations(
+    batch('a@example.com', 'b@example.com', 'relay@example.com'), None)
+  assert codes(again)[:2] == [(grpc.StatusCode.OK, 'duplicate, already sent'),
+                              (grpc.StatusCode.ABORTED, IN_FLIGHT_DETAILS)]
+  # The failed email was released, so it is tried again.
+  assert codes(again)[2][0] == grpc.StatusCode.INTERNAL
+  assert service.sent == ['a@example.com']
+
+def test_batch_rejects_what_the_queue_cannot_hold():
+  service = FakeEmailService()
+  service.send_queue = SendQueue(service.deliver, workers=1, max_depth=2)
+  response = service.SendOrderConfirmations(
+    batch('a@example.com', 'not an address', 'b@example.com', 'c@example.com'), None)
+  assert [code for code, _ in codes(response)] == [
+    grpc.StatusCode.OK, grpc.StatusCode.INVALID_ARGUMENT,
+    grpc.StatusCode.OK, grpc.StatusCode.RESOURCE_EXHAUSTED]
+  service.send_queue.start()
+  service.send_queue.stop()
+  assert service.sent == ['a@example.com', 'b@example.com']
+
+def test_smtp_batch_sends_valid_items():
+  sink = SmtpSink(keep=10).start()
+  pool = SmtpPool(sink.host, sink.port, 'no-reply@example.com', size=1)
+  try:
+    service = SmtpEmailService(pool)
+    response = service.SendOrderConfirmations(
+      batch('a@example.com', 'a b@example.com', 'b@example.com'), None)
+  finally:
+    pool.close()
+    sink.stop()
+  assert [code for code, _ in codes(response)] == [
+    grpc.StatusCode.OK, grpc.StatusCode.INVALID_ARGUMENT, grpc.StatusCode.OK]
+  assert [m[1] for m in sink.messages] == [['TO:<a@example.com>'], ['TO:<b@example.com>']]
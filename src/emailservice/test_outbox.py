@@ -0,0 +1,127 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import smtplib
+import sqlite3
+import types
+
+import pytest
+
+import demo_pb2
+from email_server import replayOutbox
+from outbox import Outbox
+from send_queue import SendQueue
+from smtp_backend import permanent_error
+
+def order(order_id):
+  return demo_pb2.OrderResult(order_id=order_id, shipping_tracking_id='track-' + order_id)
+
+@pytest.fixture
+def path(tmp_path):
+  return str(tmp_path / 'outbox.db')
+
+def reopen(outbox, **kwargs):
+  # Flush the writer and read back what a restarted server would see.
+  outbox.close()
+  return Outbox(outbox.path, **kwargs)
+
+def test_pending_survives_restart(path):
+  outbox = Outbox(path)
+  ids = outbox.append_many([('a@example.com', order('1')), ('b@example.com', order('2'))])
+  ids.append(outbox.append('c@example.com', order('3')))
+  outbox.complete(ids[1])
+  outbox = reopen(outbox)
+  try:
+    assert [(i, email, o.order_id) for i, email, o in outbox.pending()] == [
+      (ids[0], 'a@example.com', '1'), (ids[2], 'c@example.com', '3')]
+  finally:
+    outbox.close()
+
+def test_gives_up_after_max_attempts(path):
+  outbox = Outbox(path, max_attempts=3)
+  key = outbox.append('a@example.com', order('1'))
+  for _ in range(2):
+    outbox.fail(key)
+  outbox = reopen(outbox, max_attempts=3)
+  assert [row[0] for row in outbox.pending()] == [key]
+  outbox.fail(key)
+  outbox = reopen(outbox, max_attempts=3)
+  try:
+    assert outbox.pending() == []
+  finally:
+    outbox.close()
+
+def test_gives_up_on_permanent_failure(path):
+  outbox = Outbox(path)
+  kept = outbox.append('a@example.com', order('1'))
+  dropped = outbox.append('b@example.com', order('2'))
+  outbox.fail(kept)
+  outbox.fail(dropped, permanent=True)
+  outbox.fail(dropped, permanent=True)
+  outbox.close()
+  assert outbox.stats()['failed'] == 1
+  outbox = Outbox(path)
+  try:
+    assert [row[0] for row in outbox.pending()] == [kept]
+  finally:
+    outbox.close()
+
+def test_upgrades_old_schema(path):
+  conn = sqlite3.connect(path)
+  conn.execute('CREATE TABLE outbox (id INTEGER PRIMARY KEY AUTOINCREMENT, created REAL NOT NULL,'
+               ' email TEXT NOT NULL, order_result BLOB NOT NULL)')
+  conn.execute('INSERT INTO outbox (created, email, order_result) VALUES (0, ?, ?)',
+               ('a@example.com', order('1').SerializeToString()))
+  conn.commit()
+  conn.close()
+  outbox = Outbox(path, max_attempts=1)
+  try:
+    (key, email, _), = outbox.pending()
+    assert email == 'a@example.com'
+    outbox.fail(key)
+    outbox = reopen(outbox)
+    assert outbox.pending() == []
+  finally:
+    outbox.close()
+
+@pytest.mark.parametrize('error, replayed_again', [
+  (smtplib.SMTPServerDisconnected('relay went away'), True),
+  (smtplib.SMTPRecipientsRefused({'bad@example.com': (550, b'5.1.1 no such user')}), False),
+])
+def test_replay(path, error, replayed_again):
+  outbox = Outbox(path)
+  outbox.append('good@example.com', order('1'))
+  bad = outbox.append('bad@example.com', order('2'))
+  outbox = reopen(outbox)
+
+  sent = []
+  def deliver(email, o):
+    if email == 'bad@example.com':
+      raise error
+    sent.append((email, o.order_id))
+  send_queue = SendQueue(
+    deliver, workers=1, on_delivered=outbox.complete,
+    on_error=lambda key, err: outbox.fail(key, permanent_error(err)))
+  send_queue.start()
+  replayOutbox(types.SimpleNamespace(outbox=outbox, send_queue=send_queue))
+  send_queue.stop()
+  assert sent == [('good@example.com', '1')]
+
+  outbox = reopen(outbox)
+  try:
+    assert [row[0] for row in outbox.pending()] == ([bad] if replayed_again else [])
+  finally:
+    outbox.close()
@@ -0,0 +1,89 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+from send_queue import SendQueue
+
+class Recorder(object):
+  def __init__(self, fail=()):
+    self.fail = set(fail)
+    self.sent = []
+    self.delivered = []
+    self.errors = []
+    self.lock = threading.Lock()
+
+  def deliver(self, email, order):
+    if email in self.fail:
+      raise RuntimeError('cannot send to ' + email)
+    with self.lock:
+      self.sent.append(email)
+
+  def deliver_batch(self, items):
+    errors = []
+    for email, order in items:
+      try:
+        self.deliver(email, order)
+        errors.append(None)
+      except RuntimeError as err:
+        errors.append(err)
+    return errors
+
+  def on_delivered(self, key):
+    with self.lock:
+      self.delivered.append(key)
+
+  def on_error(self, key, err):
+    with self.lock:
+      self.errors.append((key, str(err)))
+
+def test_rejects_when_full():
+  recorder = Recorder()
+  send_queue = SendQueue(recorder.deliver, workers=1, max_depth=2)
+  assert send_queue.room() == 2
+  assert send_queue.submit('a@example.com', None)
+  assert send_queue.submit('b@example.com', None)
+  assert send_queue.full() and send_queue.room() == 0
+  assert not send_queue.submit('c@example.com', None)
+  stats = send_queue.stats()
+  assert (stats['enqueued'], stats['rejected']) == (2, 1)
+
+def test_stop_drains_the_queue():
+  recorder = Recorder()
+  send_queue = SendQueue(recorder.deliver, workers=2, max_depth=100)
+  for i in range(50):
+    send_queue.submit('user{}@example.com'.format(i), None)
+  send_queue.start()
+  send_queue.stop()
+  assert sorted(recorder.sent) == sorted('user{}@example.com'.format(i) for i in range(50))
+  assert send_queue.stats()['delivered'] == 50
+
+def test_callbacks_get_keys():
+  recorder = Recorder(fail=['bad@example.com'])
+  failed = []
+  send_queue = SendQueue(
+    recorder.deliver, workers=1, on_delivered=recorder.on_delivered,
+    deliver_batch=recorder.deliver_batch, batch_size=10,
+    on_failed=lambda email, order: failed.append(email), on_error=recorder.on_error)
+  for key, email in enumerate(['a@example.com', 'bad@example.com', 'b@example.com']):
+    send_queue.submit(email, None, key)
+  send_queue.start()
+  send_queue.stop()
+  assert recorder.sent == ['a@example.com', 'b@example.com']
+  assert recorder.delivered == [0, 2]
+  assert recorder.errors == [(1, 'cannot send to bad@example.com')]
+  assert failed == ['bad@example.com']
+  assert send_queue.stats()['failed'] == 1
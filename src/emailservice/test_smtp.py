@@ -0,0 +1,143 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import email
+import email.policy
+import smtplib
+
+import pytest
+
+import smtp_sink
+from async_smtp import AsyncSmtpPool
+from smtp_backend import SmtpPool, check_address, parse_address
+
+SENDER = 'no-reply@example.com'
+# A lone dot would end DATA early if it weren't stuffed.
+DOTTED = '<p>one</p>\n.\n.hidden\n..two\n'
+
+class StrictSession(smtp_sink._Session):
+  """Refuses recipients at refused.example but, like some relays, still
+  answers DATA with 354 so the client has to close the transaction."""
+
+  def command(self, line):
+    verb = line[:4].upper()
+    if verb == b'RCPT' and b'@refused.example' in line:
+      return b'550 5.1.1 no such user\r\n'
+    if verb == b'DATA' and self.sender is not None and not self.recipients:
+      self.in_data = True
+      return b'354 go ahead\r\n'
+    return super().command(line)
+
+@pytest.fixture
+def sink(monkeypatch):
+  monkeypatch.setattr(smtp_sink, '_Session', StrictSession)
+  sink = smtp_sink.SmtpSink(keep=100).start()
+  yield sink
+  sink.stop()
+
+def drop_connections(sink):
+  # What a relay closing idle connections looks like to the pool.
+  async def drop():
+    sessions = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+    for task in sessions:
+      task.cancel()
+    await asyncio.gather(*sessions, return_exceptions=True)
+  asyncio.run_coroutine_threadsafe(drop(), sink._loop).result()
+
+def html_of(data):
+  return email.message_from_bytes(data, policy=email.policy.default).get_content()
+
+def test_parse_address():
+  assert parse_address('smtp.example.com:25') == ('smtp.example.com', 25)
+  assert parse_address('10.0.0.1:2525') == ('10.0.0.1', 2525)
+  assert parse_address('[::1]:25') == ('::1', 25)
+  for address in ('smtp.example.com', 'smtp.example.com:', ':25', '::1', '[::1]', 'host:smtp'):
+    with pytest.raises(ValueError):
+      parse_address(address)
+
+def test_check_address():
+  check_address('user@example.com')
+  for address in ('user', 'a@b.c\r\nRCPT TO:<x@y.z>', 'User <user@example.com>', 'a b@c.d'):
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+      check_address(address)
+
+@pytest.mark.parametrize('pipelining', [True, False])
+def test_refused_recipients_keep_connection_usable(sink, pipelining):
+  pool = SmtpPool(sink.host, sink.port, SENDER, size=1, pipelining=pipelining)
+  results = pool.send_many([
+    ('a@refused.example', '<p>1</p>'),
+    ('not an address', '<p>2</p>'),
+    ('b@example.com', '<p>3</p>'),
+  ])
+  pool.close()
+  assert isinstance(results[0], smtplib.SMTPRecipientsRefused)
+  assert isinstance(results[1], smtplib.SMTPRecipientsRefused)
+  assert results[2] is None
+  assert pool.connects == 1
+  delivered = [m for m in sink.messages if m[1]]
+  assert [m[1] for m in delivered] == [['TO:<b@example.com>']]
+  assert html_of(delivered[0][2]).strip() == '<p>3</p>'
+
+@pytest.mark.parametrize('pipelining', [True, False])
+def test_async_refused_recipients_keep_connection_usable(sink, pipelining):
+  async def run():
+    pool = AsyncSmtpPool(sink.host, sink.port, SENDER, size=1, pipelining=pipelining)
+    results = await pool.send_many([
+      ('a@refused.example', '<p>1</p>'),
+      ('b@example.com', '<p>2</p>'),
+      ('c@refused.example', '<p>3</p>'),
+      ('d@example.com', '<p>4</p>'),
+    ])
+    await pool.close()
+    return pool, results
+  pool, results = asyncio.run(run())
+  assert [type(r) for r in results] == [
+    smtplib.SMTPRecipientsRefused, type(None), smtplib.SMTPRecipientsRefused, type(None)]
+  assert pool.connects == 1
+  delivered = [m for m in sink.messages if m[1]]
+  assert [m[1] for m in delivered] == [['TO:<b@example.com>'], ['TO:<d@example.com>']]
+  assert [html_of(m[2]).strip() for m in delivered] == ['<p>2</p>', '<p>4</p>']
+
+@pytest.mark.parametrize('body', [DOTTED, lambda: iter(DOTTED.splitlines(True))],
+                         ids=['bytes', 'streamed'])
+def test_dot_stuffing(sink, body):
+  pool = SmtpPool(sink.host, sink.port, SENDER, size=1)
+  pool.send('a@example.com', body)
+  pool.send('b@example.com', '<p>after</p>')
+  pool.close()
+  assert html_of(sink.messages[0][2]).replace('\r\n', '\n') == DOTTED
+  assert html_of(sink.messages[1][2]).strip() == '<p>after</p>'
+
+def test_stale_connection_is_replaced(sink):
+  pool = SmtpPool(sink.host, sink.port, SENDER, size=1)
+  pool.send('a@example.com', '<p>1</p>')
+  drop_connections(sink)
+  pool.send('b@example.com', '<p>2</p>')
+  pool.close()
+  assert pool.connects == 2
+  assert [m[1] for m in sink.messages] == [['TO:<a@example.com>'], ['TO:<b@example.com>']]
+
+def test_async_stale_connection_is_replaced(sink):
+  async def run():
+    pool = AsyncSmtpPool(sink.host, sink.port, SENDER, size=1)
+    await pool.send('a@example.com', '<p>1</p>')
+    await asyncio.get_running_loop().run_in_executor(None, drop_connections, sink)
+    await pool.send('b@example.com', '<p>2</p>')
+    await pool.close()
+    return pool
+  assert asyncio.run(run()).connects == 2
+  assert sink.received == 2
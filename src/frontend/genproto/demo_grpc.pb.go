@@ -15,7 +15,7 @@
 // Code generated by protoc-gen-go-grpc. DO NOT EDIT.
 // versions:
 // - protoc-gen-go-grpc v1.5.1
-// - protoc             v3.6.1
+// - protoc             v3.21.12
 // source: demo.proto
 
 package hipstershop
@@ -873,7 +873,8 @@ var PaymentService_ServiceDesc = grpc.ServiceDesc{
 }
 
 const (
-	EmailService_SendOrderConfirmation_FullMethodName = "/hipstershop.EmailService/SendOrderConfirmation"
+	EmailService_SendOrderConfirmation_FullMethodName  = "/hipstershop.EmailService/SendOrderConfirmation"
+	EmailService_SendOrderConfirmations_FullMethodName = "/hipstershop.EmailService/SendOrderConfirmations"
 )
 
 // EmailServiceClient is the client API for EmailService service.
@@ -881,6 +882,7 @@ const (
 // For semantics around ctx use and closing/ending streaming RPCs, please refer to https://pkg.go.dev/google.golang.org/grpc/?tab=doc#ClientConn.NewStream.
 type EmailServiceClient interface {
 	SendOrderConfirmation(ctx context.Context, in *SendOrderConfirmationRequest, opts ...grpc.CallOption) (*Empty, error)
+	SendOrderConfirmations(ctx context.Context, in *SendOrderConfirmationsRequest, opts ...grpc.CallOption) (*SendOrderConfirmationsResponse, error)
 }
 
 type emailServiceClient struct {
@@ -901,11 +903,22 @@ func (c *emailServiceClient) SendOrderConfirmation(ctx context.Context, in *Send
 	return out, nil
 }
 
+func (c *emailServiceClient) SendOrderConfirmations(ctx context.Context, in *SendOrderConfirmationsRequest, opts ...grpc.CallOption) (*SendOrderConfirmationsResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(SendOrderConfirmationsResponse)
+	err := c.cc.Invoke(ctx, EmailService_SendOrderConfirmations_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 // EmailServiceServer is the server API for EmailService service.
 // All implementations must embed UnimplementedEmailServiceServer
 // for forward compatibility.
 type EmailServiceServer interface {
 	SendOrderConfirmation(context.Context, *SendOrderConfirmationRequest) (*Empty, error)
+	SendOrderConfirmations(context.Context, *SendOrderConfirmationsRequest) (*SendOrderConfirmationsResponse, error)
 	mustEmbedUnimplementedEmailServiceServer()
 }
 
@@ -919,6 +932,9 @@ type UnimplementedEmailServiceServer struct{}
 func (UnimplementedEmailServiceServer) SendOrderConfirmation(context.Context, *SendOrderConfirmationRequest) (*Empty, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method SendOrderConfirmation not implemented")
 }
+func (UnimplementedEmailServiceServer) SendOrderConfirmations(context.Context, *SendOrderConfirmationsRequest) (*SendOrderConfirmationsResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method SendOrderConfirmations not implemented")
+}
 func (UnimplementedEmailServiceServer) mustEmbedUnimplementedEmailServiceServer() {}
 func (UnimplementedEmailServiceServer) testEmbeddedByValue()                      {}
 
@@ -958,6 +974,24 @@ func _EmailService_SendOrderConfirmation_Handler(srv interface{}, ctx context.Co
 	return interceptor(ctx, in, info, handler)
 }
 
+func _EmailService_SendOrderConfirmations_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(SendOrderConfirmationsRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(EmailServiceServer).SendOrderConfirmations(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: EmailService_SendOrderConfirmations_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(EmailServiceServer).SendOrderConfirmations(ctx, req.(*SendOrderConfirmationsRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 // EmailService_ServiceDesc is the grpc.ServiceDesc for EmailService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -969,6 +1003,10 @@ var EmailService_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "SendOrderConfirmation",
 			Handler:    _EmailService_SendOrderConfirmation_Handler,
 		},
+		{
+			MethodName: "SendOrderConfirmations",
+			Handler:    _EmailService_SendOrderConfirmations_Handler,
+		},
 	},
 	Streams:  []grpc.StreamDesc{},
 	Metadata: "demo.proto",
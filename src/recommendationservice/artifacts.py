@@ -0,0 +1,228 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Hot-swappable recommendation artifacts.
+#
+# Offline jobs publish each artifact version as a directory under the watched
+# root:
+#
+#   <root>/<version>/manifest.json
+#   <root>/<version>/<files...>
+#
+# manifest.json looks like
+#
+#   {"schema": 1, "version": "2026-10-01",
+#    "files": {"cooc.json": {"kind": "cooccurrence", "sha256": "..."}}}
+#
+# Publishers must make each version appear complete: write it to a directory
+# whose name starts with '.' (ignored here) on the same filesystem, then
+# rename it to <root>/<version>. A version copied into place file by file
+# may be seen half written; a file that is missing or unreadable leaves the
+# version pending, and it is retried on the next poll.
+#
+# The newest version (by directory name) is loaded on a background thread,
+# checked against the manifest, and swapped in with a single reference
+# assignment. A version that fails validation is skipped until one of its
+# files changes, and the previously loaded version keeps serving.
+
+import array
+import hashlib
+import json
+import os
+import threading
+import time
+
+from logger import getJSONLogger
+logger = getJSONLogger('recommendationservice-artifacts')
+
+MANIFEST = 'manifest.json'
+SCHEMA_VERSION = 1
+
+
+class ArtifactError(ValueError):
+    pass
+
+
+def _load_cooccurrence(data):
+    # {"<product id>": ["<related id>", ...]}
+    table = json.loads(data)
+    if not isinstance(table, dict):
+        raise ArtifactError("cooccurrence table must be an object")
+    for product_id, related in table.items():
+        if not isinstance(related, list) or not all(isinstance(r, str) for r in related):
+            raise ArtifactError("cooccurrence entry {} must be a list of ids".format(product_id))
+    return {k: tuple(v) for k, v in table.items()}
+
+
+def _load_vectors(data):
+    # {"dim": N, "vectors": {"<product id>": [N floats]}}
+    doc = json.loads(data)
+    try:
+        dim = int(doc["dim"])
+        vectors = doc["vectors"]
+    except (KeyError, TypeError, ValueError):
+        raise ArtifactError("vectors must have 'dim' and 'vectors'")
+    table = {}
+    for product_id, vector in vectors.items():
+        if len(vector) != dim:
+            raise ArtifactError("vector {} has dimension {}, expected {}".format(
+                product_id, len(vector), dim))
+        table[product_id] = array.array('f', vector)
+    return table
+
+
+LOADERS = {
+    'cooccurrence': _load_cooccurrence,
+    'vectors': _load_vectors,
+}
+
+
+class Artifacts(object):
+    """One validated, immutable artifact version."""
+
+    def __init__(self, name, version, tables):
+        self.name = name
+        self.version = version
+        self.tables = tables
+
+    def get(self, kind):
+        return self.tables.get(kind)
+
+
+def load_version(path):
+    with open(os.path.join(path, MANIFEST)) as f:
+        try:
+            manifest = json.load(f)
+        except ValueError as err:
+            raise ArtifactError("invalid manifest: {}".format(err))
+    if manifest.get("schema") != SCHEMA_VERSION:
+        raise ArtifactError("unsupported schema {!r}".format(manifest.get("schema")))
+    files = manifest.get("files")
+    if not isinstance(files, dict) or not files:
+        raise ArtifactError("manifest lists no files")
+
+    tables = {}
+    for name, spec in files.items():
+        kind = spec.get("kind")
+        if kind not in LOADERS:
+            raise ArtifactError("{}: unknown kind {!r}".format(name, kind))
+        with open(os.path.join(path, name), 'rb') as f:
+            data = f.read()
+        if hashlib.sha256(data).hexdigest() != spec.get("sha256"):
+            raise ArtifactError("{}: checksum mismatch".format(name))
+        tables[kind] = LOADERS[kind](data)
+    name = os.path.basename(os.path.normpath(path))
+    return Artifacts(name, manifest.get("version", name), tables)
+
+
+class ArtifactStore(object):
+    """Watches an artifact directory and serves the newest valid version."""
+
+    def __init__(self, root, poll_interval=30):
+        self._root = root
+        self._poll_interval = poll_interval
+        self._current = None
+        # version name -> fingerprint of the directory when it was rejected
+        self._failed = {}
+        self._stopped = threading.Event()
+        self.loads = 0
+        self.failures = 0
+        self.last_load_seconds = 0.0
+        self.loaded_at = 0.0
+
+    def get(self):
+        return self._current
+
+    def stats(self):
+        current = self._current
+        return {
+            "version": current.version if current else None,
+            "loaded_at": self.loaded_at,
+            "last_load_seconds": self.last_load_seconds,
+            "loads": self.loads,
+            "failures": self.failures,
+            "rejected": sorted(self._failed),
+        }
+
+    def _fingerprint(self, name):
+        # Names, sizes and mtimes of the version's files: a rejected version
+        # is only retried once something in it has been rewritten.
+        path = os.path.join(self._root, name)
+        try:
+            return tuple(sorted((e.name, e.stat().st_size, e.stat().st_mtime_ns)
+                                for e in os.scandir(path)))
+        except OSError:
+            return None
+
+    def _latest(self):
+        try:
+            names = os.listdir(self._root)
+        except OSError:
+            return None
+        candidates = [n for n in names
+                      if not n.startswith('.')
+                      and os.path.isfile(os.path.join(self._root, n, MANIFEST))
+                      and (n not in self._failed
+                           or self._failed[n] != self._fingerprint(n))]
+        return max(candidates) if candidates else None
+
+    def poll(self):
+        name = self._latest()
+        current = self._current
+        if name is None or (current is not None and current.name == name):
+            return False
+        fingerprint = self._fingerprint(name)
+        start = time.time()
+        try:
+            artifacts = load_version(os.path.join(self._root, name))
+        except OSError as err:
+            # Most likely still being published; try again next poll.
+            logger.info("artifact version {} not ready: {}".format(name, err))
+            return False
+        except Exception as err:
+            self._failed[name] = fingerprint
+            self.failures += 1
+            logger.warning("rejected artifact version {}: {}; keeping {}".format(
+                name, err, current.version if current else "none"),
+                extra={"artifact_failures": self.failures})
+            return False
+        elapsed = time.time() - start
+        self._current = artifacts
+        self.loads += 1
+        self.last_load_seconds = elapsed
+        self.loaded_at = time.time()
+        logger.info("artifact version {} loaded in {:.1f}ms".format(
+            artifacts.version, elapsed * 1000),
+            extra={"artifact_version": artifacts.version,
+                   "artifact_load_seconds": elapsed})
+        return True
+
+    def start(self):
+        thread = threading.Thread(target=self._run, name="artifact-watch")
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def _run(self):
+        while True:
+            try:
+                self.poll()
+            except Exception as err:
+                logger.warning("artifact poll failed: {}".format(err))
+            if self._stopped.wait(self._poll_interval):
+                return
@@ -0,0 +1,113 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Compares the resident memory of the catalog representations.
+#
+#   python bench_catalog_memory.py --sizes 100000 1000000
+#
+# Each representation is loaded in a fresh interpreter and the RSS growth is
+# reported, since protobuf messages are allocated outside the Python heap and
+# tracemalloc cannot see them.
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import catalog_snapshot
+import demo_pb2
+from catalog_store import CompactCatalog
+from synthetic_catalog import generate_products
+
+REPRESENTATIONS = ('protobuf', 'compact', 'compact-mmap')
+
+
+def rss_bytes():
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def load(representation, pb_path, snap_path):
+    if representation == 'protobuf':
+        with open(pb_path, 'rb') as f:
+            data = f.read()
+        catalog = demo_pb2.ListProductsResponse.FromString(data)
+        del data
+    elif representation == 'compact':
+        snapshot = catalog_snapshot.CatalogSnapshot(snap_path)
+        sections = {k: bytes(v) for k, v in snapshot.sections().items()}
+        snapshot.close()
+        catalog = CompactCatalog.from_sections(sections)
+        del sections
+    else:
+        snapshot = catalog_snapshot.CatalogSnapshot(snap_path)
+        catalog = (CompactCatalog.from_sections(snapshot.sections()), snapshot)
+    return catalog
+
+
+def child(args):
+    gc.collect()
+    before = rss_bytes()
+    start = time.time()
+    catalog = load(args.child, args.pb, args.snap)
+    elapsed = time.time() - start
+    gc.collect()
+    json.dump({'rss_bytes': rss_bytes() - before, 'load_seconds': elapsed}, sys.stdout)
+    del catalog
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100000, 1000000])
+    parser.add_argument('--child', choices=REPRESENTATIONS, help=argparse.SUPPRESS)
+    parser.add_argument('--pb', help=argparse.SUPPRESS)
+    parser.add_argument('--snap', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child(args)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            response = generate_products(n)
+            pb_path = os.path.join(tmp, 'catalog.pb')
+            snap_path = os.path.join(tmp, 'catalog.snap')
+            with open(pb_path, 'wb') as f:
+                f.write(response.SerializeToString())
+            start = time.time()
+            store = CompactCatalog.from_products(response.products)
+            build_seconds = time.time() - start
+            catalog_snapshot.write_snapshot(snap_path, '00' * 32, store.to_sections())
+            del response, store
+            for representation in REPRESENTATIONS:
+                out = subprocess.check_output([
+                    sys.executable, __file__, '--child', representation,
+                    '--pb', pb_path, '--snap', snap_path])
+                result = json.loads(out)
+                result.update({'products': n, 'representation': representation})
+                if representation == 'compact':
+                    result['build_seconds'] = build_seconds
+                results.append(result)
+    json.dump({'benchmark': 'catalog_memory', 'results': results}, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures memory and CPU of the exclusion set implementations.
+#
+#   python bench_exclusion.py --catalog-size 1000000 --excluded 10 1000 100000
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from exclusion import MODES, new_exclusion
+
+
+def build(mode, catalog_size, excluded, fp_rate, members):
+    exclusion = new_exclusion(mode, catalog_size, excluded, fp_rate)
+    for ordinal in members:
+        exclusion.add(ordinal)
+    return exclusion
+
+
+def run(mode, catalog_size, excluded, fp_rate, probes):
+    rng = random.Random(excluded)
+    members = rng.sample(range(catalog_size), excluded)
+
+    # Memory and time are measured on separate builds; tracing allocations
+    # slows the build down several times over.
+    tracemalloc.start()
+    exclusion = build(mode, catalog_size, excluded, fp_rate, members)
+    nbytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del exclusion
+
+    start = time.perf_counter()
+    exclusion = build(mode, catalog_size, excluded, fp_rate, members)
+    build_seconds = time.perf_counter() - start
+
+    queries = [rng.randrange(catalog_size) for _ in range(probes)]
+    start = time.perf_counter()
+    hits = sum(1 for q in queries if q in exclusion)
+    probe_seconds = time.perf_counter() - start
+
+    member_set = set(members)
+    negatives = [q for q in queries if q not in member_set]
+    false_positives = sum(1 for q in negatives if q in exclusion)
+    return {
+        'mode': mode,
+        # bitset mode hands out a set for small exclusions
+        'implementation': type(exclusion).__name__,
+        'catalog_size': catalog_size,
+        'excluded': excluded,
+        'bytes': nbytes,
+        'build_seconds': build_seconds,
+        'probe_ns': probe_seconds / probes * 1e9,
+        'hits': hits,
+        'false_positive_rate': false_positives / len(negatives) if negatives else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--catalog-size', type=int, default=1000000)
+    parser.add_argument('--excluded', type=int, nargs='+', default=[10, 1000, 100000])
+    parser.add_argument('--fp-rate', type=float, default=0.01)
+    parser.add_argument('--probes', type=int, default=100000)
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    args = parser.parse_args()
+
+    results = [run(mode, args.catalog_size, excluded, args.fp_rate, args.probes)
+               for excluded in args.excluded for mode in args.modes]
+    json.dump({'benchmark': 'exclusion', 'fp_rate': args.fp_rate, 'results': results},
+              sys.stdout, indent=2)
+    print()
+
+
+if __name__ == '__main__':
+    main()
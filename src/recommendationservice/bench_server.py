@@ -0,0 +1,181 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# End-to-end ListRecommendations benchmark over real gRPC on localhost.
+#
+#   python bench_server.py --products 100000 --clients 8 --duration 10
+#   python bench_server.py --exclusion-mode bloom --output result.json
+#   python bench_server.py --products-json ../productcatalogservice/products.json
+#
+# The recommendation server, a synthetic catalog and N closed-loop clients
+# all run in this process. Each client has its own channel and sends the
+# next request as soon as the previous one returns. CPU per request is
+# process CPU time (server and clients together) divided by requests, so
+# compare it between runs rather than reading it as server cost alone.
+#
+# Service logging is muted unless --log is given, so stdout is a single
+# JSON document.
+
+import argparse
+import json
+import logging
+import random
+import resource
+import sys
+import threading
+import time
+from concurrent import futures
+
+import grpc
+
+import demo_pb2
+import demo_pb2_grpc
+from catalog_cache import CatalogCache
+from exclusion import MODES
+from fake_catalog import load_products, start_fake_catalog
+from recommendation_server import RecommendationService
+from synthetic_catalog import generate_products
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * q))]
+
+
+def cpu_seconds():
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def start_server(catalog, args):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=args.server_workers))
+    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(
+        RecommendationService(catalog, exclusion_mode=args.exclusion_mode), server)
+    port = server.add_insecure_port('localhost:0')
+    server.start()
+    return server, 'localhost:{}'.format(port)
+
+
+def client(addr, args, product_ids, seed, barrier, latencies, errors):
+    rng = random.Random(seed)
+    with grpc.insecure_channel(addr) as channel:
+        stub = demo_pb2_grpc.RecommendationServiceStub(channel)
+        # Warm the connection up before the clock starts.
+        stub.ListRecommendations(demo_pb2.ListRecommendationsRequest(user_id='warmup'))
+        barrier.wait()
+        deadline = time.perf_counter() + args.duration if args.duration else float('inf')
+        sent = 0
+        while time.perf_counter() < deadline and (not args.requests or sent < args.requests):
+            request = demo_pb2.ListRecommendationsRequest(
+                user_id='bench-{}'.format(seed),
+                product_ids=[rng.choice(product_ids) for _ in range(args.cart_size)])
+            start = time.perf_counter()
+            try:
+                stub.ListRecommendations(request, timeout=args.timeout)
+                latencies.append(time.perf_counter() - start)
+            except grpc.RpcError:
+                errors.append(1)
+            sent += 1
+
+
+def run(args):
+    if args.products_json:
+        products = load_products(args.products_json)
+    else:
+        products = generate_products(args.products)
+    product_ids = [product.id for product in products.products]
+    catalog_server, catalog_addr, _ = start_fake_catalog(products)
+    # Large synthetic catalogs are bigger than gRPC's 4MB default.
+    catalog = CatalogCache(grpc.insecure_channel(
+        catalog_addr, options=[('grpc.max_receive_message_length', -1)]))
+    catalog.refresh()
+    server, addr = start_server(catalog, args)
+
+    barrier = threading.Barrier(args.clients + 1)
+    results = [([], []) for _ in range(args.clients)]
+    threads = [threading.Thread(target=client, args=(
+        addr, args, product_ids, i, barrier, latencies, errors))
+               for i, (latencies, errors) in enumerate(results)]
+    for thread in threads:
+        thread.start()
+    # Every client is connected once the barrier opens.
+    barrier.wait()
+    wall_start, cpu_start = time.perf_counter(), cpu_seconds()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - wall_start
+    cpu = cpu_seconds() - cpu_start
+
+    server.stop(0)
+    catalog_server.stop(0)
+
+    latencies = sorted(l for latencies, _ in results for l in latencies)
+    errors = sum(len(errors) for _, errors in results)
+    requests = len(latencies) + errors
+    return {
+        'benchmark': 'recommendation_server',
+        'products': len(product_ids),
+        'clients': args.clients,
+        'cart_size': args.cart_size,
+        'exclusion_mode': args.exclusion_mode,
+        'server_workers': args.server_workers,
+        'requests': requests,
+        'errors': errors,
+        'seconds': wall,
+        'throughput_rps': requests / wall if wall else 0.0,
+        'latency_us': {
+            'p50': percentile(latencies, 0.50) * 1e6,
+            'p99': percentile(latencies, 0.99) * 1e6,
+            'p999': percentile(latencies, 0.999) * 1e6,
+            'max': (latencies[-1] if latencies else 0.0) * 1e6,
+        },
+        'cpu_us_per_request': cpu / requests * 1e6 if requests else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--products', type=int, default=10000)
+    parser.add_argument('--products-json', help='serve this products.json instead of a synthetic catalog')
+    parser.add_argument('--clients', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=10,
+                        help='seconds to run; 0 runs until --requests are sent')
+    parser.add_argument('--requests', type=int, default=0,
+                        help='stop each client after this many requests; 0 means no limit')
+    parser.add_argument('--cart-size', type=int, default=3)
+    parser.add_argument('--exclusion-mode', choices=MODES, default='set')
+    parser.add_argument('--server-workers', type=int, default=10)
+    parser.add_argument('--timeout', type=float, default=5)
+    parser.add_argument('--log', action='store_true', help='keep service logging on stdout')
+    parser.add_argument('--output', help='also write the result to this file')
+    args = parser.parse_args()
+    if not args.duration and not args.requests:
+        parser.error('one of --duration or --requests must be set')
+
+    if not args.log:
+        for name in ('recommendationservice-server', 'recommendationservice-catalog'):
+            logging.getLogger(name).setLevel(logging.WARNING)
+    result = run(args)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(result, f, indent=2)
+    json.dump(result, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == '__main__':
+    main()
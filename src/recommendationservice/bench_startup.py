@@ -0,0 +1,112 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures time from process start to the first SERVING health check.
+#
+#   python bench_startup.py --runs 5 --env DISABLE_PROFILER=1
+#   python bench_startup.py --env ENABLE_TRACING=1
+#   python bench_startup.py --catalog-latency-ms 200 --catalog-error-rate 0.5
+#
+# A fake ProductCatalogService is served from this process so the
+# recommendation server can warm up without a cluster.
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+import grpc
+from grpc_health.v1 import health_pb2
+from grpc_health.v1 import health_pb2_grpc
+
+from fake_catalog import start_fake_catalog
+from synthetic_catalog import generate_products
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        return s.getsockname()[1]
+
+
+def time_to_serving(env, timeout):
+    port = free_port()
+    env = dict(env, PORT=str(port))
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, 'recommendation_server.py'], env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    listening = None
+    try:
+        while time.perf_counter() - start < timeout:
+            # A fresh channel per attempt avoids waiting out gRPC's reconnect
+            # backoff while the server is still starting.
+            with grpc.insecure_channel('localhost:{}'.format(port)) as channel:
+                try:
+                    status = health_pb2_grpc.HealthStub(channel).Check(
+                        health_pb2.HealthCheckRequest(), timeout=1).status
+                except grpc.RpcError:
+                    status = None
+            if status is not None and listening is None:
+                listening = time.perf_counter() - start
+            if status == health_pb2.HealthCheckResponse.SERVING:
+                return listening, time.perf_counter() - start
+            time.sleep(0.005)
+        raise RuntimeError('server did not become SERVING within {}s'.format(timeout))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--products', type=int, default=1000)
+    parser.add_argument('--timeout', type=float, default=60)
+    parser.add_argument('--catalog-latency-ms', type=float, default=0)
+    parser.add_argument('--catalog-error-rate', type=float, default=0.0)
+    parser.add_argument('--env', action='append', default=[],
+                        help='KEY=VALUE passed to the server; may be repeated')
+    args = parser.parse_args()
+
+    catalog, catalog_addr, catalog_service = start_fake_catalog(
+        generate_products(args.products), latency_ms=args.catalog_latency_ms,
+        error_rate=args.catalog_error_rate)
+
+    env = dict(os.environ, PRODUCT_CATALOG_SERVICE_ADDR=catalog_addr)
+    env.update(kv.split('=', 1) for kv in args.env)
+    listening, serving = zip(*[time_to_serving(env, args.timeout) for _ in range(args.runs)])
+    catalog.stop(0)
+
+    json.dump({
+        'benchmark': 'startup',
+        'service': 'recommendationservice',
+        'env': args.env,
+        'runs': args.runs,
+        'catalog': {'products': args.products, 'latency_ms': args.catalog_latency_ms,
+                    'error_rate': args.catalog_error_rate, 'calls': catalog_service.calls,
+                    'errors': catalog_service.errors},
+        'listening_seconds': {'median': statistics.median(listening), 'max': max(listening)},
+        'serving_seconds': {'median': statistics.median(serving), 'max': max(serving)},
+    }, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures per-RPC latency of ListRecommendations with tracing off, head
+# sampled and fully on.
+#
+#   python bench_tracing_overhead.py --requests 5000 --sampling-ratio 0.1
+#
+# Each mode runs in its own process because gRPC instrumentation patches
+# grpc globally. Spans go to an exporter that drops them, so the numbers
+# cover interceptor and SDK cost but not the network.
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from concurrent import futures
+
+import grpc
+
+import demo_pb2
+import demo_pb2_grpc
+from catalog_cache import CatalogCache
+from recommendation_server import RecommendationService
+from fake_catalog import start_fake_catalog
+from synthetic_catalog import generate_products
+
+
+def setup_tracing(ratio):
+    from opentelemetry import trace
+    from opentelemetry.instrumentation.grpc import GrpcInstrumentorServer
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter, SpanExportResult
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    class DroppingExporter(SpanExporter):
+        def export(self, spans):
+            return SpanExportResult.SUCCESS
+
+    GrpcInstrumentorServer().instrument()
+    provider = TracerProvider(sampler=ParentBased(TraceIdRatioBased(ratio)))
+    provider.add_span_processor(BatchSpanProcessor(DroppingExporter()))
+    trace.set_tracer_provider(provider)
+
+
+def child(args):
+    catalog_server, catalog_addr, _ = start_fake_catalog(generate_products(args.products))
+    catalog = CatalogCache(grpc.insecure_channel(catalog_addr))
+    catalog.refresh()
+
+    if args.child != 'off':
+        setup_tracing(args.sampling_ratio if args.child == 'sampled' else 1.0)
+
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(
+        RecommendationService(catalog), server)
+    port = server.add_insecure_port('localhost:0')
+    server.start()
+
+    stub = demo_pb2_grpc.RecommendationServiceStub(
+        grpc.insecure_channel('localhost:{}'.format(port)))
+    request = demo_pb2.ListRecommendationsRequest(user_id='bench', product_ids=['0000000001'])
+    for _ in range(args.warmup):
+        stub.ListRecommendations(request)
+    latencies = []
+    for _ in range(args.requests):
+        start = time.perf_counter()
+        stub.ListRecommendations(request)
+        latencies.append(time.perf_counter() - start)
+    server.stop(0)
+    catalog_server.stop(0)
+
+    latencies.sort()
+    # The server logs to stdout as well; the result is the last line.
+    print()
+    json.dump({
+        'mean_us': statistics.mean(latencies) * 1e6,
+        'p50_us': latencies[len(latencies) // 2] * 1e6,
+        'p99_us': latencies[int(len(latencies) * 0.99)] * 1e6,
+    }, sys.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--warmup', type=int, default=500)
+    parser.add_argument('--products', type=int, default=1000)
+    parser.add_argument('--sampling-ratio', type=float, default=0.1)
+    parser.add_argument('--child', choices=('off', 'sampled', 'on'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child(args)
+
+    results = {}
+    for mode in ('off', 'sampled', 'on'):
+        out = subprocess.check_output([
+            sys.executable, __file__, '--child', mode,
+            '--requests', str(args.requests), '--warmup', str(args.warmup),
+            '--products', str(args.products), '--sampling-ratio', str(args.sampling_ratio)])
+        results[mode] = json.loads(out.splitlines()[-1])
+    for mode in ('sampled', 'on'):
+        results[mode]['overhead_us'] = results[mode]['mean_us'] - results['off']['mean_us']
+    json.dump({'benchmark': 'tracing_overhead', 'sampling_ratio': args.sampling_ratio,
+               'requests': args.requests, 'results': results}, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == '__main__':
+    main()
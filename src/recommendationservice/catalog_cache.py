@@ -0,0 +1,168 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+import struct
+import threading
+import time
+
+import demo_pb2
+import catalog_snapshot
+import health
+from catalog_store import CompactCatalog
+
+from logger import getJSONLogger
+logger = getJSONLogger('recommendationservice-catalog')
+
+LIST_PRODUCTS_METHOD = '/hipstershop.ProductCatalogService/ListProducts'
+# First retry delay while no catalog has been loaded; doubles per failure.
+COLD_RETRY_SECONDS = 0.5
+
+
+class Catalog(object):
+    """Immutable view of the product catalog used to serve requests."""
+
+    def __init__(self, store, digest, snapshot=None):
+        self.store = store
+        self.digest = digest
+        # A store loaded from a snapshot reads straight from its mapping.
+        self._snapshot = snapshot
+
+
+class CatalogCache(object):
+    """Keeps the product catalog resident and refreshes it in the background.
+
+    On start the cache maps the on-disk snapshot (if any) and serves from it
+    straight away, then revalidates against the catalog service. Whenever the
+    catalog changes the snapshot is rewritten so the next restart is warm.
+    """
+
+    def __init__(self, channel, snapshot_path=None, refresh_interval=60, health=None):
+        # Ask for the raw response bytes so an unchanged catalog can be
+        # detected from its digest without being parsed again.
+        self._list_products = channel.unary_unary(
+            LIST_PRODUCTS_METHOD,
+            request_serializer=demo_pb2.Empty.SerializeToString,
+            response_deserializer=None)
+        self._snapshot_path = snapshot_path
+        self._refresh_interval = refresh_interval
+        self._health = health
+        self._catalog = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def get(self):
+        catalog = self._catalog
+        if catalog is None:
+            # Nothing warm yet: fall back to fetching on the request path.
+            catalog = self.refresh()
+        return catalog
+
+    def refresh(self):
+        with self._lock:
+            data = self._list_products(demo_pb2.Empty())
+            digest = hashlib.sha256(data).hexdigest()
+            current = self._catalog
+            if current is not None and current.digest == digest:
+                return current
+            response = demo_pb2.ListProductsResponse.FromString(data)
+            catalog = Catalog(CompactCatalog.from_products(response.products), digest)
+            self._install(catalog)
+            logger.info("catalog loaded: {} products, digest {}".format(
+                len(catalog.store), digest[:12]))
+            self._write_snapshot(catalog)
+            return catalog
+
+    def _install(self, catalog):
+        self._catalog = catalog
+        if self._health is not None:
+            self._health.set(health.SERVING)
+
+    def load_snapshot(self):
+        if not self._snapshot_path or not os.path.exists(self._snapshot_path):
+            return False
+        start = time.time()
+        try:
+            snapshot = catalog_snapshot.CatalogSnapshot(self._snapshot_path)
+        except OSError as err:
+            logger.warning("ignoring catalog snapshot {}: {}".format(
+                self._snapshot_path, err))
+            return False
+        except ValueError as err:
+            self._discard_snapshot(err)
+            return False
+        try:
+            catalog = Catalog(CompactCatalog.from_sections(snapshot.sections()),
+                              snapshot.digest, snapshot)
+        except KeyError as err:
+            snapshot.close()
+            self._discard_snapshot("missing section {}".format(err))
+            return False
+        except (TypeError, ValueError, struct.error) as err:
+            # Sections that passed their checksums but don't decode.
+            snapshot.close()
+            self._discard_snapshot(err)
+            return False
+        with self._lock:
+            if self._catalog is None:
+                self._install(catalog)
+        logger.info("catalog snapshot loaded: {} products in {:.1f}ms".format(
+            len(catalog.store), (time.time() - start) * 1000))
+        return True
+
+    def _discard_snapshot(self, reason):
+        # A bad snapshot would fail the same way on every restart; remove it
+        # and let the refresh thread fetch the catalog and write a new one.
+        logger.warning("discarding catalog snapshot {}: {}".format(
+            self._snapshot_path, reason))
+        try:
+            os.remove(self._snapshot_path)
+        except OSError as err:
+            logger.warning("could not remove catalog snapshot: {}".format(err))
+
+    def _write_snapshot(self, catalog):
+        if not self._snapshot_path:
+            return
+        try:
+            catalog_snapshot.write_snapshot(
+                self._snapshot_path, catalog.digest, catalog.store.to_sections())
+        except OSError as err:
+            logger.warning("could not write catalog snapshot: {}".format(err))
+
+    def start(self):
+        self.load_snapshot()
+        thread = threading.Thread(target=self._run, name="catalog-refresh")
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def _run(self):
+        backoff = COLD_RETRY_SECONDS
+        while True:
+            wait = self._refresh_interval
+            try:
+                self.refresh()
+            except Exception as err:
+                logger.warning("catalog refresh failed: {}".format(err))
+                if self._catalog is None:
+                    # Still cold: retry sooner than the refresh interval.
+                    wait = min(backoff, self._refresh_interval)
+                    backoff *= 2
+            if self._stopped.wait(wait):
+                return
@@ -0,0 +1,122 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# On-disk catalog snapshot used for warm restarts.
+#
+# Layout (little endian):
+#   header   magic, format version, catalog digest, created at, section count
+#   table    one entry per section: name, offset, length, crc32
+#   sections raw bytes, each aligned to 8 bytes
+#
+# The file is written to a temporary path and renamed into place, so readers
+# only ever observe complete snapshots. Loading mmaps the file and hands out
+# memoryviews into it; nothing is copied until a section is decoded.
+
+import mmap
+import os
+import struct
+import time
+import zlib
+
+MAGIC = b"RECSNAP\0"
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct("<8sH6x32sdI")
+_SECTION = struct.Struct("<8sQQI4x")
+_ALIGN = 8
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def _pad(n):
+    return (-n) % _ALIGN
+
+
+def write_snapshot(path, digest, sections):
+    """Atomically writes `sections` (name -> bytes) to `path`."""
+    names = sorted(sections)
+    offset = _HEADER.size + _SECTION.size * len(names)
+    offset += _pad(offset)
+    table = []
+    for name in names:
+        data = sections[name]
+        table.append(_SECTION.pack(name.encode("ascii"), offset, len(data),
+                                   zlib.crc32(data)))
+        offset += len(data) + _pad(len(data))
+
+    tmp_path = "{}.tmp.{}".format(path, os.getpid())
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, bytes.fromhex(digest),
+                             time.time(), len(names)))
+        f.writelines(table)
+        f.write(b"\0" * _pad(f.tell()))
+        for name in names:
+            data = sections[name]
+            f.write(data)
+            f.write(b"\0" * _pad(len(data)))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class CatalogSnapshot(object):
+    """A read-only, memory-mapped catalog snapshot."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self):
+        if len(self._mm) < _HEADER.size:
+            raise SnapshotError("truncated header")
+        magic, version, digest, created, count = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise SnapshotError("bad magic")
+        if version != FORMAT_VERSION:
+            raise SnapshotError("unsupported format version {}".format(version))
+        if _HEADER.size + count * _SECTION.size > len(self._mm):
+            raise SnapshotError("truncated section table")
+        self.digest = digest.hex()
+        self.created = created
+        self._sections = {}
+        view = memoryview(self._mm)
+        for i in range(count):
+            name, offset, length, crc = _SECTION.unpack_from(
+                self._mm, _HEADER.size + i * _SECTION.size)
+            if offset + length > len(self._mm):
+                raise SnapshotError("section out of bounds")
+            data = view[offset:offset + length]
+            if zlib.crc32(data) != crc:
+                raise SnapshotError("checksum mismatch")
+            self._sections[name.rstrip(b"\0").decode("ascii")] = data
+
+    def sections(self):
+        return dict(self._sections)
+
+    def close(self):
+        self._sections = {}
+        try:
+            self._mm.close()
+        except BufferError:
+            # A caller still holds a view; the mapping is released with it.
+            pass
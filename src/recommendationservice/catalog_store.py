@@ -0,0 +1,210 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Compact, columnar product catalog.
+#
+# Products are addressed by ordinal (their position in ListProducts). Strings
+# are UTF-8 packed into one buffer per column with an offsets column, numbers
+# live in typed arrays and categories are byte bitsets over ordinals. Every
+# column is a plain buffer, so a catalog can be written to a snapshot section
+# by section and served straight out of an mmap without being copied back.
+
+import array
+import bisect
+import random
+
+import demo_pb2
+
+
+class PackedStrings(object):
+    """A sequence of strings stored as one UTF-8 buffer plus offsets."""
+
+    def __init__(self, blob, offsets):
+        self.blob = blob
+        self.offsets = offsets
+
+    @classmethod
+    def pack(cls, strings):
+        offsets = array.array('Q', [0])
+        chunks = []
+        end = 0
+        for s in strings:
+            data = s.encode('utf-8')
+            chunks.append(data)
+            end += len(data)
+            offsets.append(end)
+        return cls(b''.join(chunks), offsets)
+
+    def raw(self, i):
+        return self.blob[self.offsets[i]:self.offsets[i + 1]]
+
+    def __getitem__(self, i):
+        return str(self.raw(i), 'utf-8')
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+def has_bit(bits, ordinal):
+    return bits[ordinal >> 3] >> (ordinal & 7) & 1
+
+
+def _column(buf, fmt):
+    # Snapshot sections are memoryviews; cast them in place instead of copying.
+    if isinstance(buf, memoryview):
+        return buf.cast('B').cast(fmt)
+    return array.array(fmt, buf)
+
+
+class CompactCatalog(object):
+    """Columnar product catalog indexed by ordinal."""
+
+    _STRING_COLUMNS = ('ids', 'name', 'desc', 'pic', 'cur', 'cat')
+    _NUMERIC_COLUMNS = (('units', 'q'), ('nanos', 'i'), ('cur_idx', 'H'), ('id_sort', 'I'))
+
+    def __init__(self, columns, category_bits):
+        self.columns = columns
+        self.ids = columns['ids']
+        self.names = columns['name']
+        self.descriptions = columns['desc']
+        self.pictures = columns['pic']
+        self.currencies = columns['cur']
+        self.category_names = columns['cat']
+        self.units = columns['units']
+        self.nanos = columns['nanos']
+        self.currency_index = columns['cur_idx']
+        # Ordinals sorted by product id, for binary-search lookups.
+        self.id_sort = columns['id_sort']
+        self.category_bits = category_bits
+
+    @classmethod
+    def from_products(cls, products):
+        ids, names, descriptions, pictures = [], [], [], []
+        units, nanos, currency_index = array.array('q'), array.array('i'), array.array('H')
+        currencies = {}
+        categories = {}
+        width = (len(products) + 7) // 8
+        for ordinal, product in enumerate(products):
+            ids.append(product.id)
+            names.append(product.name)
+            descriptions.append(product.description)
+            pictures.append(product.picture)
+            units.append(product.price_usd.units)
+            nanos.append(product.price_usd.nanos)
+            currency_index.append(
+                currencies.setdefault(product.price_usd.currency_code, len(currencies)))
+            for category in product.categories:
+                bits = categories.get(category)
+                if bits is None:
+                    bits = categories[category] = bytearray(width)
+                bits[ordinal >> 3] |= 1 << (ordinal & 7)
+        columns = {
+            'ids': PackedStrings.pack(ids),
+            'name': PackedStrings.pack(names),
+            'desc': PackedStrings.pack(descriptions),
+            'pic': PackedStrings.pack(pictures),
+            'cur': PackedStrings.pack(currencies),
+            'cat': PackedStrings.pack(categories),
+            'units': units,
+            'nanos': nanos,
+            'cur_idx': currency_index,
+            'id_sort': array.array('I', sorted(range(len(ids)), key=ids.__getitem__)),
+        }
+        return cls(columns, list(categories.values()))
+
+    @classmethod
+    def from_sections(cls, sections):
+        columns = {}
+        for name in cls._STRING_COLUMNS:
+            columns[name] = PackedStrings(sections[name], _column(sections[name + '_off'], 'Q'))
+        for name, fmt in cls._NUMERIC_COLUMNS:
+            columns[name] = _column(sections[name], fmt)
+        width = (len(columns['units']) + 7) // 8
+        bits = sections['cat_bits']
+        category_bits = [bits[i * width:(i + 1) * width] for i in range(len(columns['cat']))]
+        return cls(columns, category_bits)
+
+    def to_sections(self):
+        sections = {}
+        for name in self._STRING_COLUMNS:
+            sections[name] = bytes(self.columns[name].blob)
+            sections[name + '_off'] = bytes(self.columns[name].offsets)
+        for name, _ in self._NUMERIC_COLUMNS:
+            sections[name] = bytes(self.columns[name])
+        sections['cat_bits'] = b''.join(self.category_bits)
+        return sections
+
+    def __len__(self):
+        return len(self.units)
+
+    def ordinal(self, product_id):
+        """Returns the ordinal of `product_id`, or None if it is unknown."""
+        i = bisect.bisect_left(range(len(self.id_sort)), product_id,
+                               key=lambda j: self.ids[self.id_sort[j]])
+        if i < len(self.id_sort) and self.ids[self.id_sort[i]] == product_id:
+            return self.id_sort[i]
+        return None
+
+    def categories(self, ordinal):
+        return [self.category_names[i] for i, bits in enumerate(self.category_bits)
+                if has_bit(bits, ordinal)]
+
+    def in_category(self, category):
+        """Returns the category bitset, or None for an unknown category."""
+        for i, name in enumerate(self.category_names):
+            if name == category:
+                return self.category_bits[i]
+        return None
+
+    def product(self, ordinal):
+        """Decodes one product back into its protobuf form."""
+        return demo_pb2.Product(
+            id=self.ids[ordinal],
+            name=self.names[ordinal],
+            description=self.descriptions[ordinal],
+            picture=self.pictures[ordinal],
+            price_usd=demo_pb2.Money(
+                currency_code=self.currencies[self.currency_index[ordinal]],
+                units=self.units[ordinal],
+                nanos=self.nanos[ordinal]),
+            categories=self.categories(ordinal))
+
+    def sample(self, k, excluded):
+        """Picks up to `k` distinct ordinals uniformly, skipping `excluded`."""
+        n = len(self)
+        k = min(k, n - len(excluded))
+        if k <= 0:
+            return []
+        if len(excluded) <= n // 2:
+            # Sparse exclusion: rejection sampling needs about 2k draws. The
+            # attempts are bounded because approximate exclusion sets can
+            # reject more than len() suggests.
+            picked = []
+            seen = set()
+            for _ in range(32 * k):
+                i = random.randrange(n)
+                if i not in excluded and i not in seen:
+                    seen.add(i)
+                    picked.append(i)
+                    if len(picked) == k:
+                        return picked
+        # Dense exclusion: enumerate what is left.
+        candidates = [i for i in range(n) if i not in excluded]
+        return random.sample(candidates, min(k, len(candidates)))
@@ -14,26 +14,176 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+# Sends one ListRecommendations call, or drives open-loop load at the
+# service directly.
+#
+#   python client.py 8080
+#   python client.py 8080 --rate 500 --duration 60 --distribution zipf
+#
+# In load mode requests are issued on a fixed schedule (Poisson arrivals by
+# default) whether or not earlier ones have returned, and latency is
+# measured from the scheduled send time. A slow server therefore shows up
+# as higher latency rather than as a lower request rate. Product ids come
+# from products.json, the live catalog or synthetic ids, and the result is
+# printed as JSON.
+
+import argparse
+import bisect
+import itertools
+import json
+import random
 import sys
+import threading
+import time
+
 import grpc
 import demo_pb2
 import demo_pb2_grpc
+from histogram import LatencyHistogram
 
 from logger import getJSONLogger
 logger = getJSONLogger('recommendationservice-server')
 
-if __name__ == "__main__":
-    # get port
-    if len(sys.argv) > 1:
-        port = sys.argv[1]
-    else:
-        port = "8080"
+DISTRIBUTIONS = ('uniform', 'zipf', 'fixed')
+
+
+def load_product_ids(args):
+    if args.catalog_addr:
+        channel = grpc.insecure_channel(
+            args.catalog_addr, options=[('grpc.max_receive_message_length', -1)])
+        response = demo_pb2_grpc.ProductCatalogServiceStub(channel).ListProducts(demo_pb2.Empty())
+        return [product.id for product in response.products]
+    if args.synthetic:
+        from synthetic_catalog import product_id
+        return [product_id(i) for i in range(args.synthetic)]
+    with open(args.products_json) as f:
+        return [product['id'] for product in json.load(f)['products']]
+
+
+class CartSampler(object):
+    """Draws the product_ids of each request from a distribution over the catalog."""
+
+    def __init__(self, product_ids, distribution, cart_size, zipf_s=1.1, seed=0):
+        self.product_ids = product_ids
+        self.distribution = distribution
+        self.cart_size = cart_size
+        self._rng = random.Random(seed)
+        if distribution == 'zipf':
+            # Rank i is drawn with weight 1 / i**s; popular ids come first.
+            self._cum_weights = list(itertools.accumulate(
+                1.0 / (rank ** zipf_s) for rank in range(1, len(product_ids) + 1)))
+
+    def next(self):
+        if self.distribution == 'fixed':
+            return self.product_ids[:self.cart_size]
+        if self.distribution == 'zipf':
+            total = self._cum_weights[-1]
+            return [self.product_ids[bisect.bisect(self._cum_weights, self._rng.random() * total)]
+                    for _ in range(self.cart_size)]
+        return [self._rng.choice(self.product_ids) for _ in range(self.cart_size)]
+
+
+def run_load(stub, sampler, args):
+    histogram = LatencyHistogram()
+    codes = {}
+    lock = threading.Lock()
+    inflight = threading.BoundedSemaphore(args.max_inflight)
+    rng = random.Random(args.seed)
+    interval = 1.0 / args.rate
+
+    def done(future, scheduled):
+        latency_us = (time.perf_counter() - scheduled) * 1e6
+        code = future.code()
+        inflight.release()
+        with lock:
+            codes[code.name] = codes.get(code.name, 0) + 1
+        if code == grpc.StatusCode.OK:
+            histogram.record(latency_us)
+
+    sent = dropped = 0
+    start = time.perf_counter()
+    end = start + args.duration
+    scheduled = start
+    while scheduled < end:
+        now = time.perf_counter()
+        if scheduled > now:
+            time.sleep(scheduled - now)
+        # Requests past --max-inflight are counted as dropped, not queued, so
+        # the arrival schedule is never stretched by a slow server.
+        if inflight.acquire(blocking=False):
+            request = demo_pb2.ListRecommendationsRequest(
+                user_id='load-{}'.format(sent), product_ids=sampler.next())
+            future = stub.ListRecommendations.future(request, timeout=args.timeout)
+            future.add_done_callback(lambda f, s=scheduled: done(f, s))
+            sent += 1
+        else:
+            dropped += 1
+        scheduled += rng.expovariate(args.rate) if args.arrivals == 'poisson' else interval
+    sending_seconds = time.perf_counter() - start
+
+    # Wait for stragglers by taking every in-flight slot back.
+    for _ in range(args.max_inflight):
+        inflight.acquire()
+    elapsed = time.perf_counter() - start
+
+    ok = codes.get('OK', 0)
+    result = {
+        'target_rate': args.rate,
+        'arrivals': args.arrivals,
+        'distribution': args.distribution,
+        'cart_size': args.cart_size,
+        'catalog_products': len(sampler.product_ids),
+        'duration_seconds': args.duration,
+        'sent': sent,
+        'dropped': dropped,
+        'achieved_rate': sent / sending_seconds if sending_seconds else 0.0,
+        'ok_rate': ok / elapsed if elapsed else 0.0,
+        'status_codes': codes,
+        'latency_us': histogram.summary(),
+    }
+    if args.histogram:
+        result['histogram_us'] = histogram.buckets()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('port', nargs='?', default='8080')
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--rate', type=float, help='requests per second; omit for a single call')
+    parser.add_argument('--duration', type=float, default=30, help='seconds of load')
+    parser.add_argument('--arrivals', choices=('poisson', 'constant'), default='poisson')
+    parser.add_argument('--max-inflight', type=int, default=1000)
+    parser.add_argument('--timeout', type=float, default=5)
+    ids = parser.add_mutually_exclusive_group()
+    ids.add_argument('--products-json', default='../productcatalogservice/products.json')
+    ids.add_argument('--catalog-addr', help='read product ids from a running ProductCatalogService')
+    ids.add_argument('--synthetic', type=int, metavar='N',
+                     help='use the ids of synthetic_catalog.generate_products(N)')
+    parser.add_argument('--distribution', choices=DISTRIBUTIONS, default='uniform')
+    parser.add_argument('--zipf-s', type=float, default=1.1)
+    parser.add_argument('--cart-size', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--histogram', action='store_true', help='include histogram buckets')
+    args = parser.parse_args()
 
     # set up server stub
-    channel = grpc.insecure_channel('localhost:'+port)
+    channel = grpc.insecure_channel('{}:{}'.format(args.host, args.port))
     stub = demo_pb2_grpc.RecommendationServiceStub(channel)
-    # form request
-    request = demo_pb2.ListRecommendationsRequest(user_id="test", product_ids=["test"])
-    # make call to server
-    response = stub.ListRecommendations(request)
-    logger.info(response)
+
+    if args.rate is None:
+        # form request
+        request = demo_pb2.ListRecommendationsRequest(user_id="test", product_ids=["test"])
+        # make call to server
+        response = stub.ListRecommendations(request)
+        logger.info(response)
+        return
+
+    sampler = CartSampler(load_product_ids(args), args.distribution, args.cart_size,
+                          zipf_s=args.zipf_s, seed=args.seed)
+    json.dump(run_load(stub, sampler, args), sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
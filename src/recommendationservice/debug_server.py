@@ -0,0 +1,154 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Plain HTTP side port for debugging endpoints, kept off the gRPC port.
+#
+# Handlers take the query parameters as a dict of strings and return a
+# JSON-serializable object. Raising ValueError answers 400 with the message,
+# any other exception 500.
+#
+# There is no authentication, so it listens on loopback unless given another
+# address; reach it with kubectl port-forward.
+#
+#   curl 'localhost:6060/debug/profiler?action=start'
+#   curl 'localhost:6060/debug/memory?action=top&limit=20'
+#   curl 'localhost:6060/debug/artifacts'
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from memory_tracer import KEY_TYPES
+
+
+class DebugServer(object):
+
+    def __init__(self, port, logger=None, host='127.0.0.1'):
+        self.host = host
+        self.port = port
+        self.logger = logger
+        self._routes = {}
+        self._httpd = None
+
+    def route(self, path, handler):
+        self._routes[path] = handler
+
+    def start(self):
+        routes, logger = self._routes, self.logger
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                handler = routes.get(url.path)
+                if handler is None:
+                    return self._reply(404, {'error': 'not found', 'routes': sorted(routes)})
+                try:
+                    return self._reply(200, handler(dict(parse_qsl(url.query))))
+                except ValueError as err:
+                    return self._reply(400, {'error': str(err)})
+                except Exception as err:
+                    if logger:
+                        logger.exception('debug handler {} failed'.format(url.path))
+                    return self._reply(500, {'error': str(err)})
+
+            def _reply(self, code, body):
+                data = json.dumps(body, indent=2).encode() + b'\n'
+                self.send_response(code)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                if logger:
+                    logger.debug('debug server: ' + format % args)
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        thread = threading.Thread(target=self._httpd.serve_forever, name='debug-server')
+        thread.daemon = True
+        thread.start()
+        if logger:
+            logger.info('debug endpoints listening on {}:{}'.format(self.host, self.port))
+
+    def stop(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+
+def profiler_handler(profiler):
+    """Routes ?action=start|stop|flush to a SamplingProfiler; no action reports status."""
+
+    def handle(params):
+        action = params.get('action', 'status')
+        result = {}
+        if action == 'start':
+            if 'rate_hz' in params:
+                rate_hz = float(params['rate_hz'])
+                if not 0 < rate_hz <= 1000:
+                    raise ValueError('rate_hz must be in (0, 1000]')
+                profiler.rate_hz = rate_hz
+            result['changed'] = profiler.start()
+        elif action == 'stop':
+            result['changed'] = profiler.stop()
+        elif action == 'flush':
+            result['path'] = profiler.flush()
+        elif action != 'status':
+            raise ValueError('unknown action {!r}'.format(action))
+        result.update(profiler.status())
+        return result
+
+    return handle
+
+
+def memory_handler(tracer):
+    """Routes tracemalloc actions to a MemoryTracer; no action reports status.
+
+    start[&frames=N], stop, snapshot&name=X, top[&limit=N&key=lineno],
+    diff&old=X&new=Y[&limit=N&key=lineno]
+    """
+
+    def handle(params):
+        action = params.get('action', 'status')
+        limit = int(params.get('limit', '10'))
+        key_type = params.get('key', 'lineno')
+        if key_type not in KEY_TYPES:
+            raise ValueError('key must be one of {}'.format(KEY_TYPES))
+        result = {}
+        if action == 'start':
+            result['changed'] = tracer.start(int(params.get('frames', '1')))
+        elif action == 'stop':
+            result['changed'] = tracer.stop()
+        elif action == 'snapshot':
+            if 'name' not in params:
+                raise ValueError('snapshot needs a name')
+            result['traced_bytes'] = tracer.snapshot(params['name'])
+        elif action == 'top':
+            result['top'] = tracer.top(limit, key_type)
+        elif action == 'diff':
+            if 'old' not in params or 'new' not in params:
+                raise ValueError('diff needs old and new snapshot names')
+            result['diff'] = tracer.diff(params['old'], params['new'], limit, key_type)
+        elif action != 'status':
+            raise ValueError('unknown action {!r}'.format(action))
+        result.update(tracer.status())
+        return result
+
+    return handle
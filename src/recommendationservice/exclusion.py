@@ -0,0 +1,121 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Exclusion sets over catalog ordinals.
+#
+# All implementations support add(), `in` and len(), so CompactCatalog.sample
+# can take any of them:
+#
+#   set     exact, ~40 bytes per excluded product
+#   bitset  exact, one bit per catalog product regardless of how many are
+#           excluded; best for very large exclusions. Smaller ones get a
+#           set, which is cheaper than allocating the bits per request
+#   bloom   a few bits per excluded product with a tunable false positive
+#           rate; a false positive only means a product is not recommended
+
+import math
+
+MODES = ('set', 'bitset', 'bloom')
+
+_MASK64 = (1 << 64) - 1
+
+# Roughly what a set costs per member, to compare with a bitset's bytes.
+_SET_BYTES_PER_ORDINAL = 40
+
+
+class OrdinalBitset(object):
+    """Exact exclusion set with one bit per catalog ordinal."""
+
+    def __init__(self, size):
+        self._bits = bytearray((size + 7) // 8)
+        self._count = 0
+
+    def add(self, ordinal):
+        byte, bit = ordinal >> 3, 1 << (ordinal & 7)
+        if not self._bits[byte] & bit:
+            self._bits[byte] |= bit
+            self._count += 1
+
+    def __contains__(self, ordinal):
+        return self._bits[ordinal >> 3] >> (ordinal & 7) & 1 == 1
+
+    def __len__(self):
+        return self._count
+
+    def nbytes(self):
+        return len(self._bits)
+
+
+def _hash(ordinal):
+    # Fibonacci hashing spreads consecutive ordinals over the whole filter.
+    return (ordinal * 0x9E3779B97F4A7C15) & _MASK64
+
+
+class BloomFilter(object):
+    """Approximate exclusion set sized for `capacity` ordinals."""
+
+    def __init__(self, capacity, fp_rate=0.01):
+        capacity = max(1, capacity)
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    def add(self, ordinal):
+        # Kirsch-Mitzenmacher double hashing from one 64-bit hash.
+        h = _hash(ordinal)
+        h1, h2 = h >> 32, (h & 0xFFFFFFFF) | 1
+        bits, m = self._bits, self.num_bits
+        new = False
+        for i in range(self.num_hashes):
+            p = (h1 + i * h2) % m
+            bit = 1 << (p & 7)
+            if not bits[p >> 3] & bit:
+                bits[p >> 3] |= bit
+                new = True
+        if new:
+            self._count += 1
+
+    def __contains__(self, ordinal):
+        h = _hash(ordinal)
+        h1, h2 = h >> 32, (h & 0xFFFFFFFF) | 1
+        bits, m = self._bits, self.num_bits
+        for i in range(self.num_hashes):
+            p = (h1 + i * h2) % m
+            if not bits[p >> 3] >> (p & 7) & 1:
+                return False
+        return True
+
+    def __len__(self):
+        return self._count
+
+    def nbytes(self):
+        return len(self._bits)
+
+
+def new_exclusion(mode, catalog_size, capacity, fp_rate=0.01):
+    """Returns an empty exclusion set of the given mode."""
+    if mode == 'bitset':
+        if capacity * _SET_BYTES_PER_ORDINAL < (catalog_size + 7) // 8:
+            return set()
+        return OrdinalBitset(catalog_size)
+    if mode == 'bloom':
+        if not 0 < fp_rate < 1:
+            raise ValueError("bloom false positive rate must be between 0 and 1, got {}".format(fp_rate))
+        return BloomFilter(capacity, fp_rate)
+    if mode == 'set':
+        return set()
+    raise ValueError("unknown exclusion mode {!r}, expected one of {}".format(mode, MODES))
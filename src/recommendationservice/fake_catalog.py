@@ -0,0 +1,160 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Stand-in ProductCatalogService for running the recommendation service
+# without a cluster.
+#
+#   python fake_catalog.py --products-json ../productcatalogservice/products.json
+#   python fake_catalog.py --synthetic 2000000 --latency-ms 20 --error-rate 0.01
+#
+# then start the server with PRODUCT_CATALOG_SERVICE_ADDR=localhost:3550.
+# ListProducts is serialized once up front, so millions of products cost
+# one copy per call rather than a re-encode. Every RPC can be delayed by
+# a fixed latency plus uniform jitter and failed at a given rate.
+
+import argparse
+import random
+import threading
+import time
+from concurrent import futures
+
+import grpc
+from google.protobuf import json_format
+
+import demo_pb2
+from synthetic_catalog import generate_products
+
+from logger import getJSONLogger
+logger = getJSONLogger('recommendationservice-fake-catalog')
+
+SERVICE_NAME = 'hipstershop.ProductCatalogService'
+
+
+def load_products(path):
+    """Reads a products.json file into a ListProductsResponse."""
+    with open(path) as f:
+        return json_format.Parse(f.read(), demo_pb2.ListProductsResponse())
+
+
+class FakeCatalogService(object):
+
+    def __init__(self, response, latency_ms=0, jitter_ms=0, error_rate=0.0,
+                 error_code=grpc.StatusCode.UNAVAILABLE, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.calls = 0
+        self.errors = 0
+        self._data = response.SerializeToString()
+        self._by_id = {product.id: product for product in response.products}
+        self._products = response.products
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _inject(self, context):
+        with self._lock:
+            self.calls += 1
+            delay = self.latency_ms + self._rng.uniform(0, self.jitter_ms)
+            fail = self._rng.random() < self.error_rate
+            if fail:
+                self.errors += 1
+        if delay:
+            time.sleep(delay / 1000.0)
+        if fail:
+            context.abort(self.error_code, 'injected error')
+
+    def ListProducts(self, request, context):
+        self._inject(context)
+        return self._data
+
+    def GetProduct(self, request, context):
+        self._inject(context)
+        product = self._by_id.get(request.id)
+        if product is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, 'no product with ID {}'.format(request.id))
+        return product
+
+    def SearchProducts(self, request, context):
+        self._inject(context)
+        query = request.query.lower()
+        return demo_pb2.SearchProductsResponse(results=[
+            product for product in self._products
+            if query in product.name.lower() or query in product.description.lower()])
+
+    def add_to_server(self, server):
+        handlers = {
+            # ListProducts returns the pre-serialized response as bytes.
+            'ListProducts': grpc.unary_unary_rpc_method_handler(
+                self.ListProducts,
+                request_deserializer=demo_pb2.Empty.FromString,
+                response_serializer=None),
+            'GetProduct': grpc.unary_unary_rpc_method_handler(
+                self.GetProduct,
+                request_deserializer=demo_pb2.GetProductRequest.FromString,
+                response_serializer=demo_pb2.Product.SerializeToString),
+            'SearchProducts': grpc.unary_unary_rpc_method_handler(
+                self.SearchProducts,
+                request_deserializer=demo_pb2.SearchProductsRequest.FromString,
+                response_serializer=demo_pb2.SearchProductsResponse.SerializeToString),
+        }
+        server.add_generic_rpc_handlers(
+            (grpc.method_handlers_generic_handler(SERVICE_NAME, handlers),))
+
+
+def start_fake_catalog(response, address='localhost:0', max_workers=4, **faults):
+    """Starts an in-process catalog server; returns (server, address, service)."""
+    service = FakeCatalogService(response, **faults)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    service.add_to_server(server)
+    port = server.add_insecure_port(address)
+    server.start()
+    return server, 'localhost:{}'.format(port), service
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--products-json', help='serve this products.json file')
+    source.add_argument('--synthetic', type=int, metavar='N',
+                        help='serve N generated products')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--port', type=int, default=3550)
+    parser.add_argument('--workers', type=int, default=10)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--error-code', default='UNAVAILABLE',
+                        choices=[code.name for code in grpc.StatusCode if code.name != 'OK'])
+    args = parser.parse_args()
+
+    if args.products_json:
+        response = load_products(args.products_json)
+    else:
+        response = generate_products(args.synthetic, seed=args.seed)
+    server, addr, _ = start_fake_catalog(
+        response, '[::]:{}'.format(args.port), max_workers=args.workers,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        error_code=grpc.StatusCode[args.error_code], seed=args.seed)
+    logger.info('serving {} products on port {}'.format(len(response.products), args.port))
+    try:
+        server.wait_for_termination()
+    except KeyboardInterrupt:
+        server.stop(0)
+
+
+if __name__ == '__main__':
+    main()
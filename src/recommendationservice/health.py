@@ -0,0 +1,45 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+from grpc_health.v1 import health_pb2
+
+SERVING = health_pb2.HealthCheckResponse.SERVING
+NOT_SERVING = health_pb2.HealthCheckResponse.NOT_SERVING
+
+
+class HealthStatus(object):
+    """Serving status shared between the warm-up code and the health RPCs."""
+
+    def __init__(self, status=NOT_SERVING):
+        self._status = status
+        self._changed = threading.Condition()
+
+    def get(self):
+        return self._status
+
+    def set(self, status):
+        with self._changed:
+            if status != self._status:
+                self._status = status
+                self._changed.notify_all()
+
+    def wait(self, last, timeout=None):
+        """Blocks until the status differs from `last` or `timeout` expires."""
+        with self._changed:
+            self._changed.wait_for(lambda: self._status != last, timeout)
+            return self._status
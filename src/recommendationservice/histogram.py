@@ -0,0 +1,106 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Log-linear latency histogram in the style of HdrHistogram.
+#
+# Values are integer microseconds. Below 2**SUB_BITS they are counted
+# exactly; above that every power of two is split into 2**(SUB_BITS - 1)
+# equal buckets, so any recorded value is reported within 1/64 (~1.6%) of
+# its true value while the whole range up to hours fits in a few thousand
+# counters.
+
+import threading
+
+SUB_BITS = 7
+_SUB_COUNT = 1 << SUB_BITS
+_HALF = _SUB_COUNT >> 1
+
+
+def bucket_index(value):
+    if value < _SUB_COUNT:
+        return value
+    shift = value.bit_length() - SUB_BITS
+    return _SUB_COUNT + (shift - 1) * _HALF + (value >> shift) - _HALF
+
+
+def bucket_range(index):
+    """Returns the lowest and highest value counted in bucket `index`."""
+    if index < _SUB_COUNT:
+        return index, index
+    shift, offset = divmod(index - _SUB_COUNT, _HALF)
+    shift += 1
+    low = (offset + _HALF) << shift
+    return low, low + (1 << shift) - 1
+
+
+class LatencyHistogram(object):
+
+    def __init__(self):
+        self.counts = []
+        self.total = 0
+        self.sum = 0
+        self.min = None
+        self.max = 0
+        self._lock = threading.Lock()
+
+    def record(self, value, count=1):
+        value = max(0, int(value))
+        index = bucket_index(value)
+        with self._lock:
+            if index >= len(self.counts):
+                self.counts.extend([0] * (index + 1 - len(self.counts)))
+            self.counts[index] += count
+            self.total += count
+            self.sum += value * count
+            self.min = value if self.min is None else min(self.min, value)
+            self.max = max(self.max, value)
+
+    def merge(self, other):
+        with self._lock:
+            if len(other.counts) > len(self.counts):
+                self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+            for index, count in enumerate(other.counts):
+                self.counts[index] += count
+            self.total += other.total
+            self.sum += other.sum
+            if other.min is not None:
+                self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = max(self.max, other.max)
+
+    def percentile(self, q):
+        """Value at quantile `q` (0..1), reported as its bucket's upper bound."""
+        if not self.total:
+            return 0
+        rank = max(1, int(round(q * self.total)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bucket_range(index)[1], self.max)
+        return self.max
+
+    def mean(self):
+        return self.sum / self.total if self.total else 0.0
+
+    def summary(self, quantiles=(0.5, 0.9, 0.99, 0.999, 0.9999)):
+        out = {'count': self.total, 'mean': self.mean(), 'min': self.min or 0, 'max': self.max}
+        for q in quantiles:
+            out['p{}'.format(('%g' % (q * 100)).replace('.', ''))] = self.percentile(q)
+        return out
+
+    def buckets(self):
+        """Non-empty buckets as [low, high, count] rows for plotting."""
+        return [list(bucket_range(i)) + [c] for i, c in enumerate(self.counts) if c]
@@ -0,0 +1,127 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# On-demand tracemalloc snapshots for tracking down memory growth.
+#
+# tracemalloc hooks every allocation while it is tracing, so nothing is
+# traced until start() is called and stop() removes the hooks again. Named
+# snapshots are kept so two points in time can be diffed:
+#
+#   start -> snapshot before -> (load) -> snapshot after -> diff before after
+
+import collections
+import threading
+import tracemalloc
+
+KEY_TYPES = ('lineno', 'filename', 'traceback')
+
+
+def _site(frame):
+    # Statistics grouped by filename carry line number 0.
+    return '{}:{}'.format(frame.filename, frame.lineno) if frame.lineno else frame.filename
+
+
+def _stat(stat):
+    out = {
+        'site': _site(stat.traceback[0]),
+        'size_bytes': stat.size,
+        'count': stat.count,
+    }
+    if len(stat.traceback) > 1:
+        out['traceback'] = [_site(frame) for frame in stat.traceback]
+    return out
+
+
+def _stat_diff(stat):
+    out = _stat(stat)
+    out['size_diff_bytes'] = stat.size_diff
+    out['count_diff'] = stat.count_diff
+    return out
+
+
+class MemoryTracer(object):
+
+    def __init__(self, max_snapshots=8, logger=None):
+        self.max_snapshots = max_snapshots
+        self.logger = logger
+        self._snapshots = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def start(self, frames=1):
+        if tracemalloc.is_tracing():
+            return False
+        tracemalloc.start(frames)
+        if self.logger:
+            self.logger.info('tracemalloc started with {} frame(s)'.format(frames))
+        return True
+
+    def stop(self):
+        """Stops tracing and drops the saved snapshots with the traces."""
+        if not tracemalloc.is_tracing():
+            return False
+        tracemalloc.stop()
+        with self._lock:
+            self._snapshots.clear()
+        if self.logger:
+            self.logger.info('tracemalloc stopped')
+        return True
+
+    def _take(self):
+        if not tracemalloc.is_tracing():
+            raise ValueError('tracemalloc is not running, start it first')
+        # Leave out the tracer's own bookkeeping.
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ))
+
+    def snapshot(self, name):
+        snap = self._take()
+        with self._lock:
+            self._snapshots.pop(name, None)
+            self._snapshots[name] = snap
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return sum(stat.size for stat in snap.statistics('filename'))
+
+    def _get(self, name):
+        with self._lock:
+            if name not in self._snapshots:
+                raise ValueError('no snapshot named {!r}, have {}'.format(
+                    name, list(self._snapshots)))
+            return self._snapshots[name]
+
+    def top(self, limit=10, key_type='lineno'):
+        """Top allocation sites right now."""
+        stats = self._take().statistics(key_type)
+        return [_stat(stat) for stat in stats[:limit]]
+
+    def diff(self, old, new, limit=10, key_type='lineno'):
+        """Top allocation sites by growth from snapshot `old` to `new`."""
+        stats = self._get(new).compare_to(self._get(old), key_type)
+        return [_stat_diff(stat) for stat in stats[:limit]]
+
+    def status(self):
+        traced, peak = tracemalloc.get_traced_memory()
+        with self._lock:
+            names = list(self._snapshots)
+        return {
+            'tracing': tracemalloc.is_tracing(),
+            'traced_bytes': traced,
+            'peak_bytes': peak,
+            'tracemalloc_overhead_bytes': tracemalloc.get_tracemalloc_memory(),
+            'snapshots': names,
+        }
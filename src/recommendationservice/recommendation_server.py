@@ -15,30 +15,46 @@
 # limitations under the License.
 
 import os
-import random
+import threading
 import time
 import traceback
 from concurrent import futures
 
-import googlecloudprofiler
-from google.auth.exceptions import DefaultCredentialsError
 import grpc
 
 import demo_pb2
 import demo_pb2_grpc
+from artifacts import ArtifactStore
+from catalog_cache import CatalogCache
+from debug_server import DebugServer, memory_handler, profiler_handler
+from exclusion import new_exclusion
+from health import HealthStatus, NOT_SERVING, SERVING
+from memory_tracer import MemoryTracer
+from sampling_profiler import SamplingProfiler
 from grpc_health.v1 import health_pb2
 from grpc_health.v1 import health_pb2_grpc
 
-from opentelemetry import trace
-from opentelemetry.instrumentation.grpc import GrpcInstrumentorClient, GrpcInstrumentorServer
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-
 from logger import getJSONLogger
 logger = getJSONLogger('recommendationservice-server')
 
+LIVENESS_SERVICE = 'liveness'
+# How often a streaming Watch checks whether its client went away.
+WATCH_POLL_SECONDS = 5
+# Threads that serve ListRecommendations, besides those held by watchers.
+SERVER_WORKERS = 10
+
+def startInBackground(target, name):
+  # Observability setup may retry or block on the network; keep it off the
+  # path to listening on the port.
+  thread = threading.Thread(target=target, name=name)
+  thread.daemon = True
+  thread.start()
+  return thread
+
 def initStackdriverProfiling():
+  # Loading the agent is slow, so only do it when the profiler is enabled.
+  import googlecloudprofiler
+
   project_id = None
   try:
     project_id = os.environ["GCP_PROJECT_ID"]
@@ -63,32 +79,117 @@ def initStackdriverProfiling():
         logger.warning("Could not initialize Stackdriver Profiler after retrying, giving up")
   return
 
+def instrumentGrpc():
+  # Interceptors cost something on every RPC, so they are only installed
+  # when tracing is enabled. This has to happen before any channel or
+  # server is created.
+  from opentelemetry.instrumentation.grpc import GrpcInstrumentorClient, GrpcInstrumentorServer
+
+  GrpcInstrumentorClient().instrument()
+  GrpcInstrumentorServer().instrument()
+
+def initTracing():
+  try:
+    # The SDK and exporter are only loaded when tracing is enabled.
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
+    # Head sampling: only this fraction of new traces is recorded and
+    # exported; incoming sampled traces are always continued.
+    sampling_ratio = float(os.getenv("TRACE_SAMPLING_RATIO", "1.0"))
+    trace.set_tracer_provider(TracerProvider(
+      sampler=ParentBased(TraceIdRatioBased(sampling_ratio))))
+    otel_endpoint = os.getenv("COLLECTOR_SERVICE_ADDR", "localhost:4317")
+    trace.get_tracer_provider().add_span_processor(
+      BatchSpanProcessor(
+          OTLPSpanExporter(
+          endpoint = otel_endpoint,
+          insecure = True
+        )
+      )
+    )
+    logger.info("Tracing enabled.")
+  except Exception as e:
+    logger.warn(f"Exception on Cloud Trace setup: {traceback.format_exc()}, tracing disabled.")
+
 class RecommendationService(demo_pb2_grpc.RecommendationServiceServicer):
+    def __init__(self, catalog, artifacts=None, status=None,
+                 exclusion_mode='set', exclusion_fp_rate=0.01, max_watchers=4):
+        self.catalog = catalog
+        self.artifacts = artifacts
+        # fail fast on a bad mode rather than on the first request
+        new_exclusion(exclusion_mode, 0, 1, exclusion_fp_rate)
+        self.exclusion_mode = exclusion_mode
+        self.exclusion_fp_rate = exclusion_fp_rate
+        self.status = status or HealthStatus(SERVING)
+        self.liveness = HealthStatus(SERVING)
+        # Every Watch stream holds a server thread for as long as it is open.
+        self.watchers = threading.BoundedSemaphore(max_watchers)
+
     def ListRecommendations(self, request, context):
         max_responses = 5
-        # fetch list of products from product catalog stub
-        cat_response = product_catalog_stub.ListProducts(demo_pb2.Empty())
-        product_ids = [x.id for x in cat_response.products]
-        filtered_products = list(set(product_ids)-set(request.product_ids))
-        num_products = len(filtered_products)
-        num_return = min(max_responses, num_products)
-        # sample list of indicies to return
-        indices = random.sample(range(num_products), num_return)
-        # fetch product ids from indices
-        prod_list = [filtered_products[i] for i in indices]
+        # fetch list of products from the resident catalog
+        catalog = self.catalog.get().store
+        excluded = new_exclusion(self.exclusion_mode, len(catalog),
+                                 len(request.product_ids) + max_responses,
+                                 self.exclusion_fp_rate)
+        for product_id in request.product_ids:
+            ordinal = catalog.ordinal(product_id)
+            if ordinal is not None:
+                excluded.add(ordinal)
+        # products that are often bought together with the cart go first
+        ordinals = self.related_products(catalog, request.product_ids, excluded, max_responses)
+        # sample the rest uniformly from what is left
+        ordinals += catalog.sample(max_responses - len(ordinals), excluded)
+        prod_list = [catalog.ids[i] for i in ordinals]
         logger.info("[Recv ListRecommendations] product_ids={}".format(prod_list))
         # build and return response
         response = demo_pb2.ListRecommendationsResponse()
         response.product_ids.extend(prod_list)
         return response
 
+    def related_products(self, catalog, product_ids, excluded, limit):
+        artifacts = self.artifacts.get() if self.artifacts else None
+        cooccurrence = artifacts.get('cooccurrence') if artifacts else None
+        if not cooccurrence:
+            return []
+        related = []
+        for product_id in product_ids:
+            for candidate in cooccurrence.get(product_id, ()):
+                ordinal = catalog.ordinal(candidate)
+                if ordinal is not None and ordinal not in excluded:
+                    excluded.add(ordinal)
+                    related.append(ordinal)
+                    if len(related) == limit:
+                        return related
+        return related
+
+    def health_status(self, service):
+        # The liveness probe only asks whether the process is up; everything
+        # else waits for the catalog to be warm.
+        return self.liveness if service == LIVENESS_SERVICE else self.status
+
     def Check(self, request, context):
         return health_pb2.HealthCheckResponse(
-            status=health_pb2.HealthCheckResponse.SERVING)
+            status=self.health_status(request.service).get())
 
     def Watch(self, request, context):
-        return health_pb2.HealthCheckResponse(
-            status=health_pb2.HealthCheckResponse.UNIMPLEMENTED)
+        if not self.watchers.acquire(blocking=False):
+            context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED,
+                          'too many health watchers, use Check')
+        try:
+            source = self.health_status(request.service)
+            status = None
+            while context.is_active():
+                current = source.wait(status, timeout=WATCH_POLL_SECONDS)
+                if current != status:
+                    status = current
+                    yield health_pb2.HealthCheckResponse(status=status)
+        finally:
+            self.watchers.release()
 
 
 if __name__ == "__main__":
@@ -99,44 +200,82 @@ if __name__ == "__main__":
         raise KeyError()
       else:
         logger.info("Profiler enabled.")
-        initStackdriverProfiling()
+        startInBackground(initStackdriverProfiling, "profiler-init")
     except KeyError:
         logger.info("Profiler disabled.")
 
     try:
-      grpc_client_instrumentor = GrpcInstrumentorClient()
-      grpc_client_instrumentor.instrument()
-      grpc_server_instrumentor = GrpcInstrumentorServer()
-      grpc_server_instrumentor.instrument()
       if os.environ["ENABLE_TRACING"] == "1":
-        trace.set_tracer_provider(TracerProvider())
-        otel_endpoint = os.getenv("COLLECTOR_SERVICE_ADDR", "localhost:4317")
-        trace.get_tracer_provider().add_span_processor(
-          BatchSpanProcessor(
-              OTLPSpanExporter(
-              endpoint = otel_endpoint,
-              insecure = True
-            )
-          )
-        )
-    except (KeyError, DefaultCredentialsError):
+        instrumentGrpc()
+        startInBackground(initTracing, "tracing-init")
+    except KeyError:
         logger.info("Tracing disabled.")
     except Exception as e:
         logger.warn(f"Exception on Cloud Trace setup: {traceback.format_exc()}, tracing disabled.") 
 
+    # Local sampling profiler and tracemalloc, controlled from the debug side
+    # port.
+    debug = None
+    debug_port = os.environ.get('DEBUG_PORT', '')
+    if debug_port:
+        profiler = SamplingProfiler(
+            'recommendationservice',
+            os.environ.get('PROFILER_OUTPUT_DIR', '/tmp/profiles'),
+            rate_hz=float(os.environ.get('PROFILER_SAMPLE_HZ', '100')),
+            flush_seconds=float(os.environ.get('PROFILER_FLUSH_SECONDS', '60')),
+            logger=logger)
+        debug = DebugServer(int(debug_port), logger,
+                            host=os.environ.get('DEBUG_BIND_ADDRESS', '127.0.0.1'))
+        debug.route('/debug/profiler', profiler_handler(profiler))
+        debug.route('/debug/memory', memory_handler(MemoryTracer(logger=logger)))
+        debug.start()
+        if os.environ.get('ENABLE_LOCAL_PROFILER') == "1":
+            # The output directory must be writable; with a read-only root
+            # filesystem point PROFILER_OUTPUT_DIR at a mounted volume.
+            try:
+                profiler.start()
+            except OSError as err:
+                logger.warning("local profiler not started: {}".format(err))
+
     port = os.environ.get('PORT', "8080")
     catalog_addr = os.environ.get('PRODUCT_CATALOG_SERVICE_ADDR', '')
     if catalog_addr == "":
         raise Exception('PRODUCT_CATALOG_SERVICE_ADDR environment variable not set')
     logger.info("product catalog address: " + catalog_addr)
-    channel = grpc.insecure_channel(catalog_addr)
-    product_catalog_stub = demo_pb2_grpc.ProductCatalogServiceStub(channel)
+    # The catalog is an internal service; don't cap ListProducts at gRPC's
+    # 4MB default so large catalogs can be loaded.
+    channel = grpc.insecure_channel(
+        catalog_addr, options=[('grpc.max_receive_message_length', -1)])
+    # report NOT_SERVING until the catalog is warm
+    status = HealthStatus(NOT_SERVING)
+    catalog = CatalogCache(
+        channel,
+        snapshot_path=os.environ.get('CATALOG_SNAPSHOT_PATH'),
+        refresh_interval=float(os.environ.get('CATALOG_REFRESH_INTERVAL', '60')),
+        health=status)
+    catalog.start()
+    artifacts = None
+    artifact_dir = os.environ.get('ARTIFACT_DIR', '')
+    if artifact_dir:
+        logger.info("watching recommendation artifacts in " + artifact_dir)
+        artifacts = ArtifactStore(
+            artifact_dir,
+            poll_interval=float(os.environ.get('ARTIFACT_POLL_INTERVAL', '30')))
+        artifacts.start()
+        if debug is not None:
+            debug.route('/debug/artifacts', lambda params: artifacts.stats())
 
-    # create gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    # create gRPC server, with a thread for each allowed watcher on top of
+    # those serving requests
+    max_watchers = int(os.environ.get('MAX_HEALTH_WATCHERS', '4'))
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=SERVER_WORKERS + max_watchers))
 
     # add class to gRPC server
-    service = RecommendationService()
+    service = RecommendationService(
+        catalog, artifacts, status,
+        exclusion_mode=os.environ.get('EXCLUSION_MODE', 'set'),
+        exclusion_fp_rate=float(os.environ.get('EXCLUSION_FP_RATE', '0.01')),
+        max_watchers=max_watchers)
     demo_pb2_grpc.add_RecommendationServiceServicer_to_server(service, server)
     health_pb2_grpc.add_HealthServicer_to_server(service, server)
 
@@ -150,4 +289,5 @@ if __name__ == "__main__":
          while True:
             time.sleep(10000)
     except KeyboardInterrupt:
+            status.set(NOT_SERVING)
             server.stop(0)
@@ -0,0 +1,56 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Deterministic synthetic product catalogs for benchmarks and load tests.
+# fake_catalog.py serves them over gRPC.
+
+import random
+import string
+
+import demo_pb2
+
+CATEGORIES = ['accessories', 'clothing', 'footwear', 'hair', 'beauty', 'decor',
+              'home', 'kitchen', 'vintage', 'cycling', 'gardening', 'music']
+WORDS = ['modern', 'classic', 'handmade', 'vintage', 'sleek', 'durable', 'soft',
+         'cotton', 'steel', 'wooden', 'ceramic', 'leather', 'compact', 'bold']
+
+
+def product_id(i):
+    # Ten uppercase alphanumerics, like the ids in products.json.
+    chars = string.ascii_uppercase + string.digits
+    out = []
+    for _ in range(10):
+        i, r = divmod(i, len(chars))
+        out.append(chars[r])
+    return ''.join(reversed(out))
+
+
+def generate_products(n, seed=0):
+    """Returns a ListProductsResponse with `n` products."""
+    rng = random.Random(seed)
+    response = demo_pb2.ListProductsResponse()
+    for i in range(n):
+        words = rng.sample(WORDS, 3)
+        response.products.add(
+            id=product_id(i),
+            name=' '.join(words).title(),
+            description='A {} {} item that goes with everything. Made to last and easy to {}.'.format(
+                words[0], words[1], rng.choice(['clean', 'carry', 'store', 'love'])),
+            picture='/static/img/products/{}.jpg'.format(product_id(i).lower()),
+            price_usd=demo_pb2.Money(
+                currency_code='USD', units=rng.randint(1, 500), nanos=rng.randrange(0, 10**9, 10**7)),
+            categories=rng.sample(CATEGORIES, rng.randint(1, 3)))
+    return response
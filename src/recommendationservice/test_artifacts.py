@@ -0,0 +1,109 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+
+from artifacts import MANIFEST, ArtifactStore
+
+COOC = json.dumps({"OLJCESPC7Z": ["66VCHSJNUP"]}).encode()
+
+
+def write_manifest(path, data=COOC):
+    os.makedirs(path, exist_ok=True)
+    manifest = {"schema": 1, "version": os.path.basename(path),
+                "files": {"cooc.json": {"kind": "cooccurrence",
+                                        "sha256": hashlib.sha256(data).hexdigest()}}}
+    with open(os.path.join(path, MANIFEST), "w") as f:
+        json.dump(manifest, f)
+
+
+def write_file(path, data):
+    with open(os.path.join(path, "cooc.json"), "wb") as f:
+        f.write(data)
+
+
+def publish(root, name, data=COOC):
+    path = os.path.join(root, name)
+    write_manifest(path, data)
+    write_file(path, data)
+    return path
+
+
+def test_loads_newest_version(tmp_path):
+    publish(str(tmp_path), "v1")
+    publish(str(tmp_path), "v2")
+    store = ArtifactStore(str(tmp_path))
+    assert store.poll()
+    assert store.get().version == "v2"
+    assert store.get().get("cooccurrence") == {"OLJCESPC7Z": ("66VCHSJNUP",)}
+    assert not store.poll()
+
+
+def test_missing_file_is_retried(tmp_path):
+    path = str(tmp_path / "v1")
+    write_manifest(path)
+    store = ArtifactStore(str(tmp_path))
+    assert not store.poll()
+    assert store.stats()["failures"] == 0
+
+    write_file(path, COOC)
+    assert store.poll()
+    assert store.get().version == "v1"
+
+
+def test_short_file_is_retried(tmp_path):
+    path = str(tmp_path / "v1")
+    write_manifest(path)
+    write_file(path, COOC[:5])
+    store = ArtifactStore(str(tmp_path))
+    assert not store.poll()
+    assert store.stats()["rejected"] == ["v1"]
+
+    write_file(path, COOC)
+    assert store.poll()
+    assert store.get().version == "v1"
+
+
+def test_invalid_version_keeps_previous(tmp_path):
+    publish(str(tmp_path), "v1")
+    store = ArtifactStore(str(tmp_path))
+    assert store.poll()
+
+    bad = json.dumps({"OLJCESPC7Z": "66VCHSJNUP"}).encode()
+    publish(str(tmp_path), "v2", bad)
+    assert not store.poll()
+    assert store.get().version == "v1"
+    stats = store.stats()
+    assert stats["failures"] == 1
+    assert stats["rejected"] == ["v2"]
+
+    # Unchanged, the rejected version is not read again.
+    assert not store.poll()
+    assert store.stats()["failures"] == 1
+
+
+def test_staging_directories_are_ignored(tmp_path):
+    publish(str(tmp_path), "v1")
+    publish(str(tmp_path), ".v2.tmp")
+    store = ArtifactStore(str(tmp_path))
+    assert store.poll()
+    assert store.get().version == "v1"
+
+    os.rename(str(tmp_path / ".v2.tmp"), str(tmp_path / "v2"))
+    assert store.poll()
+    assert store.get().name == "v2"
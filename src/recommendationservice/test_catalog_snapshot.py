@@ -0,0 +1,134 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import os
+
+import pytest
+
+import demo_pb2
+from catalog_cache import CatalogCache
+from catalog_snapshot import CatalogSnapshot, SnapshotError, write_snapshot
+from catalog_store import CompactCatalog
+
+DIGEST = hashlib.sha256(b"catalog").hexdigest()
+
+
+def make_products():
+    return [
+        demo_pb2.Product(id="OLJCESPC7Z", name="Sunglasses", categories=["accessories"],
+                         price_usd=demo_pb2.Money(currency_code="USD", units=19, nanos=990000000)),
+        demo_pb2.Product(id="66VCHSJNUP", name="Tank Top", categories=["clothing", "tops"],
+                         price_usd=demo_pb2.Money(currency_code="USD", units=18, nanos=990000000)),
+    ]
+
+
+class FakeChannel(object):
+    """Serves a fixed ListProducts response to CatalogCache."""
+
+    def __init__(self, products):
+        self.data = demo_pb2.ListProductsResponse(products=products).SerializeToString()
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None):
+        return lambda request: self.data
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "catalog.snap")
+    sections = {"a": b"x" * 5, "bb": b"", "ccc": bytes(range(17))}
+    write_snapshot(path, DIGEST, sections)
+    snapshot = CatalogSnapshot(path)
+    try:
+        assert snapshot.digest == DIGEST
+        assert {name: bytes(data) for name, data in snapshot.sections().items()} == sections
+    finally:
+        snapshot.close()
+
+
+def test_store_round_trip(tmp_path):
+    path = str(tmp_path / "catalog.snap")
+    store = CompactCatalog.from_products(make_products())
+    write_snapshot(path, DIGEST, store.to_sections())
+    snapshot = CatalogSnapshot(path)
+    loaded = CompactCatalog.from_sections(snapshot.sections())
+    assert len(loaded) == 2
+    for ordinal, product in enumerate(make_products()):
+        assert loaded.product(ordinal) == product
+    assert loaded.ordinal("66VCHSJNUP") == 1
+
+
+def test_bad_magic(tmp_path):
+    path = tmp_path / "catalog.snap"
+    write_snapshot(str(path), DIGEST, {"a": b"data"})
+    path.write_bytes(b"NOTSNAP\0" + path.read_bytes()[8:])
+    with pytest.raises(SnapshotError, match="bad magic"):
+        CatalogSnapshot(str(path))
+
+
+def test_checksum_mismatch(tmp_path):
+    path = tmp_path / "catalog.snap"
+    write_snapshot(str(path), DIGEST, {"a": b"data"})
+    data = bytearray(path.read_bytes())
+    data[-8] ^= 0xff
+    path.write_bytes(bytes(data))
+    with pytest.raises(SnapshotError, match="checksum mismatch"):
+        CatalogSnapshot(str(path))
+
+
+@pytest.mark.parametrize("keep, message", [
+    (10, "truncated header"),
+    (70, "truncated section table"),
+    (150, "section out of bounds"),
+])
+def test_truncated(tmp_path, keep, message):
+    path = tmp_path / "catalog.snap"
+    write_snapshot(str(path), DIGEST, {"a": b"x" * 64, "b": b"y" * 64})
+    path.write_bytes(path.read_bytes()[:keep])
+    with pytest.raises(SnapshotError, match=message):
+        CatalogSnapshot(str(path))
+
+
+def test_cache_writes_and_loads_snapshot(tmp_path):
+    path = str(tmp_path / "catalog.snap")
+    CatalogCache(FakeChannel(make_products()), snapshot_path=path).refresh()
+    assert os.path.exists(path)
+
+    cache = CatalogCache(FakeChannel([]), snapshot_path=path)
+    assert cache.load_snapshot()
+    assert len(cache.get().store) == 2
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda data: data[:70],
+    lambda data: b"garbage",
+])
+def test_cache_discards_corrupt_snapshot(tmp_path, corrupt):
+    path = tmp_path / "catalog.snap"
+    CatalogCache(FakeChannel(make_products()), snapshot_path=str(path)).refresh()
+    path.write_bytes(corrupt(path.read_bytes()))
+
+    cache = CatalogCache(FakeChannel([]), snapshot_path=str(path))
+    assert not cache.load_snapshot()
+    assert not path.exists()
+
+
+def test_cache_discards_snapshot_missing_sections(tmp_path):
+    path = tmp_path / "catalog.snap"
+    write_snapshot(str(path), DIGEST, {"ids": b""})
+
+    cache = CatalogCache(FakeChannel([]), snapshot_path=str(path))
+    assert not cache.load_snapshot()
+    assert not path.exists()
@@ -0,0 +1,109 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from debug_server import DebugServer, memory_handler, profiler_handler
+from memory_tracer import MemoryTracer
+from sampling_profiler import SamplingProfiler
+
+
+@pytest.fixture
+def server():
+    debug = DebugServer(0)
+    debug.start()
+    yield debug
+    debug.stop()
+
+
+def get(server, path):
+    try:
+        with urllib.request.urlopen('http://127.0.0.1:{}{}'.format(server.port, path)) as reply:
+            return reply.status, json.loads(reply.read())
+    except urllib.error.HTTPError as err:
+        return err.code, json.loads(err.read())
+
+
+def test_status_codes(server):
+    def fail(params):
+        raise RuntimeError('boom')
+    server.route('/echo', lambda params: params)
+    server.route('/bad', lambda params: int(params['n']))
+    server.route('/fail', fail)
+    assert get(server, '/echo?a=1&b=x') == (200, {'a': '1', 'b': 'x'})
+    assert get(server, '/bad?n=x')[0] == 400
+    assert get(server, '/fail') == (500, {'error': 'boom'})
+    code, body = get(server, '/missing')
+    assert code == 404 and body['routes'] == ['/bad', '/echo', '/fail']
+
+
+def test_profiler(server, tmp_path):
+    profiler = SamplingProfiler('test', str(tmp_path), rate_hz=200, flush_seconds=3600)
+    server.route('/debug/profiler', profiler_handler(profiler))
+    assert get(server, '/debug/profiler?action=start&rate_hz=5000')[0] == 400
+
+    stop = threading.Event()
+
+    def spin():
+        # Busy code for the sampler to find; idle waits are skipped.
+        while not stop.is_set():
+            sum(range(1000))
+    worker = threading.Thread(target=spin)
+    worker.start()
+    code, body = get(server, '/debug/profiler?action=start&rate_hz=500')
+    assert code == 200 and body['changed'] and body['running'] and body['rate_hz'] == 500
+    while profiler.samples < 20:
+        stop.wait(0.01)
+
+    first = get(server, '/debug/profiler?action=flush')[1]['path']
+    while profiler.samples < 40:
+        stop.wait(0.01)
+    second = get(server, '/debug/profiler?action=flush')[1]['path']
+    stop.set()
+    worker.join()
+    code, body = get(server, '/debug/profiler?action=stop')
+    assert code == 200 and body['changed'] and not body['running']
+
+    # Flushes within the same second don't overwrite each other.
+    assert first != second
+    assert os.path.basename(first).startswith('test-') and first.endswith('.collapsed')
+    with open(first) as f:
+        stack, count = f.readline().rsplit(' ', 1)
+    assert ';' in stack and int(count) > 0
+
+
+def test_memory(server):
+    tracer = MemoryTracer()
+    server.route('/debug/memory', memory_handler(tracer))
+    assert get(server, '/debug/memory?action=top')[0] == 400
+    assert get(server, '/debug/memory?action=start')[1]['tracing']
+    try:
+        assert get(server, '/debug/memory?action=snapshot&name=before')[0] == 200
+        blob = [bytearray(1024) for _ in range(1000)]
+        assert get(server, '/debug/memory?action=snapshot&name=after')[0] == 200
+        code, body = get(server, '/debug/memory?action=diff&old=before&new=after&limit=3')
+        assert code == 200 and body['snapshots'] == ['before', 'after']
+        assert sum(row['size_diff_bytes'] for row in body['diff']) >= len(blob) * 1024
+        assert get(server, '/debug/memory?action=top&key=bogus')[0] == 400
+        assert get(server, '/debug/memory?action=diff&old=nope&new=after')[0] == 400
+    finally:
+        tracer.stop()
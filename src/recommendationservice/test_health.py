@@ -0,0 +1,101 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import grpc
+import pytest
+from grpc_health.v1 import health_pb2
+
+import demo_pb2
+from catalog_cache import CatalogCache
+from health import HealthStatus, NOT_SERVING, SERVING
+from recommendation_server import LIVENESS_SERVICE, RecommendationService
+
+
+class FakeChannel(object):
+
+    def __init__(self, products):
+        self.data = demo_pb2.ListProductsResponse(products=products).SerializeToString()
+
+    def unary_unary(self, method, request_serializer=None, response_deserializer=None):
+        return lambda request: self.data
+
+
+class Aborted(Exception):
+    pass
+
+
+class FakeContext(object):
+
+    def __init__(self):
+        self.active = True
+
+    def is_active(self):
+        return self.active
+
+    def abort(self, code, details):
+        raise Aborted(code, details)
+
+
+def check(service, name=''):
+    return service.Check(health_pb2.HealthCheckRequest(service=name), FakeContext()).status
+
+
+def test_ready_once_catalog_is_warm(tmp_path):
+    status = HealthStatus(NOT_SERVING)
+    products = [demo_pb2.Product(id="OLJCESPC7Z")]
+    cache = CatalogCache(FakeChannel(products), snapshot_path=str(tmp_path / "snap"),
+                         health=status)
+    service = RecommendationService(cache, status=status)
+    assert check(service) == NOT_SERVING
+    assert check(service, LIVENESS_SERVICE) == SERVING
+
+    cache.refresh()
+    assert check(service) == SERVING
+
+    # A restart serves from the snapshot before the catalog is fetched.
+    status = HealthStatus(NOT_SERVING)
+    cache = CatalogCache(FakeChannel([]), snapshot_path=str(tmp_path / "snap"), health=status)
+    assert cache.load_snapshot()
+    assert check(RecommendationService(cache, status=status)) == SERVING
+
+
+def test_watch_streams_changes():
+    status = HealthStatus(NOT_SERVING)
+    service = RecommendationService(None, status=status)
+    context = FakeContext()
+    stream = service.Watch(health_pb2.HealthCheckRequest(), context)
+    assert next(stream).status == NOT_SERVING
+
+    threading.Timer(0.05, status.set, (SERVING,)).start()
+    assert next(stream).status == SERVING
+    context.active = False
+    stream.close()
+
+
+def test_watchers_are_bounded():
+    service = RecommendationService(None, status=HealthStatus(SERVING), max_watchers=1)
+    first = service.Watch(health_pb2.HealthCheckRequest(), FakeContext())
+    assert next(first).status == SERVING
+
+    with pytest.raises(Aborted) as aborted:
+        next(service.Watch(health_pb2.HealthCheckRequest(), FakeContext()))
+    assert aborted.value.args[0] == grpc.StatusCode.RESOURCE_EXHAUSTED
+
+    # Closing a stream gives its slot back.
+    first.close()
+    assert next(service.Watch(health_pb2.HealthCheckRequest(), FakeContext())).status == SERVING
@@ -0,0 +1,80 @@
+#!/usr/bin/python
+#
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+from histogram import LatencyHistogram, bucket_index, bucket_range
+
+VALUES = list(range(5000)) + [2 ** k + d for k in range(12, 40) for d in (-1, 0, 1)]
+
+
+def test_bucket_round_trip():
+    for value in VALUES:
+        low, high = bucket_range(bucket_index(value))
+        assert low <= value <= high
+        # Bucket width bounds the reporting error at 1/64.
+        assert high - low <= max(0, value // 64)
+
+
+def test_buckets_are_contiguous():
+    previous = -1
+    for index in range(bucket_index(2 ** 40)):
+        low, high = bucket_range(index)
+        assert low == previous + 1
+        assert bucket_index(low) == index and bucket_index(high) == index
+        previous = high
+
+
+def test_percentiles_are_exact_for_small_values():
+    h = LatencyHistogram()
+    for value in range(1, 101):
+        h.record(value)
+    assert h.percentile(0.5) == 50
+    assert h.percentile(0.99) == 99
+    assert h.percentile(1.0) == 100
+    assert h.summary()['min'] == 1
+
+
+def test_percentiles_are_bounded():
+    rng = random.Random(7)
+    values = sorted(int(rng.lognormvariate(8, 2)) for _ in range(10000))
+    h = LatencyHistogram()
+    for value in values:
+        h.record(value)
+    for q in (0.5, 0.9, 0.99, 0.999):
+        exact = values[max(1, round(q * len(values))) - 1]
+        reported = h.percentile(q)
+        # The upper bound of the exact value's bucket, capped at the max.
+        assert exact <= reported <= min(exact + exact // 64, values[-1])
+    assert h.percentile(1.0) == values[-1]
+
+
+def test_merge():
+    a, b, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for value in range(0, 100000, 7):
+        (a if value % 2 else b).record(value)
+        both.record(value)
+    a.merge(b)
+    assert a.counts == both.counts
+    assert (a.total, a.sum, a.min, a.max) == (both.total, both.sum, both.min, both.max)
+    assert a.summary() == both.summary()
+
+
+def test_empty():
+    h = LatencyHistogram()
+    assert h.percentile(0.99) == 0
+    assert h.summary()['count'] == 0
+    assert h.buckets() == []